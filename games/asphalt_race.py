@@ -15,7 +15,8 @@ Controls:
 
 from __future__ import annotations
 
-import random
+import math
+import numpy as np
 import pygame
 
 from games.base_game import Game
@@ -23,6 +24,29 @@ from games.sound import play_beep
 from games.sprite_store import get_sprite_store, draw_sprite
 
 
+# 2x2 car footprint (offsets from the top-left pixel) and checkered car colors.
+_CAR_DX = np.array([0, 1, 0, 1])
+_CAR_DY = np.array([0, 0, 1, 1])
+_TRAFFIC_CAR_COLORS = np.array([(255, 60, 60), (200, 20, 20), (200, 20, 20), (255, 60, 60)], dtype=np.uint8)
+_PLAYER_CAR_COLORS = np.array([(60, 200, 255), (20, 120, 200), (20, 120, 200), (60, 200, 255)], dtype=np.uint8)
+
+# Scene colors
+_SKY = (0, 0, 18)
+_GRASS = np.array((0, 40, 0), dtype=np.uint8)
+_ASPHALT = np.array((25, 25, 25), dtype=np.uint8)
+_EDGE = np.array((220, 220, 220), dtype=np.uint8)
+_DASH = np.array((255, 220, 80), dtype=np.uint8)
+
+# Lane-ish x offsets (from road center) for new traffic.
+_LANE_OFFSETS = np.array([-3, 0, 3])
+
+# Random draws are taken from NumPy in batches of this size.
+_RNG_BATCH = 1024
+
+# Max simultaneous traffic cars (far more than can fit on screen at once).
+_TRAFFIC_CAPACITY = 32
+
+
 class AsphaltRace(Game):
     def __init__(self, grid):
         super().__init__(grid)
@@ -54,11 +78,37 @@ class AsphaltRace(Game):
         self.distance = 0.0
         self.score = 0
 
-        # Traffic
-        self.traffic = []
+        # Traffic: fixed-capacity parallel arrays. Slots below _traffic_count are in
+        # use; cars that leave the screen are cleared in _traffic_alive and the
+        # arrays are only compacted once most of those slots are dead.
+        self._traffic_x = np.zeros(_TRAFFIC_CAPACITY)
+        self._traffic_y = np.zeros(_TRAFFIC_CAPACITY)
+        self._traffic_passed = np.zeros(_TRAFFIC_CAPACITY, dtype=bool)
+        self._traffic_alive = np.zeros(_TRAFFIC_CAPACITY, dtype=bool)
+        self._traffic_count = 0
         self._spawn_cd = 0.0
 
+        # Pre-drawn random streams for curve drift and spawn lanes.
+        self._rng = np.random.default_rng()
+        self._curve_jitter = self._rng.uniform(-0.7, 0.7, _RNG_BATCH)
+        self._curve_jitter_i = 0
+        self._lane_picks = _LANE_OFFSETS[self._rng.integers(0, len(_LANE_OFFSETS), _RNG_BATCH)]
+        self._lane_pick_i = 0
+
         self.crashed = False
+
+        # Per-row road geometry. The center LUT stays valid while curve is inside
+        # (_curve_lo, _curve_hi), i.e. until some row's rounded center would move.
+        self._lut_horizon = None
+        self._curve_cached = 0.0
+        self._curve_lo = 0.0
+        self._curve_hi = 0.0
+        self._road_t = np.zeros(self.grid.grid_size)
+        self._center_lut = np.zeros(self.grid.grid_size, dtype=np.int16)
+        self._hw_lut = np.zeros(self.grid.grid_size, dtype=np.int16)
+        # Grass/asphalt/edge rows below the horizon, rebuilt lazily with the LUTs.
+        self._road_layer = None
+
         self._reset()
 
     def _reset(self) -> None:
@@ -68,7 +118,7 @@ class AsphaltRace(Game):
         self.scroll = 0.0
         self.distance = 0.0
         self.score = 0
-        self.traffic = []
+        self._traffic_count = 0
         self._spawn_cd = 0.4
         self.crashed = False
 
@@ -76,19 +126,68 @@ class AsphaltRace(Game):
     def _road_half_width(self, y: int) -> int:
         """Half-road width at row y (perspective)."""
         y = max(0, min(self.grid.grid_size - 1, y))
-        # At horizon: narrow. At bottom: wide.
-        t = 0.0
-        if y > self.horizon_y:
-            t = (y - self.horizon_y) / max(1, (self.grid.grid_size - 1 - self.horizon_y))
-        # half-width from 3..8
-        return int(round(3 + 5 * t))
+        return int(self._road_luts()[1][y])
 
     def _road_center_at(self, y: int) -> int:
+        y = max(0, min(self.grid.grid_size - 1, y))
+        return int(self._road_luts()[0][y])
+
+    def _rebuild_road_luts(self) -> None:
+        """Recompute per-row road center/half-width for the current curve."""
+        if self._lut_horizon != self.horizon_y:
+            # Perspective depth: 0 at (and above) the horizon, 1 at the bottom row.
+            ys = np.arange(self.grid.grid_size)
+            span = max(1, (self.grid.grid_size - 1 - self.horizon_y))
+            t = np.maximum(0.0, (ys - self.horizon_y) / span)
+            self._road_t = t
+            # At horizon: narrow. At bottom: wide. Half-width from 3..8
+            self._hw_lut = np.rint(3 + 5 * t).astype(np.int16)
+            self._lut_horizon = self.horizon_y
+
         # Visual curve stronger near bottom.
-        if y <= self.horizon_y:
-            return self.road_center
-        t = (y - self.horizon_y) / max(1, (self.grid.grid_size - 1 - self.horizon_y))
-        return int(round(self.road_center + self.curve * t * t))
+        a = self._road_t * self._road_t
+        center = np.rint(self.road_center + self.curve * a)
+        self._center_lut = center.astype(np.int16)
+        self._curve_cached = self.curve
+        self._road_layer = None
+
+        # Range of curve values that round to the same centers on every row.
+        bent = a > 0
+        if bent.any():
+            a = a[bent]
+            base = center[bent] - self.road_center
+            self._curve_lo = float(np.max((base - 0.5) / a)) + 1e-9
+            self._curve_hi = float(np.min((base + 0.5) / a)) - 1e-9
+        else:
+            self._curve_lo = -math.inf
+            self._curve_hi = math.inf
+
+    def _road_luts(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return per-row (center, half_width) arrays, rebuilding them only when stale."""
+        curve = self.curve
+        if self._lut_horizon != self.horizon_y or (
+            curve != self._curve_cached and not (self._curve_lo < curve < self._curve_hi)
+        ):
+            self._rebuild_road_luts()
+        return self._center_lut, self._hw_lut
+
+    def _build_road_layer(self) -> np.ndarray:
+        """Grass, asphalt and edge lines for rows horizon_y..bottom."""
+        gs = self.grid.grid_size
+        h0 = self.horizon_y
+        center_lut, hw_lut = self._road_luts()
+        fb = np.empty((gs - h0, gs, 3), dtype=np.uint8)
+        fb[:] = _GRASS
+        for row, c, hw in zip(fb, center_lut[h0:].tolist(), hw_lut[h0:].tolist()):
+            left = c - hw
+            right = c + hw
+            row[max(0, left):max(0, right + 1)] = _ASPHALT
+            # road edge lines
+            if 0 <= left < gs:
+                row[left] = _EDGE
+            if 0 <= right < gs:
+                row[right] = _EDGE
+        return fb
 
     def _player_world_y(self) -> float:
         # Player is near the bottom.
@@ -97,52 +196,90 @@ class AsphaltRace(Game):
     def _player_pos(self) -> tuple[int, int]:
         py = int(self._player_world_y())
         cx = self._road_center_at(py)
-        px = int(round(cx + self.player_x))
+        px = math.floor(cx + self.player_x + 0.5)
         return (px, py)
 
+    def _compact_traffic(self) -> None:
+        """Pack live cars into the leading slots."""
+        n = self._traffic_count
+        alive = self._traffic_alive[:n].copy()
+        m = int(np.count_nonzero(alive))
+        for arr in (self._traffic_x, self._traffic_y, self._traffic_passed):
+            arr[:m] = arr[:n][alive]
+        self._traffic_alive[:m] = True
+        self._traffic_alive[m:n] = False
+        self._traffic_count = m
+
+    def _add_traffic(self, x: float, y: float) -> None:
+        """Append a traffic car (x offset from road center, screen y)."""
+        if self._traffic_count >= _TRAFFIC_CAPACITY:
+            self._compact_traffic()
+        n = self._traffic_count
+        if n >= _TRAFFIC_CAPACITY:
+            return
+        self._traffic_x[n] = x
+        self._traffic_y[n] = y
+        self._traffic_passed[n] = False
+        self._traffic_alive[n] = True
+        self._traffic_count = n + 1
+
     def _spawn_traffic(self) -> None:
         # Spawn near horizon; choose lane-ish offset.
         # Keep within road width at horizon.
         hw = self._road_half_width(self.horizon_y + 1)
-        lane_offsets = [-3, 0, 3]
-        ox = random.choice(lane_offsets)
+        ox = self._next_lane_offset()
         ox = max(-hw + 1, min(hw - 1, ox))
-        self.traffic.append({"x": float(ox), "y": float(self.horizon_y + 1), "passed": False})
+        self._add_traffic(float(ox), float(self.horizon_y + 1))
+
+    def _next_curve_jitter(self) -> float:
+        """Next value of the uniform(-0.7, 0.7) curve drift stream."""
+        i = self._curve_jitter_i
+        if i >= _RNG_BATCH:
+            self._curve_jitter = self._rng.uniform(-0.7, 0.7, _RNG_BATCH)
+            i = 0
+        self._curve_jitter_i = i + 1
+        return float(self._curve_jitter[i])
+
+    def _next_lane_offset(self) -> int:
+        """Next lane offset from the pre-drawn spawn stream."""
+        i = self._lane_pick_i
+        if i >= _RNG_BATCH:
+            self._lane_picks = _LANE_OFFSETS[self._rng.integers(0, len(_LANE_OFFSETS), _RNG_BATCH)]
+            i = 0
+        self._lane_pick_i = i + 1
+        return int(self._lane_picks[i])
 
     def _update_traffic(self, dt: float) -> None:
         # Traffic moves downward relative to the player.
-        for car in self.traffic:
-            car["y"] += self.speed * dt * 1.4
-
-        # Remove cars that leave the screen, award score if passed.
-        kept = []
-        for car in self.traffic:
-            if car["y"] > self.grid.grid_size + 1:
-                if car.get("passed"):
-                    self.score += 1
-                continue
-            kept.append(car)
-        self.traffic = kept
+        n = self._traffic_count
+        alive = self._traffic_alive[:n]
+        ys = self._traffic_y[:n]
+        ys[alive] += self.speed * dt * 1.4
+
+        # Retire cars that leave the screen, award score if passed.
+        gone = alive & (ys > self.grid.grid_size + 1)
+        if not gone.any():
+            return
+        self.score += int(np.count_nonzero(gone & self._traffic_passed[:n]))
+        alive &= ~gone
+        if np.count_nonzero(alive) * 2 < n:
+            self._compact_traffic()
 
     def _check_collision(self) -> bool:
         px, py = self._player_pos()
-        for car in self.traffic:
-            cy = int(round(car["y"]))
-            if abs(cy - py) > 1:
-                continue
-            # compute car screen x at this y
-            cx = self._road_center_at(cy) + int(round(car["x"]))
-            if abs(cx - px) <= 1:
-                return True
-        return False
+        n = self._traffic_count
+        cy = np.rint(self._traffic_y[:n]).astype(np.intp)
+        near = self._traffic_alive[:n] & (np.abs(cy - py) <= 1)
+        if not near.any():
+            return False
+        # compute car screen x at its row
+        center_lut, _ = self._road_luts()
+        cx = center_lut[cy[near]] + np.rint(self._traffic_x[:n][near]).astype(np.intp)
+        return bool((np.abs(cx - px) <= 1).any())
 
     def update(self, dt: float):
         # Remember dt for input integration (handle_input doesn't receive dt).
-        try:
-            self._last_dt = float(dt)
-        except Exception:
-            self._last_dt = 1 / 60
-        self._last_dt = max(1 / 240, min(1 / 15, self._last_dt))
+        self._last_dt = max(1 / 240, min(1 / 15, dt))
 
         if self.crashed:
             return
@@ -152,8 +289,9 @@ class AsphaltRace(Game):
         self.scroll += self.speed * dt
 
         # Gentle random curve changes
-        self.curve += random.uniform(-0.7, 0.7) * dt
+        self.curve += self._next_curve_jitter() * dt
         self.curve = max(-5.0, min(5.0, self.curve))
+        self._road_luts()
 
         # Spawn traffic (more frequent at higher speed)
         self._spawn_cd -= dt
@@ -165,10 +303,8 @@ class AsphaltRace(Game):
         self._update_traffic(dt)
 
         # Mark traffic as passed when it goes below player.
-        py = self._player_world_y()
-        for car in self.traffic:
-            if not car.get("passed") and car["y"] > py + 0.5:
-                car["passed"] = True
+        n = self._traffic_count
+        self._traffic_passed[:n] |= self._traffic_alive[:n] & (self._traffic_y[:n] > self._player_world_y() + 0.5)
 
         # Collision
         if self._check_collision():
@@ -177,49 +313,41 @@ class AsphaltRace(Game):
 
     def render(self):
         # Background sky
-        self.grid.clear((0, 0, 18))
-
-        # Draw road
-        for y in range(self.horizon_y, self.grid.grid_size):
-            center = self._road_center_at(y)
-            hw = self._road_half_width(y)
+        self.grid.clear(_SKY)
+
+        # Draw road: cached grass/asphalt/edge rows plus scrolling center dashes
+        gs = self.grid.grid_size
+        h0 = self.horizon_y
+        center_lut, _ = self._road_luts()
+        if self._road_layer is None:
+            self._road_layer = self._build_road_layer()
+        fb = self._road_layer.copy()
+
+        # center dashed line
+        ys = np.arange(h0, gs)
+        dashed = (ys > h0) & ((int(self.scroll * 6) + ys) % 4 == 0)
+        dash_x = center_lut[ys]
+        dashed &= (dash_x >= 0) & (dash_x < gs)
+        fb[(ys - h0)[dashed], dash_x[dashed]] = _DASH
+
+        self.grid.blit(fb, 0, h0)
+
+        # Draw traffic cars and the player car (2x2 each) in one batch
+        n = self._traffic_count
+        cy = np.rint(self._traffic_y[:n]).astype(np.intp)
+        visible = self._traffic_alive[:n] & (cy >= 0) & (cy < gs)
+        cy = cy[visible]
+        cx = center_lut[cy] + np.rint(self._traffic_x[:n][visible]).astype(np.intp)
+        n_traffic = len(cy)
 
-            # grass
-            for x in range(self.grid.grid_size):
-                if x < center - hw or x > center + hw:
-                    self.grid.set_pixel(x, y, (0, 40, 0))
-                else:
-                    self.grid.set_pixel(x, y, (25, 25, 25))
-
-            # road edge lines
-            self.grid.set_pixel(center - hw, y, (220, 220, 220))
-            self.grid.set_pixel(center + hw, y, (220, 220, 220))
-
-            # center dashed line
-            if y > self.horizon_y and (int(self.scroll * 6) + y) % 4 == 0:
-                self.grid.set_pixel(center, y, (255, 220, 80))
-
-        # Draw traffic cars (simple 2x2)
-        for car in self.traffic:
-            cy = int(round(car["y"]))
-            if cy < 0 or cy >= self.grid.grid_size:
-                continue
-            cx = self._road_center_at(cy) + int(round(car["x"]))
-            c1 = (255, 60, 60)
-            c2 = (200, 20, 20)
-            self.grid.set_pixel(cx, cy, c1)
-            self.grid.set_pixel(cx + 1, cy, c2)
-            self.grid.set_pixel(cx, cy + 1, c2)
-            self.grid.set_pixel(cx + 1, cy + 1, c1)
-
-        # Draw player car near bottom (2x2)
         px, py = self._player_pos()
-        p1 = (60, 200, 255)
-        p2 = (20, 120, 200)
-        self.grid.set_pixel(px, py, p1)
-        self.grid.set_pixel(px + 1, py, p2)
-        self.grid.set_pixel(px, py + 1, p2)
-        self.grid.set_pixel(px + 1, py + 1, p1)
+        anchors_x = np.append(cx, px)
+        anchors_y = np.append(cy, py)
+
+        xs = (anchors_x[:, None] + _CAR_DX).ravel()
+        ys = (anchors_y[:, None] + _CAR_DY).ravel()
+        colors = np.concatenate((np.tile(_TRAFFIC_CAR_COLORS, (n_traffic, 1)), _PLAYER_CAR_COLORS))
+        self.grid.set_pixels(xs, ys, colors)
 
         # HUD (user-editable sprites)
         sprite = self._sprite_store.get("hud_race_dist")
@@ -257,7 +385,7 @@ class AsphaltRace(Game):
         if not self.crashed:
             # dt is not passed to handle_input in this architecture, so we use
             # dt from update().
-            dt = getattr(self, "_last_dt", 1 / 60)
+            dt = self._last_dt
 
             steer = 0.0
             if keys[pygame.K_LEFT]:
@@ -2,16 +2,24 @@
 Base Game Class - Interface for all games
 """
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Tuple
+import colorsys
+import numpy as np
 import pygame
 
 
 class Game(ABC):
     """Abstract base class for all games"""
     
+    # Subclasses that don't declare __slots__ still get a __dict__
+    __slots__ = ("grid", "running", "_frame_key", "_frame")
+    
     def __init__(self, grid):
         self.grid = grid
         self.running = True
+        self._frame_key = None
+        self._frame = None
     
     @abstractmethod
     def update(self, dt: float):
@@ -36,6 +44,37 @@ class Game(ABC):
         """Exit the game"""
         self.running = False
 
+    def _frame_unchanged(self, key) -> bool:
+        """Check if the grid still shows the frame last remembered for key.
+
+        Screens that sit still between inputs call this at the top of
+        render() and skip drawing when it is True. Comparing the pixels as
+        well as the key catches another screen (e.g. an editor) having drawn
+        over the grid in the meantime.
+        """
+        return (
+            self._frame is not None
+            and key == self._frame_key
+            and np.array_equal(self.grid.pixels, self._frame)
+        )
+
+    def _restore_frame(self, key) -> bool:
+        """Copy the frame last remembered for key back onto the grid.
+
+        For full-screen overlays drawn over a grid that other code keeps
+        changing: instead of skipping the render, the saved frame is pasted
+        back. Returns False (and leaves the grid alone) for any other key.
+        """
+        if self._frame is None or key != self._frame_key:
+            return False
+        self.grid.pixels[:] = self._frame
+        return True
+
+    def _remember_frame(self, key):
+        """Record the frame just drawn for key (see _frame_unchanged, _restore_frame)"""
+        self._frame_key = key
+        self._frame = self.grid.pixels.copy()
+
 
 class GameState:
     """Enumeration of game states"""
@@ -88,13 +127,55 @@ class GameManager:
 
 
 # Utility functions for drawing shapes and patterns
+_OGRIDS = {}
+
+
+def _ogrid(size: int):
+    """Open (yy, xx) index grids for a size x size grid, built once per size"""
+    grids = _OGRIDS.get(size)
+    if grids is None:
+        grids = _OGRIDS[size] = np.ogrid[:size, :size]
+    return grids
+
+
 def draw_circle_pixels(grid, cx: int, cy: int, radius: int, color: Tuple[int, int, int]):
     """Draw a circle on the grid using pixel approximation"""
-    for y in range(grid.grid_size):
-        for x in range(grid.grid_size):
-            dist = ((x - cx) ** 2 + (y - cy) ** 2) ** 0.5
-            if dist <= radius:
-                grid.set_pixel(x, y, color)
+    if radius < 0:
+        return
+    yy, xx = _ogrid(grid.grid_size)
+    mask = np.less_equal((xx - cx) ** 2 + (yy - cy) ** 2, radius * radius)
+    ys, xs = np.nonzero(mask)
+    grid.set_pixels(xs, ys, color)
+
+
+# Left/right navigation arrows for screens that page through items: "<"
+# pointing at (1, 10) and ">" pointing at (17, 10), as (xs, ys)
+NAV_ARROWS = (
+    np.array([1, 2, 2, 3, 3, 17, 16, 16, 15, 15]),
+    np.array([10, 9, 11, 8, 12, 10, 9, 11, 8, 12]),
+)
+
+
+def bake_pixels(draw, *args):
+    """Run per-pixel drawing code once at (0, 0) and keep the pixels as arrays.
+
+    draw is called as draw(put, 0, 0, *args), where put(x, y, color) records
+    a pixel. Returns (xs, ys, colors) in drawing order, so set_pixels()
+    reproduces the overdraw of the original per-pixel calls.
+    """
+    xs, ys, colors = [], [], []
+
+    def put(x, y, color):
+        xs.append(x)
+        ys.append(y)
+        colors.append(color)
+
+    draw(put, 0, 0, *args)
+    return (
+        np.array(xs, dtype=np.intp),
+        np.array(ys, dtype=np.intp),
+        np.array(colors, dtype=np.uint8),
+    )
 
 
 def blend_colors(color1: Tuple[int, int, int], color2: Tuple[int, int, int], alpha: float) -> Tuple[int, int, int]:
@@ -106,8 +187,48 @@ def blend_colors(color1: Tuple[int, int, int], color2: Tuple[int, int, int], alp
     )
 
 
+@lru_cache(maxsize=4096)
+def _hsv_to_rgb(h: float, s: float, v: float) -> Tuple[int, int, int]:
+    r, g, b = colorsys.hsv_to_rgb(h / 360.0, s, v)
+    return (int(r * 255), int(g * 255), int(b * 255))
+
+
+# Fully saturated, full brightness colors for each whole degree of hue
+_FULL_HUES = tuple(_hsv_to_rgb(h, 1.0, 1.0) for h in range(360))
+# The same table as a (360, 3) uint8 array, for indexing with arrays of hues
+FULL_HUE_RGB = np.array(_FULL_HUES, dtype=np.uint8)
+
+
 def hsv_to_rgb(h: float, s: float, v: float) -> Tuple[int, int, int]:
     """Convert HSV color to RGB (h: 0-360, s: 0-1, v: 0-1)"""
-    import colorsys
-    r, g, b = colorsys.hsv_to_rgb(h / 360.0, s, v)
-    return (int(r * 255), int(g * 255), int(b * 255))
\ No newline at end of file
+    if s == 1.0 and v == 1.0 and 0 <= h < 360 and h == int(h):
+        return _FULL_HUES[int(h)]
+    return _hsv_to_rgb(h, s, v)
+
+
+def hsv_to_rgb_array(h, s: float, v: float) -> np.ndarray:
+    """Vectorized hsv_to_rgb over an array of hues (h: 0-360, s: 0-1, v: 0-1).
+
+    Returns a uint8 array with a trailing RGB axis, matching hsv_to_rgb()
+    element for element.
+    """
+    h6 = np.asarray(h, dtype=np.float64) / 360.0 * 6.0
+    i = h6.astype(np.int64)
+    f = h6 - i
+    p = np.full_like(f, v * (1.0 - s))
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    vv = np.full_like(f, v)
+    sector = (i % 6)[..., None]
+    rgb = np.select(
+        [sector == 0, sector == 1, sector == 2, sector == 3, sector == 4],
+        [
+            np.stack((vv, t, p), axis=-1),
+            np.stack((q, vv, p), axis=-1),
+            np.stack((p, vv, t), axis=-1),
+            np.stack((p, q, vv), axis=-1),
+            np.stack((t, p, vv), axis=-1),
+        ],
+        np.stack((vv, p, q), axis=-1),
+    )
+    return (rgb * 255).astype(np.uint8)
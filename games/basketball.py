@@ -4,11 +4,36 @@ Basketball Game - 2v2 with AI blocking, passing, and shooting
 import pygame
 import random
 import math
+import numpy as np
 from games.base_game import Game, hsv_to_rgb
 from games.sound import play_beep
 from games.sprite_store import get_sprite_store, draw_sprite
 
 
+# Starting spots per player index. Players 0-1 are team 1 (left), 2-3 team 2 (right).
+_START_X = (3.0, 3.0, 15.0, 15.0)
+_START_Y = (6.0, 12.0, 6.0, 12.0)
+_PLAYER_COLORS = np.array(
+    [(200, 30, 45), (150, 20, 35), (200, 200, 200), (180, 180, 180)], dtype=np.uint8
+)
+
+# What the ball is doing while ball_in_air
+_FLIGHT_IDLE = 0
+_FLIGHT_SHOT = 1
+_FLIGHT_PASS = 2
+
+# Court colors
+_FLOOR = (20, 50, 20)
+_LINE = np.array((255, 255, 255), dtype=np.uint8)
+_HOOP = np.array((255, 100, 0), dtype=np.uint8)
+_BALL = np.array([(255, 140, 0)], dtype=np.uint8)
+_BALL_IN_AIR = np.array([(255, 200, 100)], dtype=np.uint8)
+
+# Spatial hash cells are 4x4 court units; proximity queries (radius <= 3)
+# only need the player's own cell and its 8 neighbours.
+_CELL_SHIFT = 2
+
+
 class Basketball(Game):
     """2v2 Basketball game with advanced AI"""
     
@@ -21,18 +46,14 @@ class Basketball(Game):
         self.court_width = self.grid.grid_size
         self.court_height = self.grid.grid_size
         
-        # Players (x, y, team, has_ball)
+        # Players as parallel arrays indexed 0-3 (teammates are 0/1 and 2/3)
         # Team 1 (left side) - Red/Miami Heat colors
-        self.team1 = [
-            {"x": 3.0, "y": 6.0, "team": 1, "color": (200, 30, 45)},
-            {"x": 3.0, "y": 12.0, "team": 1, "color": (150, 20, 35)}
-        ]
-        
         # Team 2 (right side) - White/opposing team
-        self.team2 = [
-            {"x": 15.0, "y": 6.0, "team": 2, "color": (200, 200, 200)},
-            {"x": 15.0, "y": 12.0, "team": 2, "color": (180, 180, 180)}
-        ]
+        self.num_players = 4
+        self.px = np.array(_START_X)
+        self.py = np.array(_START_Y)
+        self.team = np.array([1, 1, 2, 2], dtype=np.int8)
+        self.color = _PLAYER_COLORS.copy()
         
         # Ball
         self.ball_x = self.grid.grid_size / 2
@@ -46,6 +67,11 @@ class Basketball(Game):
         self.ball_arc_progress = 0
         self.ball_arc_start = (0, 0)
         self.ball_arc_end = (0, 0)
+        # Arc delta (end - start), fixed when the ball is released
+        self._arc_dx = 0.0
+        self._arc_dy = 0.0
+        self._flight_kind = _FLIGHT_IDLE
+        self.pass_target = None
         # Arc timings
         self.shot_arc_duration = 0.9
         self.pass_arc_duration = 0.55
@@ -53,8 +79,12 @@ class Basketball(Game):
 
         # Dribble
         self._t = 0.0
-        self._last_positions = {0: (3.0, 6.0), 1: (3.0, 12.0), 2: (15.0, 6.0), 3: (15.0, 12.0)}
-        self._moving = {0: False, 1: False, 2: False, 3: False}
+        self._last_px = self.px.copy()
+        self._last_py = self.py.copy()
+        self._moving = np.zeros(self.num_players, dtype=bool)
+
+        # Spatial hash of player indices, rebuilt at the start of each AI tick
+        self._cells = {}
 
         # Aiming (controlled player only)
         self.aim_offset_y = 0  # -1,0,1 => top/center/bottom hoop segment
@@ -78,7 +108,7 @@ class Basketball(Game):
         self.winner = None
         
         # Player control
-        self.controlled_player = 0  # Player 1 controls team1[0]
+        self.controlled_player = 0  # Player 1 controls team 1's first player
         
         # AI settings
         self.ai_update_timer = 0
@@ -91,19 +121,18 @@ class Basketball(Game):
         
         # Start with team 1 having the ball
         self.ball_holder = 0
-        
+
     def update(self, dt: float):
         """Update game state"""
         # Store dt for movement code in handle_input (called after update in main loop).
         self._dt_last = dt
         self._t += dt
         # Track per-player movement (for steals + dribble feel)
-        for idx, p in self.get_all_players():
-            last = self._last_positions.get(idx, (p["x"], p["y"]))
-            dx = p["x"] - last[0]
-            dy = p["y"] - last[1]
-            self._moving[idx] = (dx * dx + dy * dy) > (0.08 * 0.08)
-            self._last_positions[idx] = (p["x"], p["y"])
+        dx = self.px - self._last_px
+        dy = self.py - self._last_py
+        self._moving = (dx * dx + dy * dy) > (0.08 * 0.08)
+        self._last_px[:] = self.px
+        self._last_py[:] = self.py
         if self.score_animation_timer > 0:
             self.score_animation_timer -= dt
             if self.score_animation_timer <= 0:
@@ -129,8 +158,8 @@ class Basketball(Game):
             else:
                 # Calculate arc position
                 t = self.ball_arc_progress
-                self.ball_x = self.ball_arc_start[0] + (self.ball_arc_end[0] - self.ball_arc_start[0]) * t
-                self.ball_y = self.ball_arc_start[1] + (self.ball_arc_end[1] - self.ball_arc_start[1]) * t
+                self.ball_x = self.ball_arc_start[0] + self._arc_dx * t
+                self.ball_y = self.ball_arc_start[1] + self._arc_dy * t
         
         # Update AI
         self.ai_update_timer += dt
@@ -140,33 +169,26 @@ class Basketball(Game):
         
         # Update ball position if held (with dribble animation)
         if self.ball_holder is not None and not self.ball_in_air:
-            player = self.get_player(self.ball_holder)
-            self.ball_x = player["x"]
-            self.ball_y = player["y"]
+            holder = self.ball_holder
+            self.ball_x = float(self.px[holder])
+            self.ball_y = float(self.py[holder])
 
             # Simple dribble bounce: alternate ball between feet and slightly forward.
             if self.game_started and not self.game_over:
                 phase = (self._t * 6.0) % 1.0
-                bx = int(player["x"])
-                by = int(player["y"])
+                bx = int(self.px[holder])
+                by = int(self.py[holder])
                 if phase < 0.5:
                     by = min(self.court_height - 1, by + 1)
                 else:
-                    bx = min(self.court_width - 1, bx + (1 if player["team"] == 1 else -1))
+                    bx = min(self.court_width - 1, bx + (1 if self.team[holder] == 1 else -1))
                 self.ball_x = float(bx)
                 self.ball_y = float(by)
     
     def reset_positions(self):
         """Reset player and ball positions"""
-        self.team1[0]["x"] = 3.0
-        self.team1[0]["y"] = 6.0
-        self.team1[1]["x"] = 3.0
-        self.team1[1]["y"] = 12.0
-        
-        self.team2[0]["x"] = 15.0
-        self.team2[0]["y"] = 6.0
-        self.team2[1]["x"] = 15.0
-        self.team2[1]["y"] = 12.0
+        self.px[:] = _START_X
+        self.py[:] = _START_Y
         
         self.ball_x = self.grid.grid_size / 2
         self.ball_y = self.grid.grid_size / 2
@@ -182,171 +204,187 @@ class Basketball(Game):
         
         self.ball_in_air = False
     
-    def get_player(self, index):
-        """Get player by index (0-3)"""
-        if index < 2:
-            return self.team1[index]
-        else:
-            return self.team2[index - 2]
-    
-    def get_all_players(self):
-        """Get all players with their indices"""
-        return [(0, self.team1[0]), (1, self.team1[1]), (2, self.team2[0]), (3, self.team2[1])]
+    @staticmethod
+    def teammate_of(index):
+        """Index of the other player on the same team (pairs are 0/1 and 2/3)"""
+        return index ^ 1
     
+    def _rebuild_cells(self):
+        """Bucket players by (x >> 2, y >> 2) cell for neighbour queries"""
+        cells = {}
+        cxs = self.px.astype(np.intp) >> _CELL_SHIFT
+        cys = self.py.astype(np.intp) >> _CELL_SHIFT
+        for idx, key in enumerate(zip(cxs.tolist(), cys.tolist())):
+            cells.setdefault(key, []).append(idx)
+        self._cells = cells
+
+    def _nearby(self, idx):
+        """Players (other than idx) in idx's hash cell or the 8 around it"""
+        cx = int(self.px[idx]) >> _CELL_SHIFT
+        cy = int(self.py[idx]) >> _CELL_SHIFT
+        for ny in (cy - 1, cy, cy + 1):
+            for nx in (cx - 1, cx, cx + 1):
+                for other in self._cells.get((nx, ny), ()):
+                    if other != idx:
+                        yield other
+
     def update_ai(self, dt: float):
         """Update AI for non-controlled players"""
-        for idx, player in self.get_all_players():
+        # AI steps are well under a unit per tick, so cells built here stay
+        # valid for the radius-3 queries made while the AI players move.
+        self._rebuild_cells()
+        for idx in range(self.num_players):
             if idx == self.controlled_player:
                 continue
             
             # AI behavior depends on ball possession
             if self.ball_holder == idx:
                 # AI has the ball - decide to shoot or pass
-                self.ai_with_ball(idx, player, dt)
+                self.ai_with_ball(idx, dt)
             elif self.ball_holder is None:
                 # No one has ball - chase it
-                self.ai_chase_ball(idx, player, dt)
-            elif self.get_player(self.ball_holder)["team"] == player["team"]:
+                self.ai_chase_ball(idx, dt)
+            elif self.team[self.ball_holder] == self.team[idx]:
                 # Teammate has ball - position for pass
-                self.ai_position_offense(idx, player, dt)
+                self.ai_position_offense(idx, dt)
             else:
                 # Opponent has ball - defend/block
-                self.ai_defend(idx, player, dt)
+                self.ai_defend(idx, dt)
     
-    def ai_with_ball(self, idx, player, dt: float):
+    def ai_with_ball(self, idx, dt: float):
         """AI behavior when holding the ball"""
         # Determine target hoop
-        target_hoop_x = self.right_hoop_x if player["team"] == 1 else self.left_hoop_x
-        target_hoop_y = self.right_hoop_y if player["team"] == 1 else self.left_hoop_y
+        target_hoop_x = self.right_hoop_x if self.team[idx] == 1 else self.left_hoop_x
+        target_hoop_y = self.right_hoop_y if self.team[idx] == 1 else self.left_hoop_y
         
-        dist_to_hoop = math.sqrt((player["x"] - target_hoop_x)**2 + (player["y"] - target_hoop_y)**2)
+        # Distances below are compared squared (3**2, 6**2) to skip the sqrt
+        d2_to_hoop = (self.px[idx] - target_hoop_x)**2 + (self.py[idx] - target_hoop_y)**2
         
         # Check if opponent is close (blocking)
         opponent_close = False
-        for oidx, opponent in self.get_all_players():
-            if opponent["team"] != player["team"]:
-                dist = math.sqrt((player["x"] - opponent["x"])**2 + (player["y"] - opponent["y"])**2)
-                if dist < 3:
+        for oidx in self._nearby(idx):
+            if self.team[oidx] != self.team[idx]:
+                d2 = (self.px[idx] - self.px[oidx])**2 + (self.py[idx] - self.py[oidx])**2
+                if d2 < 9:
                     opponent_close = True
                     break
         
         # Decision making
-        if dist_to_hoop < 6 and not opponent_close:
+        if d2_to_hoop < 36 and not opponent_close:
             # Close enough to shoot
             self.shoot(idx, target_hoop_x, target_hoop_y)
         elif opponent_close:
             # Pass to teammate
-            self.ai_pass(idx, player)
+            self.ai_pass(idx)
         else:
             # Move towards hoop
-            self.ai_move_towards(player, target_hoop_x, target_hoop_y, dt, speed_per_s=self.ai_move_speed)
+            self.ai_move_towards(idx, target_hoop_x, target_hoop_y, dt, speed_per_s=self.ai_move_speed)
     
-    def ai_pass(self, idx, player):
+    def ai_pass(self, idx):
         """AI passes to teammate"""
-        # Find teammate
-        for tidx, teammate in self.get_all_players():
-            if teammate["team"] == player["team"] and tidx != idx:
-                self.pass_ball(idx, tidx)
-                break
+        self.pass_ball(idx, self.teammate_of(idx))
     
-    def ai_chase_ball(self, idx, player, dt: float):
+    def ai_chase_ball(self, idx, dt: float):
         """AI chases loose ball"""
-        self.ai_move_towards(player, self.ball_x, self.ball_y, dt, speed_per_s=self.ai_move_speed * 1.05)
+        self.ai_move_towards(idx, self.ball_x, self.ball_y, dt, speed_per_s=self.ai_move_speed * 1.05)
         
         # Pick up ball if close
-        dist = math.sqrt((player["x"] - self.ball_x)**2 + (player["y"] - self.ball_y)**2)
-        if dist < 1.5:
+        d2 = (self.px[idx] - self.ball_x)**2 + (self.py[idx] - self.ball_y)**2
+        if d2 < 1.5 * 1.5:
             self.ball_holder = idx
     
-    def ai_position_offense(self, idx, player, dt: float):
+    def ai_position_offense(self, idx, dt: float):
         """AI positions for receiving pass"""
         # Move towards opponent's hoop but stay spread out
-        target_x = 12 if player["team"] == 1 else 6
+        target_x = 12 if self.team[idx] == 1 else 6
         target_y = 9 if idx % 2 == 0 else 14
-        self.ai_move_towards(player, target_x, target_y, dt, speed_per_s=self.ai_move_speed * 0.85)
+        self.ai_move_towards(idx, target_x, target_y, dt, speed_per_s=self.ai_move_speed * 0.85)
     
-    def ai_defend(self, idx, player, dt: float):
+    def ai_defend(self, idx, dt: float):
         """AI defends against ball carrier"""
         if self.ball_holder is not None:
-            ball_carrier = self.get_player(self.ball_holder)
+            carrier_idx = self.ball_holder
             # Move towards ball carrier to block
-            self.ai_move_towards(player, ball_carrier["x"], ball_carrier["y"], dt, speed_per_s=self.ai_move_speed)
+            self.ai_move_towards(idx, self.px[carrier_idx], self.py[carrier_idx], dt, speed_per_s=self.ai_move_speed)
             
             # Attempt steal if very close
-            dist = math.sqrt((player["x"] - ball_carrier["x"])**2 + (player["y"] - ball_carrier["y"])**2)
+            d2 = (self.px[idx] - self.px[carrier_idx])**2 + (self.py[idx] - self.py[carrier_idx])**2
             # Steals are less likely if the carrier is moving (dribbling) and more likely if stationary.
-            carrier_idx = self.ball_holder
-            carrier_moving = self._moving.get(carrier_idx, False)
+            carrier_moving = self._moving[carrier_idx]
             steal_p = 0.05 if carrier_moving else 0.09
-            if dist < 1.5 and random.random() < steal_p:
+            if d2 < 1.5 * 1.5 and random.random() < steal_p:
                 # Steal!
                 self.ball_holder = idx
                 play_beep(320, 25)
     
-    def ai_move_towards(self, player, target_x, target_y, dt: float, speed_per_s: float = 3.2):
+    def ai_move_towards(self, idx, target_x, target_y, dt: float, speed_per_s: float = 3.2):
         """Move player towards target"""
-        dx = target_x - player["x"]
-        dy = target_y - player["y"]
-        dist = math.sqrt(dx**2 + dy**2)
+        x = float(self.px[idx])
+        y = float(self.py[idx])
+        dx = target_x - x
+        dy = target_y - y
+        d2 = dx * dx + dy * dy
         
-        if dist > 0.5:
+        if d2 > 0.5 * 0.5:
             step = max(0.0, float(dt)) * float(speed_per_s)
-            player["x"] += (dx / dist) * step
-            player["y"] += (dy / dist) * step
+            # Normalize and scale in one multiply
+            scale = step / math.sqrt(d2)
+            x += dx * scale
+            y += dy * scale
             
             # Keep in bounds
-            player["x"] = max(1, min(self.court_width - 2, player["x"]))
-            player["y"] = max(1, min(self.court_height - 2, player["y"]))
+            self.px[idx] = max(1, min(self.court_width - 2, x))
+            self.py[idx] = max(1, min(self.court_height - 2, y))
     
     def shoot(self, player_idx, target_x, target_y):
         """Player shoots at hoop"""
-        player = self.get_player(player_idx)
-        self.ball_arc_start = (player["x"], player["y"])
+        self.ball_arc_start = (float(self.px[player_idx]), float(self.py[player_idx]))
         # Apply aim offset (controlled player only)
         if player_idx == self.controlled_player:
             target_y = max(1, min(self.court_height - 2, target_y + int(self.aim_offset_y)))
         self.ball_arc_end = (target_x, target_y)
+        self._set_arc_delta()
         self.ball_arc_progress = 0
         self.ball_arc_duration = self.shot_arc_duration
         self.ball_in_air = True
         self.ball_holder = None
         self.shooter = player_idx
+        self._flight_kind = _FLIGHT_SHOT
         play_beep(740, 30)
     
     def pass_ball(self, from_idx, to_idx):
         """Pass ball between players"""
-        from_player = self.get_player(from_idx)
-        to_player = self.get_player(to_idx)
-        
-        self.ball_arc_start = (from_player["x"], from_player["y"])
-        self.ball_arc_end = (to_player["x"], to_player["y"])
+        self.ball_arc_start = (float(self.px[from_idx]), float(self.py[from_idx]))
+        self.ball_arc_end = (float(self.px[to_idx]), float(self.py[to_idx]))
+        self._set_arc_delta()
         self.ball_arc_progress = 0
         self.ball_arc_duration = self.pass_arc_duration
         self.ball_in_air = True
         self.ball_holder = None
         self.pass_target = to_idx
+        self._flight_kind = _FLIGHT_PASS
         play_beep(520, 25)
 
+    def _set_arc_delta(self):
+        """Cache end - start of the current ball arc for the per-frame lerp"""
+        self._arc_dx = self.ball_arc_end[0] - self.ball_arc_start[0]
+        self._arc_dy = self.ball_arc_end[1] - self.ball_arc_start[1]
+
     def _shot_probability(self, shooter_idx: int, target_x: int, target_y: int) -> float:
         """Compute shot success probability based on distance + defense pressure."""
-        shooter = self.get_player(shooter_idx)
-        dist = math.sqrt((shooter["x"] - target_x) ** 2 + (shooter["y"] - target_y) ** 2)
+        dist = math.sqrt((self.px[shooter_idx] - target_x) ** 2 + (self.py[shooter_idx] - target_y) ** 2)
 
         # Defense pressure based on closest opponent to target point.
-        closest = 999.0
-        for _, opp in self.get_all_players():
-            if opp["team"] == shooter["team"]:
-                continue
-            d = math.sqrt((opp["x"] - target_x) ** 2 + (opp["y"] - target_y) ** 2)
-            closest = min(closest, d)
+        opponents = self.team != self.team[shooter_idx]
+        closest2 = float(((self.px[opponents] - target_x) ** 2 + (self.py[opponents] - target_y) ** 2).min())
 
         pressure = 0.0
-        if closest < 2.0:
+        if closest2 < 2.0 * 2.0:
             pressure = 0.28
-        elif closest < 3.0:
+        elif closest2 < 3.0 * 3.0:
             pressure = 0.14
 
-        moving_penalty = 0.08 if self._moving.get(shooter_idx, False) else 0.0
+        moving_penalty = 0.08 if self._moving[shooter_idx] else 0.0
 
         # Base probability decreases with distance.
         p = 0.88 - 0.06 * dist - pressure - moving_penalty
@@ -355,24 +393,28 @@ class Basketball(Game):
     def check_shot(self):
         """Check if shot scores"""
         # Check if pass - give ball to target
-        if hasattr(self, 'pass_target'):
+        flight_kind = self._flight_kind
+        self._flight_kind = _FLIGHT_IDLE
+        if flight_kind == _FLIGHT_PASS:
             self.ball_holder = self.pass_target
-            delattr(self, 'pass_target')
+            self.pass_target = None
             self.ball_arc_duration = 0.5
             return
         
         # Check if shot scores
-        shooter = self.get_player(self.shooter)
-        target_hoop_x = self.right_hoop_x if shooter["team"] == 1 else self.left_hoop_x
-        target_hoop_y = self.right_hoop_y if shooter["team"] == 1 else self.left_hoop_y
+        shooter_team = self.team[self.shooter]
+        target_hoop_x = self.right_hoop_x if shooter_team == 1 else self.left_hoop_x
+        target_hoop_y = self.right_hoop_y if shooter_team == 1 else self.left_hoop_y
         
         # Hoop has 3 segments (y-1,y,y+1)
-        on_rim = int(round(self.ball_x)) == int(target_hoop_x) and abs(int(round(self.ball_y)) - int(target_hoop_y)) <= 1
-        p = self._shot_probability(self.shooter, int(target_hoop_x), int(round(self.ball_y)))
+        ball_col = math.floor(self.ball_x + 0.5)
+        ball_row = math.floor(self.ball_y + 0.5)
+        on_rim = ball_col == int(target_hoop_x) and abs(ball_row - int(target_hoop_y)) <= 1
+        p = self._shot_probability(self.shooter, int(target_hoop_x), ball_row)
 
         # Score with probability p if shot landed on rim.
         if on_rim and random.random() < p:
-            if shooter["team"] == 1:
+            if shooter_team == 1:
                 self.team1_score += 2
                 self.scoring_team = 1
             else:
@@ -396,8 +438,6 @@ class Basketball(Game):
     
     def render(self):
         """Render the basketball game"""
-        self.grid.clear((20, 50, 20))  # Green court
-        
         if self.score_animation_timer > 0:
             self._render_score_animation()
             return
@@ -406,38 +446,28 @@ class Basketball(Game):
             self._render_game_over()
             return
         
-        # Draw court lines
-        # Center line
-        for y in range(self.court_height):
-            self.grid.set_pixel(self.court_width // 2, y, (255, 255, 255))
-        
-        # Hoops
-        self.grid.set_pixel(self.left_hoop_x, self.left_hoop_y, (255, 100, 0))
-        self.grid.set_pixel(self.left_hoop_x, self.left_hoop_y - 1, (255, 100, 0))
-        self.grid.set_pixel(self.left_hoop_x, self.left_hoop_y + 1, (255, 100, 0))
-        
-        self.grid.set_pixel(self.right_hoop_x, self.right_hoop_y, (255, 100, 0))
-        self.grid.set_pixel(self.right_hoop_x, self.right_hoop_y - 1, (255, 100, 0))
-        self.grid.set_pixel(self.right_hoop_x, self.right_hoop_y + 1, (255, 100, 0))
-        
-        # Draw players
-        for idx, player in self.get_all_players():
-            color = player["color"]
-            px, py = int(player["x"]), int(player["y"])
-            
-            # Highlight controlled player
-            if idx == self.controlled_player:
-                # Brighter color
-                color = tuple(min(255, c + 50) for c in color)
-            
-            self.grid.set_pixel(px, py, color)
-        
-        # Draw ball
-        if not self.ball_in_air or True:  # Always show ball
-            bx, by = int(self.ball_x), int(self.ball_y)
-            ball_color = (255, 140, 0) if not self.ball_in_air else (255, 200, 100)
-            if 0 <= bx < self.court_width and 0 <= by < self.court_height:
-                self.grid.set_pixel(bx, by, ball_color)
+        self.grid.clear(_FLOOR)  # Green court
+
+        # Court center line and 3-pixel hoops as column slices
+        pixels = self.grid.pixels
+        pixels[:self.court_height, self.court_width // 2] = _LINE
+        pixels[self.left_hoop_y - 1:self.left_hoop_y + 2, self.left_hoop_x] = _HOOP
+        pixels[self.right_hoop_y - 1:self.right_hoop_y + 2, self.right_hoop_x] = _HOOP
+
+        # Players and ball go out as one batch
+        player_colors = self.color.copy()
+        # Highlight controlled player with a brighter color
+        cp = self.controlled_player
+        player_colors[cp] = np.minimum(255, self.color[cp].astype(np.int16) + 50)
+        
+        # Ball (always shown; lighter while in the air)
+        ball_color = _BALL_IN_AIR if self.ball_in_air else _BALL
+
+        self.grid.set_pixels(
+            np.append(self.px.astype(np.intp), int(self.ball_x)),
+            np.append(self.py.astype(np.intp), int(self.ball_y)),
+            np.concatenate((player_colors, ball_color)),
+        )
         
         # Draw scoreboard (cleaner HUD: icons + pips)
         s1 = self._sprite_store.get("hud_bball_t1")
@@ -452,22 +482,28 @@ class Basketball(Game):
         else:
             self.grid.set_pixel(self.court_width - 1, 0, (220, 220, 220))
 
-        # Pips for score (2 points per pip)
+        # Pips for score (2 points per pip), drawn over the HUD icons
         pips1 = max(0, min(6, self.team1_score // 2))
         pips2 = max(0, min(6, self.team2_score // 2))
-        for i in range(pips1):
-            self.grid.set_pixel(1 + i, 1, (255, 220, 80))
-        for i in range(pips2):
-            self.grid.set_pixel(self.court_width - 2 - i, 1, (255, 220, 80))
+        xs = [1 + i for i in range(pips1)] + [self.court_width - 2 - i for i in range(pips2)]
+        ys = [1] * len(xs)
+        colors = [(255, 220, 80)] * len(xs)
 
         # Aim indicator (controlled player only while holding ball)
         if self.ball_holder == self.controlled_player and not self.ball_in_air:
             aim_y = max(1, min(self.court_height - 2, self.right_hoop_y + int(self.aim_offset_y)))
-            self.grid.set_pixel(self.right_hoop_x - 1, aim_y, (0, 255, 255))
+            xs.append(self.right_hoop_x - 1)
+            ys.append(aim_y)
+            colors.append((0, 255, 255))
+
+        self.grid.set_pixels(xs, ys, colors)
     
     def _render_score_animation(self):
         """Render scoring animation"""
         flash = int(self.score_animation_timer * 8) % 2
+        key = ("score", self.scoring_team, flash, self.team1_score, self.team2_score)
+        if self._restore_frame(key):
+            return
         
         if self.scoring_team == 1:
             color = (200, 30, 45) if flash else (100, 15, 22)
@@ -479,9 +515,14 @@ class Basketball(Game):
         # Show scores larger
         self.grid.render_number(self.team1_score, 3, 8, (255, 255, 255), scale=2)
         self.grid.render_number(self.team2_score, 11, 8, (255, 255, 255), scale=2)
+        self._remember_frame(key)
     
     def _render_game_over(self):
         """Render game over screen"""
+        key = ("game_over", self.winner)
+        if self._restore_frame(key):
+            return
+
         # Winner color background
         if self.winner == 1:
             bg_color = (200, 30, 45)
@@ -494,6 +535,7 @@ class Basketball(Game):
         
         self.grid.render_text(text, 4, 6, (255, 255, 0), scale=2)
         self.grid.render_text("WINS", 2, 12, (255, 255, 255), scale=1)
+        self._remember_frame(key)
     
     def handle_input(self, keys, events):
         """Handle player input"""
@@ -506,9 +548,9 @@ class Basketball(Game):
                 
                 # Shoot
                 if event.key == pygame.K_SPACE and self.ball_holder == self.controlled_player:
-                    player = self.get_player(self.controlled_player)
-                    target_x = self.right_hoop_x if player["team"] == 1 else self.left_hoop_x
-                    target_y = self.right_hoop_y if player["team"] == 1 else self.left_hoop_y
+                    team = self.team[self.controlled_player]
+                    target_x = self.right_hoop_x if team == 1 else self.left_hoop_x
+                    target_y = self.right_hoop_y if team == 1 else self.left_hoop_y
                     self.shoot(self.controlled_player, target_x, target_y)
 
                 # Aim up/down (controlled player only)
@@ -523,10 +565,7 @@ class Basketball(Game):
                 # Pass
                 if event.key == pygame.K_p and self.ball_holder == self.controlled_player:
                     # Pass to teammate
-                    for tidx, teammate in self.get_all_players():
-                        if teammate["team"] == self.get_player(self.controlled_player)["team"] and tidx != self.controlled_player:
-                            self.pass_ball(self.controlled_player, tidx)
-                            break
+                    self.pass_ball(self.controlled_player, self.teammate_of(self.controlled_player))
                 
                 # Return to menu
                 if event.key == pygame.K_ESCAPE:
@@ -534,19 +573,18 @@ class Basketball(Game):
         
         # Player movement (continuous)
         if self.game_started and not self.game_over:
-            player = self.get_player(self.controlled_player)
+            cp = self.controlled_player
             # Use dt-based pacing; fall back to 60fps if dt not set yet.
             dt = getattr(self, "_dt_last", 1 / 60)
             move = self.player_move_speed * dt
             
-            if keys[pygame.K_w]:
-                player["y"] = max(1, player["y"] - move)
-            if keys[pygame.K_s]:
-                player["y"] = min(self.court_height - 2, player["y"] + move)
-            if keys[pygame.K_a]:
-                player["x"] = max(1, player["x"] - move)
-            if keys[pygame.K_d]:
-                player["x"] = min(self.court_width - 2, player["x"] + move)
+            # Net direction from WASD (opposite keys cancel), then one clamp per axis
+            dx = int(bool(keys[pygame.K_d])) - int(bool(keys[pygame.K_a]))
+            dy = int(bool(keys[pygame.K_s])) - int(bool(keys[pygame.K_w]))
+            if dx:
+                self.px[cp] = min(self.court_width - 2, max(1, self.px[cp] + dx * move))
+            if dy:
+                self.py[cp] = min(self.court_height - 2, max(1, self.py[cp] + dy * move))
 
         # dt is stored in update(); keep a sane fallback if handle_input is called first.
         self._dt_last = getattr(self, "_dt_last", 1 / 60)
\ No newline at end of file
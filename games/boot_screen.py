@@ -1,8 +1,10 @@
 """
 Boot Screen - Animated startup sequence
 """
-import math
-from games.base_game import Game, hsv_to_rgb
+import numpy as np
+import pygame
+
+from games.base_game import FULL_HUE_RGB, Game
 
 
 class BootScreen(Game):
@@ -13,6 +15,17 @@ class BootScreen(Game):
         self.timer = 0
         self.duration = 3.0  # 3 seconds boot animation
         self.animation_stage = 0
+        # Color of the i-th scan line in Stages 1/2
+        n = self.grid.grid_size
+        self._scan_colors = FULL_HUE_RGB[(np.arange(n) * 20) % 360]
+
+        # Distance of every cell from the grid center, for the Stage 3 ring
+        center = n // 2
+        yy, xx = np.mgrid[0:n, 0:n]
+        dx = xx - center
+        dy = yy - center
+        self._ring_dist = np.sqrt(dx * dx + dy * dy)
+        self._ring_hue = self._ring_dist * 10
     
     def update(self, dt: float):
         """Update boot animation"""
@@ -27,48 +40,36 @@ class BootScreen(Game):
         self.grid.clear()
         
         progress = self.timer / self.duration
+        n = self.grid.grid_size
         
         # Stage 1: Horizontal scanning lines (0-33%)
         if progress < 0.33:
             stage_progress = progress / 0.33
-            num_lines = int(stage_progress * self.grid.grid_size)
-            for i in range(num_lines):
-                hue = (i * 20) % 360
-                color = hsv_to_rgb(hue, 1.0, 1.0)
-                for x in range(self.grid.grid_size):
-                    self.grid.set_pixel(x, i, color)
+            num_lines = int(stage_progress * n)
+            self.grid.pixels[:num_lines] = self._scan_colors[:num_lines, None]
         
         # Stage 2: Vertical scanning lines (33-66%)
         elif progress < 0.66:
             stage_progress = (progress - 0.33) / 0.33
-            num_lines = int(stage_progress * self.grid.grid_size)
-            for i in range(num_lines):
-                hue = (i * 20) % 360
-                color = hsv_to_rgb(hue, 1.0, 1.0)
-                for y in range(self.grid.grid_size):
-                    self.grid.set_pixel(i, y, color)
+            num_lines = int(stage_progress * n)
+            self.grid.pixels[:, :num_lines] = self._scan_colors[None, :num_lines]
         
         # Stage 3: Circular wave from center (66-100%)
         else:
             stage_progress = (progress - 0.66) / 0.34
-            center = self.grid.grid_size // 2
+            center = n // 2
             max_radius = center * 1.5
             current_radius = stage_progress * max_radius
             
-            for y in range(self.grid.grid_size):
-                for x in range(self.grid.grid_size):
-                    dist = math.sqrt((x - center) ** 2 + (y - center) ** 2)
-                    
-                    # Create a wave ring effect
-                    if abs(dist - current_radius) < 3:
-                        intensity = 1.0 - abs(dist - current_radius) / 3
-                        hue = (dist * 10 + self.timer * 100) % 360
-                        color = hsv_to_rgb(hue, 1.0, intensity)
-                        self.grid.set_pixel(x, y, color)
+            # Create a wave ring effect, written straight into the framebuffer
+            delta = np.abs(self._ring_dist - current_radius)
+            ring = delta < 3
+            intensity = 1.0 - delta[ring] / 3
+            hue = (self._ring_hue[ring] + self.timer * 100).astype(np.intp) % 360
+            self.grid.pixels[ring] = (FULL_HUE_RGB[hue] * intensity[:, None]).astype(np.uint8)
     
     def handle_input(self, keys, events):
         """Handle input - allow skip with space or enter"""
-        import pygame
         for event in events:
             if event.type == pygame.KEYDOWN:
                 if event.key in [pygame.K_SPACE, pygame.K_RETURN]:
@@ -13,7 +13,7 @@ Gameplay:
 
 from __future__ import annotations
 
-import random
+import numpy as np
 import pygame
 
 from games.base_game import Game
@@ -28,6 +28,12 @@ class Flappy(Game):
         self.flap_velocity = -7.0
         self.pipe_speed = 7.0
         self.gap_size = 6
+        self._rng = np.random.default_rng()
+
+        # Score digits as (xs, ys) pixels, redone only when the score or font changes
+        self._score_cache_val = -1
+        self._score_fonts = None
+        self._score_pixels = None
 
         self._reset()
 
@@ -39,16 +45,22 @@ class Flappy(Game):
         self.bird_y = float(self.grid.grid_size // 2)
         self.bird_vy = 0.0
 
-        # Pipes: each pipe is x position + gap center y
-        self.pipes = []
+        # Pipes as parallel arrays, oldest first: x position, gap center y and
+        # whether the bird has already scored it. Gap rows fit in a byte.
+        self.pipe_x = np.zeros(0)
+        self.pipe_gap = np.zeros(0, dtype=np.int8)
+        self.pipe_passed = np.zeros(0, dtype=bool)
         self._spawn_pipe(self.grid.grid_size + 2)
         self._spawn_pipe(self.grid.grid_size + 10)
 
-        self._passed = set()
+    def _add_pipe(self, x: float, gap: int):
+        self.pipe_x = np.append(self.pipe_x, float(x))
+        self.pipe_gap = np.append(self.pipe_gap, np.int8(gap))
+        self.pipe_passed = np.append(self.pipe_passed, False)
 
     def _spawn_pipe(self, x: float):
-        gap_center = random.randint(5, self.grid.grid_size - 6)
-        self.pipes.append({"x": float(x), "gap": gap_center})
+        gap_center = int(self._rng.integers(5, self.grid.grid_size - 5))
+        self._add_pipe(x, gap_center)
 
     def update(self, dt: float):
         if self.game_over:
@@ -58,36 +70,48 @@ class Flappy(Game):
         self.bird_vy += self.gravity * dt
         self.bird_y += self.bird_vy * dt
 
-        # Pipes movement
-        for p in self.pipes:
-            p["x"] -= self.pipe_speed * dt
+        n = self.grid.grid_size
+
+        # Move, recycle, collide and score in one pass over the pipe arrays
+        pipe_x = self.pipe_x
+        pipe_x -= self.pipe_speed * dt
 
-        # Recycle pipes
-        while self.pipes and self.pipes[0]["x"] < -2:
-            self.pipes.pop(0)
-            self._spawn_pipe(self.grid.grid_size + 2)
+        # Pipes that scrolled off the left edge are always the oldest ones: rotate
+        # them to the back and reseed them as fresh pipes on the right
+        alive = np.flatnonzero(pipe_x >= -2)
+        gone = int(alive[0]) if alive.size else len(pipe_x)
+        if gone:
+            self.pipe_x = pipe_x = np.roll(pipe_x, -gone)
+            self.pipe_gap = np.roll(self.pipe_gap, -gone)
+            self.pipe_passed = np.roll(self.pipe_passed, -gone)
+            pipe_x[-gone:] = n + 2
+            self.pipe_gap[-gone:] = self._rng.integers(5, n - 5, size=gone)
+            self.pipe_passed[-gone:] = False
 
         # Collisions / scoring
-        if self.bird_y < 0 or self.bird_y > self.grid.grid_size - 1:
+        if self.bird_y < 0 or self.bird_y > n - 1:
             self._die()
             return
 
         by = int(round(self.bird_y))
-
-        for p in self.pipes:
-            px = int(round(p["x"]))
-            if px == self.bird_x:
-                gap_top = p["gap"] - self.gap_size // 2
-                gap_bot = p["gap"] + self.gap_size // 2
-                if not (gap_top <= by <= gap_bot):
-                    self._die()
-                    return
-
-            # Score when pipe passes bird
-            if p["x"] < self.bird_x and id(p) not in self._passed:
-                self._passed.add(id(p))
-                self.score += 1
-                play_beep(880, 45)
+        half_gap = self.gap_size // 2
+        gap = self.pipe_gap
+
+        # Pipes in the bird's column whose gap doesn't contain the bird
+        in_column = np.rint(pipe_x) == self.bird_x
+        in_gap = (gap - half_gap <= by) & (by <= gap + half_gap)
+        hits = np.flatnonzero(in_column & ~in_gap)
+
+        # Score when pipe passes bird (only pipes ahead of a fatal one in the list)
+        k = hits[0] if hits.size else len(pipe_x)
+        newly_passed = (pipe_x[:k] < self.bird_x) & ~self.pipe_passed[:k]
+        if newly_passed.any():
+            self.pipe_passed[:k] |= newly_passed
+            self.score += int(np.count_nonzero(newly_passed))
+            play_beep(880, 45)
+
+        if hits.size:
+            self._die()
 
     def _die(self):
         self.game_over = True
@@ -97,31 +121,41 @@ class Flappy(Game):
         # Sky background
         self.grid.clear((0, 0, 25))
 
-        # Pipes
+        n = self.grid.grid_size
+        set_pixel = self.grid.set_pixel
+        fill_rect = self.grid.fill_rect
+        half_gap = self.gap_size // 2
+
+        # Pipes: body column plus a darker column for thickness, above and below the gap
         pipe_color = (0, 200, 80)
-        for p in self.pipes:
-            px = int(round(p["x"]))
-            gap_top = p["gap"] - self.gap_size // 2
-            gap_bot = p["gap"] + self.gap_size // 2
-            for y in range(0, self.grid.grid_size):
-                if y < gap_top or y > gap_bot:
-                    # pipe body
-                    self.grid.set_pixel(px, y, pipe_color)
-                    # thickness
-                    self.grid.set_pixel(px + 1, y, (0, 150, 60))
+        pipe_side = (0, 150, 60)
+        for x, gap in zip(self.pipe_x.tolist(), self.pipe_gap.tolist()):
+            px = int(round(x))
+            gap_top = gap - half_gap
+            gap_bot = gap + half_gap
+            fill_rect(px, 0, 1, gap_top, pipe_color)
+            fill_rect(px, gap_bot + 1, 1, n - gap_bot - 1, pipe_color)
+            fill_rect(px + 1, 0, 1, gap_top, pipe_side)
+            fill_rect(px + 1, gap_bot + 1, 1, n - gap_bot - 1, pipe_side)
 
         # Bird (2x2)
         bx = self.bird_x
         by = int(round(self.bird_y))
         bird = (255, 230, 60)
-        self.grid.set_pixel(bx, by, bird)
-        self.grid.set_pixel(bx, by + 1, bird)
-        self.grid.set_pixel(bx + 1, by, (255, 180, 0))
-        self.grid.set_pixel(bx + 1, by + 1, (255, 180, 0))
+        set_pixel(bx, by, bird)
+        set_pixel(bx, by + 1, bird)
+        set_pixel(bx + 1, by, (255, 180, 0))
+        set_pixel(bx + 1, by + 1, (255, 180, 0))
 
         # Score
         self.grid.render_text("F", 0, 0, (120, 200, 255), scale=1)
-        self.grid.render_number(self.score, 4, 0, (255, 255, 255), scale=1)
+        fonts = self.grid.get_font_overrides()
+        if self.score != self._score_cache_val or fonts is not self._score_fonts:
+            ys, xs = self.grid.text_offsets(str(self.score))
+            self._score_pixels = (xs + 4, ys)
+            self._score_cache_val = self.score
+            self._score_fonts = fonts
+        self.grid.set_pixels(*self._score_pixels, (255, 255, 255))
 
         if self.game_over:
             self.grid.render_text("OVER", 2, 7, (255, 255, 0), scale=1)
@@ -25,19 +25,16 @@ Edit view:
 
 from __future__ import annotations
 
+import numpy as np
 import pygame
 
 from games.base_game import Game
-from games.font_store import FontOverrides, Glyph, get_font_store
+from games.font_store import FontOverrides, Glyph, get_font_store, glyph_bit
 from games.sound import play_beep
 
 
 def _blank_glyph() -> Glyph:
-    return [[0, 0, 0] for _ in range(5)]
-
-
-def _copy_glyph(g: Glyph) -> Glyph:
-    return [[int(v) for v in row] for row in g]
+    return 0
 
 
 class FontEditor(Game):
@@ -46,37 +43,64 @@ class FontEditor(Game):
 
         self.store = get_font_store()
 
+        # Store overrides + the glyph being edited, rebuilt only when either changes
+        self._preview_dirty = True
+        self._preview_store_version = -1
+        self._cached_preview: FontOverrides = {}
+
         self.charset = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 -"
+        self._char_to_index = {c: i for i, c in enumerate(self.charset)}
+        self._num_pages = max(1, (len(self.charset) + 11) // 12)
         self.char_index = 0
+        self._char = self.charset[0]
         self.set_current_char(initial_char)
 
         self.mode = "atlas"  # atlas | edit
         self.atlas_page = 0
 
+        # Atlas layout is fixed: cell origins in page order, plus each cell's guide
+        # border (the gutter row under the glyph and the column to its right)
+        ox, oy, cw, ch = self._atlas_layout()
+        self._atlas_cell_origins = [
+            (ox + (i % 4) * cw, oy + (i // 4) * ch) for i in range(self._atlas_page_size())
+        ]
+        border = [
+            [(bx + dx, by + 5) for dx in range(3)] + [(bx + 3, by + dy) for dy in range(5)]
+            for bx, by in self._atlas_cell_origins
+        ]
+        self._atlas_border_pixels = np.array(border, dtype=np.intp)
+
         self.cx = 0
         self.cy = 0
 
         self._load_current_glyph()
 
     def _current_char(self) -> str:
-        return self.charset[self.char_index]
+        return self._char
 
     def set_current_char(self, ch: str) -> None:
         ch = str(ch).upper()
-        if ch in self.charset:
-            self.char_index = self.charset.index(ch)
+        if ch in self._char_to_index:
+            self.char_index = self._char_to_index[ch]
         else:
             self.char_index = 0
+        self._char = self.charset[self.char_index]
+        self._preview_dirty = True
 
     def _load_current_glyph(self) -> None:
         ch = self._current_char()
         g = self.store.get_glyph(ch)
-        self.glyph = _copy_glyph(g) if g is not None else _blank_glyph()
+        self.glyph = g if g is not None else _blank_glyph()
+        self._preview_dirty = True
 
     def _preview_overrides(self) -> FontOverrides:
-        overrides = self.store.get_overrides()
-        overrides[self._current_char()] = _copy_glyph(self.glyph)
-        return overrides
+        if self._preview_dirty or self._preview_store_version != self.store.version:
+            overrides = self.store.get_overrides()
+            overrides[self._current_char()] = self.glyph
+            self._cached_preview = overrides
+            self._preview_store_version = self.store.version
+            self._preview_dirty = False
+        return self._cached_preview
 
     def _save_current_glyph(self) -> None:
         self.store.set_glyph(self._current_char(), self.glyph)
@@ -86,16 +110,7 @@ class FontEditor(Game):
         self.store.clear_glyph(self._current_char())
         self.store.save()
         self.glyph = _blank_glyph()
-
-    def _screen_to_grid(self, sx: int, sy: int) -> tuple[int, int] | None:
-        try:
-            lx = int((sx - self.grid.offset_x) / (self.grid.led_size + self.grid.led_spacing))
-            ly = int((sy - self.grid.offset_y) / (self.grid.led_size + self.grid.led_spacing))
-        except Exception:
-            return None
-        if 0 <= lx < self.grid.grid_size and 0 <= ly < self.grid.grid_size:
-            return (lx, ly)
-        return None
+        self._preview_dirty = True
 
     def _atlas_layout(self) -> tuple[int, int, int, int]:
         """Return (ox, oy, cell_w, cell_h) for atlas cells."""
@@ -155,7 +170,9 @@ class FontEditor(Game):
 
         # Ensure preview text uses current (unsaved) edits.
         try:
-            self.grid.set_font_overrides(self._preview_overrides())
+            preview = self._preview_overrides()
+            if self.grid.get_font_overrides() is not preview:
+                self.grid.set_font_overrides(preview)
         except Exception:
             pass
 
@@ -169,7 +186,7 @@ class FontEditor(Game):
             if event.type == pygame.MOUSEBUTTONDOWN:
                 pos = getattr(event, "pos", None)
                 if pos is not None:
-                    grid_xy = self._screen_to_grid(pos[0], pos[1])
+                    grid_xy = self.grid.screen_to_grid(pos[0], pos[1])
                     if grid_xy is not None:
                         if self.mode == "atlas":
                             ch = self._grid_to_atlas_char(grid_xy[0], grid_xy[1])
@@ -182,7 +199,8 @@ class FontEditor(Game):
                             glyph_xy = self._grid_to_glyph_xy(grid_xy[0], grid_xy[1])
                             if glyph_xy is not None:
                                 self.cx, self.cy = glyph_xy
-                                self.glyph[self.cy][self.cx] = 0 if self.glyph[self.cy][self.cx] else 1
+                                self.glyph ^= glyph_bit(self.cx, self.cy)
+                                self._preview_dirty = True
                                 play_beep(660, 15)
                 continue
 
@@ -202,7 +220,7 @@ class FontEditor(Game):
             typed = getattr(event, "unicode", "")
             if typed:
                 ch = str(typed).upper()
-                if ch in self.charset:
+                if ch in self._char_to_index:
                     self.set_current_char(ch)
                     self._load_current_glyph()
                     self.mode = "edit"
@@ -211,10 +229,10 @@ class FontEditor(Game):
 
             if self.mode == "atlas":
                 if event.key == pygame.K_n:
-                    self.atlas_page = (self.atlas_page + 1) % max(1, (len(self.charset) + 11) // 12)
+                    self.atlas_page = (self.atlas_page + 1) % self._num_pages
                     play_beep(520, 25)
                 elif event.key == pygame.K_p:
-                    self.atlas_page = (self.atlas_page - 1) % max(1, (len(self.charset) + 11) // 12)
+                    self.atlas_page = (self.atlas_page - 1) % self._num_pages
                     play_beep(420, 25)
                 continue
 
@@ -228,10 +246,12 @@ class FontEditor(Game):
             elif event.key == pygame.K_DOWN:
                 self.cy = min(4, self.cy + 1)
             elif event.key == pygame.K_SPACE:
-                self.glyph[self.cy][self.cx] = 0 if self.glyph[self.cy][self.cx] else 1
+                self.glyph ^= glyph_bit(self.cx, self.cy)
+                self._preview_dirty = True
                 play_beep(660, 15)
             elif event.key == pygame.K_BACKSPACE:
-                self.glyph[self.cy][self.cx] = 0
+                self.glyph &= ~glyph_bit(self.cx, self.cy)
+                self._preview_dirty = True
                 play_beep(320, 15)
             elif event.key == pygame.K_r:
                 self._reset_current_glyph()
@@ -241,28 +261,16 @@ class FontEditor(Game):
                 play_beep(880, 40)
 
     def _render_atlas(self) -> None:
-        ox, oy, cw, ch = self._atlas_layout()
-
         items = self._atlas_items()
+        current = self._current_char()
+
+        # subtle border for each glyph cell on this page
+        border = self._atlas_border_pixels[: len(items)].reshape(-1, 2)
+        self.grid.set_pixels(border[:, 0], border[:, 1], (40, 40, 40))
 
-        # background guide boxes and glyphs
-        for idx, c in enumerate(items):
-            col = idx % 4
-            row = idx // 4
-            bx = ox + col * cw
-            by = oy + row * ch
-
-            # subtle border for each glyph cell
-            border = (40, 40, 40)
-            for dx in range(0, 3):
-                self.grid.set_pixel(bx + dx, by + 5, border)
-            for dy in range(0, 5):
-                self.grid.set_pixel(bx + 3, by + dy, border)
-
-            # draw the glyph using render_text so overrides show up
-            color = (120, 200, 255)
-            if c == self._current_char():
-                color = (255, 255, 0)
+        # draw the glyphs using render_text so overrides show up
+        for (bx, by), c in zip(self._atlas_cell_origins, items):
+            color = (255, 255, 0) if c == current else (120, 200, 255)
             self.grid.render_text(c, bx, by, color, scale=1, spacing=1)
 
         # small preview at bottom
@@ -276,30 +284,26 @@ class FontEditor(Game):
         # frame around magnified area
         frame = (40, 40, 40)
         self.grid.fill_rect(0, 0, 11, 17, (0, 0, 0))
-        for x in range(0, 11):
-            self.grid.set_pixel(x, 0, frame)
-            self.grid.set_pixel(x, 16, frame)
-        for y in range(0, 17):
-            self.grid.set_pixel(0, y, frame)
-            self.grid.set_pixel(10, y, frame)
+        self.grid.fill_rect(0, 0, 11, 1, frame)
+        self.grid.fill_rect(0, 16, 11, 1, frame)
+        self.grid.fill_rect(0, 0, 1, 17, frame)
+        self.grid.fill_rect(10, 0, 1, 17, frame)
 
         # magnified glyph pixels
         on_color = (0, 255, 255)
         for y in range(5):
             for x in range(3):
-                if self.glyph[y][x]:
+                if self.glyph & glyph_bit(x, y):
                     self.grid.fill_rect(ox + x * scale, oy + y * scale, scale, scale, on_color)
 
         # cursor box
         cx0 = ox + self.cx * scale
         cy0 = oy + self.cy * scale
         cursor = (255, 255, 0)
-        for dx in range(scale):
-            self.grid.set_pixel(cx0 + dx, cy0, cursor)
-            self.grid.set_pixel(cx0 + dx, cy0 + scale - 1, cursor)
-        for dy in range(scale):
-            self.grid.set_pixel(cx0, cy0 + dy, cursor)
-            self.grid.set_pixel(cx0 + scale - 1, cy0 + dy, cursor)
+        self.grid.fill_rect(cx0, cy0, scale, 1, cursor)
+        self.grid.fill_rect(cx0, cy0 + scale - 1, scale, 1, cursor)
+        self.grid.fill_rect(cx0, cy0, 1, scale, cursor)
+        self.grid.fill_rect(cx0 + scale - 1, cy0, 1, scale, cursor)
 
         # right-side info
         self.grid.render_text("CH", 12, 0, (140, 140, 140), scale=1)
@@ -3,12 +3,17 @@
 We keep this separate from SpriteStore because glyphs are not full-color sprites;
 they are binary masks used by LEDGrid.render_text().
 
+Glyphs are 15-bit masks: pixel (x, y) of the 3x5 cell is bit y*3 + x.
+
 Persistence format (JSON):
   {
-    "A": [[0,1,0],[1,0,1],[1,1,1],[1,0,1],[1,0,1]],
+    "A": 23530,
     "B": ...
   }
 
+Files written before glyphs were packed store 5x3 0/1 matrices instead
+([[0,1,0],[1,0,1],...]); those still load.
+
 Only overrides are stored; any missing character falls back to the built-in font.
 """
 
@@ -16,14 +21,37 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Dict, List
+from typing import Dict
+
+from games.json_file import write_json_atomic
 
 
-Glyph = List[List[int]]  # 5 rows of 3 ints (0/1)
+Glyph = int  # 15-bit mask, bit y*3 + x
 FontOverrides = Dict[str, Glyph]
 
+GLYPH_MASK = (1 << 15) - 1
+
+
+def glyph_bit(x: int, y: int) -> int:
+    """Bit for pixel (x, y) of a 3x5 glyph."""
+    return 1 << (y * 3 + x)
+
+
+def _norm(ch) -> str:
+    """Override key for a character: its upper-case form."""
+    if type(ch) is not str:
+        ch = str(ch)
+    # Single ASCII characters that aren't lower-case letters are already keys.
+    if len(ch) == 1 and ch.isascii() and not ("a" <= ch <= "z"):
+        return ch
+    return ch.upper()
+
 
 def _coerce_glyph(raw) -> Glyph | None:
+    if isinstance(raw, int) and not isinstance(raw, bool):
+        return raw if 0 <= raw <= GLYPH_MASK else None
+
+    # Legacy / matrix form: 5 rows of 3 ints (0/1)
     try:
         rows = list(raw)
     except Exception:
@@ -32,15 +60,17 @@ def _coerce_glyph(raw) -> Glyph | None:
     if len(rows) != 5:
         return None
 
-    out: Glyph = []
-    for row in rows:
+    out = 0
+    for y, row in enumerate(rows):
         try:
             cols = list(row)
         except Exception:
             return None
         if len(cols) != 3:
             return None
-        out.append([1 if int(v) else 0 for v in cols])
+        for x, v in enumerate(cols):
+            if int(v):
+                out |= glyph_bit(x, y)
     return out
 
 
@@ -48,8 +78,14 @@ class FontStore:
     def __init__(self, path: str = "data/font_overrides.json"):
         self.path = path
         self._overrides: FontOverrides = {}
+        # Bumped on every change to the overrides so callers can cache derived data.
+        self.version = 0
+        # Hash of the overrides as last written to disk, None if not written yet.
+        self._last_saved_hash: int | None = None
 
     def load(self) -> None:
+        self.version += 1
+        self._last_saved_hash = None
         if not os.path.exists(self.path):
             self._overrides = {}
             return
@@ -63,7 +99,7 @@ class FontStore:
         overrides: FontOverrides = {}
         for k, v in (raw or {}).items():
             try:
-                ch = str(k).upper()
+                ch = _norm(k)
                 glyph = _coerce_glyph(v)
                 if glyph is None:
                     continue
@@ -73,28 +109,34 @@ class FontStore:
         self._overrides = overrides
 
     def save(self) -> None:
-        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
-        with open(self.path, "w", encoding="utf-8") as f:
-            json.dump(self._overrides, f, indent=2, sort_keys=True)
+        h = hash(tuple(sorted(self._overrides.items())))
+        if h == self._last_saved_hash and os.path.exists(self.path):
+            return
+
+        write_json_atomic(self.path, self._overrides, indent=2, sort_keys=True)
+        self._last_saved_hash = h
 
     def get_overrides(self) -> FontOverrides:
         return dict(self._overrides)
 
     def set_overrides(self, overrides: FontOverrides) -> None:
         self._overrides = dict(overrides)
+        self.version += 1
 
     def set_glyph(self, ch: str, glyph: Glyph) -> None:
-        ch = str(ch).upper()
+        ch = _norm(ch)
         coerced = _coerce_glyph(glyph)
         if coerced is None:
             return
         self._overrides[ch] = coerced
+        self.version += 1
 
     def clear_glyph(self, ch: str) -> None:
-        self._overrides.pop(str(ch).upper(), None)
+        if self._overrides.pop(_norm(ch), None) is not None:
+            self.version += 1
 
     def get_glyph(self, ch: str) -> Glyph | None:
-        return self._overrides.get(str(ch).upper())
+        return self._overrides.get(_norm(ch))
 
 
 _default_store: FontStore | None = None
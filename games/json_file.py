@@ -0,0 +1,19 @@
+"""Small JSON persistence helper shared by the sprite and font stores."""
+
+from __future__ import annotations
+
+import json
+import os
+
+
+def write_json_atomic(path: str, obj, **dump_kwargs) -> None:
+    """Write obj as JSON to path, creating its directory if needed.
+
+    The data goes to a temp file that is then swapped in, so a failed save
+    never truncates the existing file.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, **dump_kwargs)
+    os.replace(tmp_path, path)
@@ -3,13 +3,227 @@ Carousel Menu - Game selection with pixel art logos
 """
 import pygame
 import math
+import numpy as np
 
-from games.base_game import Game, hsv_to_rgb
+from games.base_game import Game, bake_pixels, hsv_to_rgb
 from games.sound import play_beep
 from games.sprite_store import get_sprite_store, draw_sprite
 from games.text_layout import TITLE, HINT, centered_x
 
 
+def _pong_logo(put, x: int, y: int):
+    """Pixel art logo for Pong - paddles and ball"""
+    white = (255, 255, 255)
+    yellow = (255, 255, 0)
+
+    # Left paddle
+    for i in range(5):
+        put(x, y + i + 1, white)
+        put(x + 1, y + i + 1, white)
+
+    # Right paddle
+    for i in range(5):
+        put(x + 9, y + i + 1, white)
+        put(x + 10, y + i + 1, white)
+
+    # Ball in center
+    put(x + 5, y + 3, yellow)
+    put(x + 5, y + 4, yellow)
+    put(x + 6, y + 3, yellow)
+    put(x + 6, y + 4, yellow)
+
+
+def _snake_logo(put, x: int, y: int):
+    """Pixel art logo for Snake - snake shape"""
+    green = (0, 255, 0)
+    lime = (150, 255, 0)
+
+    # Snake body in S shape
+    snake_pixels = [
+        (5, 1), (6, 1), (7, 1),
+        (4, 2), (5, 2),
+        (4, 3), (5, 3), (6, 3),
+        (6, 4), (7, 4),
+        (5, 5), (6, 5), (7, 5)
+    ]
+
+    for i, (dx, dy) in enumerate(snake_pixels):
+        color = green if i % 2 == 0 else lime
+        put(x + dx, y + dy, color)
+
+
+def _flappy_logo(put, x: int, y: int):
+    """Pixel art logo for Flappy - bird + pipe."""
+    bird = (255, 230, 60)
+    pipe = (0, 200, 80)
+
+    # Pipe column
+    for dy in range(0, 8):
+        if dy in (3, 4):
+            continue
+        put(x + 8, y + dy, pipe)
+        put(x + 9, y + dy, (0, 150, 60))
+
+    # Bird
+    put(x + 3, y + 3, bird)
+    put(x + 3, y + 4, bird)
+    put(x + 4, y + 3, (255, 180, 0))
+    put(x + 4, y + 4, (255, 180, 0))
+
+
+# Basketball logo bitmaps: hoop ring, then the flame (1 = maroon edge, 2 = red fill)
+_HEAT_RING = np.array([
+    [0, 0, 1, 1, 1, 1, 1, 1, 0, 0],
+    [0, 1, 0, 0, 0, 0, 0, 0, 1, 0],
+    [1, 0, 0, 0, 0, 0, 0, 0, 0, 1],
+], dtype=np.uint8)
+_HEAT_FLAME = np.array([
+    [0, 0, 0, 0, 1, 1, 0, 0, 0, 0],
+    [0, 0, 0, 1, 2, 2, 1, 0, 0, 0],
+    [0, 0, 1, 2, 2, 2, 2, 1, 0, 0],
+    [0, 1, 2, 2, 2, 2, 2, 2, 1, 0],
+    [0, 1, 2, 2, 2, 2, 2, 2, 1, 0],
+    [0, 0, 1, 2, 2, 2, 2, 1, 0, 0],
+    [0, 0, 0, 1, 2, 2, 1, 0, 0, 0],
+], dtype=np.uint8)
+
+
+def _basketball_logo(put, x: int, y: int):
+    """Pixel art logo for Basketball - Miami Heat style"""
+    # Colors for Miami Heat logo
+    red = (200, 30, 45)  # Heat red
+    maroon = (150, 20, 35)
+    black = (20, 20, 20)
+    orange = (255, 100, 0)
+    white = (255, 255, 255)
+
+    # Basketball hoop/ring (top)
+    for dy, dx in zip(*np.nonzero(_HEAT_RING)):
+        put(x + int(dx), y + int(dy), black)
+
+    # Flame/heat shape (red basketball-like shape)
+    shades = (None, maroon, red)
+    for dy, dx in zip(*np.nonzero(_HEAT_FLAME)):
+        put(x + int(dx), y + int(dy) + 1, shades[_HEAT_FLAME[dy, dx]])
+
+
+def _pet_logo(put, x: int, y: int):
+    """Pixel art logo for Pets - simple pawprint"""
+    pink = (255, 120, 180)
+    dark = (180, 60, 120)
+
+    # Toe beans
+    toes = [(2, 1), (4, 0), (6, 0), (8, 1)]
+    for tx, ty in toes:
+        put(x + tx, y + ty, pink)
+        put(x + tx, y + ty + 1, dark)
+
+    # Paw pad
+    pad = [
+        (4, 3), (5, 3), (6, 3),
+        (3, 4), (4, 4), (5, 4), (6, 4), (7, 4),
+        (3, 5), (4, 5), (5, 5), (6, 5), (7, 5),
+        (4, 6), (5, 6), (6, 6),
+    ]
+    for i, (px, py) in enumerate(pad):
+        put(x + px, y + py, pink if i % 2 == 0 else dark)
+
+
+def _vacay_logo(put, x: int, y: int):
+    """Pixel art logo for Vacation - small sun + waves."""
+    sun = (255, 220, 80)
+    sky = (80, 160, 255)
+    wave = (120, 220, 255)
+    sand = (200, 160, 80)
+
+    # sky strip
+    for dx in range(10):
+        put(x + dx, y + 0, sky)
+
+    # sun
+    put(x + 7, y + 1, sun)
+    put(x + 6, y + 1, sun)
+    put(x + 7, y + 2, sun)
+
+    # waves
+    for dx in range(10):
+        if dx % 2 == 0:
+            put(x + dx, y + 3, wave)
+    for dx in range(10):
+        put(x + dx, y + 4, (0, 120, 200))
+
+    # sand
+    for dx in range(10):
+        put(x + dx, y + 5, sand)
+
+
+def _fight_logo(put, x: int, y: int):
+    """Pixel art logo for Fight - two stick heads facing each other."""
+    left = (255, 255, 255)
+    right = (30, 30, 30)
+    mid = (255, 255, 0)
+    # heads
+    put(x + 2, y + 2, left)
+    put(x + 7, y + 2, right)
+    # bodies
+    put(x + 2, y + 4, left)
+    put(x + 7, y + 4, right)
+    # VS
+    put(x + 4, y + 3, mid)
+    put(x + 5, y + 3, mid)
+
+
+def _race_logo(put, x: int, y: int):
+    """Pixel art logo for Race - small road + car."""
+    road = (80, 80, 80)
+    edge = (220, 220, 220)
+    car1 = (60, 200, 255)
+
+    # road taper
+    for dy in range(0, 8):
+        hw = 1 + dy // 2
+        cy = y + dy
+        cx = x + 5
+        for dx in range(-hw, hw + 1):
+            put(cx + dx, cy, road)
+        put(cx - hw, cy, edge)
+        put(cx + hw, cy, edge)
+
+    # car
+    put(x + 4, y + 6, car1)
+    put(x + 5, y + 6, (20, 120, 200))
+    put(x + 4, y + 7, (20, 120, 200))
+    put(x + 5, y + 7, car1)
+
+
+# Built-in logos in carousel order (PONG, SNAKE, FLAP, BBALL, PETS, VACAY, FIGHT, RACE)
+_LOGOS = [
+    bake_pixels(draw)
+    for draw in (
+        _pong_logo,
+        _snake_logo,
+        _flappy_logo,
+        _basketball_logo,
+        _pet_logo,
+        _vacay_logo,
+        _fight_logo,
+        _race_logo,
+    )
+]
+
+
+# Carousel order; card numbers are 1-based positions in this tuple
+GAME_NAMES = ("PONG", "SNAKE", "FLAP", "BBALL", "PETS", "VACAY", "FIGHT", "RACE")
+
+# Pulsing title color sampled over one period of the pulse
+_TITLE_STEPS = 256
+_TITLE_COLORS = [
+    (int(60 + 80 * pulse), int(180 + 40 * pulse), 255)
+    for pulse in ((math.sin(2.0 * math.pi * i / _TITLE_STEPS) + 1.0) / 2.0 for i in range(_TITLE_STEPS))
+]
+_TITLE_X = centered_x(TITLE, chars=5)
+
+
 class CarouselMenu(Game):
     """Horizontal carousel menu for game selection"""
     
@@ -33,16 +247,23 @@ class CarouselMenu(Game):
         
         # Game information
         self._sprite_store = get_sprite_store()
-        self.games = [
-            {"name": "PONG", "number": 1},
-            {"name": "SNAKE", "number": 2},
-            {"name": "FLAP", "number": 3},
-            {"name": "BBALL", "number": 4},
-            {"name": "PETS", "number": 5},
-            {"name": "VACAY", "number": 6},
-            {"name": "FIGHT", "number": 7},
-            {"name": "RACE", "number": 8},
-        ]
+        self.games = [{"name": name, "number": i + 1} for i, name in enumerate(GAME_NAMES)]
+        self.refresh_sprites()
+
+    def refresh_sprites(self) -> None:
+        """Pick up user logo/card sprites from the store and drop cached renders.
+
+        The menu is recreated after the sprite/font editors, so this is only
+        needed when the store changes underneath a live menu.
+        """
+        store = self._sprite_store
+        self._logo_sprites = [store.get(f"menu_logo_{game['name']}") for game in self.games]
+        self._card_overlays = [store.get(f"menu_card_{game['name']}") for game in self.games]
+
+        # Each card as it renders at rest, filled in lazily by _card_pixels()
+        self._card_cache: list[tuple[np.ndarray, np.ndarray] | None] = [None] * len(self.games)
+        self._static_key = None
+        self._static_layer: tuple[np.ndarray, np.ndarray] | None = None
     
     def update(self, dt: float):
         """Update menu animation"""
@@ -52,7 +273,9 @@ class CarouselMenu(Game):
             target_offset = self.target_index
             diff = target_offset - self.current_offset
             if abs(diff) > 0.01:
-                self.current_offset += diff * self.scroll_speed * dt
+                # Exponential decay towards the target: frame-rate independent and
+                # never overshoots, even on a long frame
+                self.current_offset += diff * (1.0 - math.exp(-self.scroll_speed * dt))
             else:
                 self.current_offset = target_offset
     
@@ -61,14 +284,9 @@ class CarouselMenu(Game):
         # Slightly tinted background for better depth
         self.grid.clear((0, 0, 8))
 
-        # Top title bar (subtle)
-        pulse = (math.sin(self.title_pulse * 2.0) + 1.0) / 2.0
-        title_color = (
-            int(60 + 80 * pulse),
-            int(180 + 40 * pulse),
-            int(255),
-        )
-        self.grid.render_text("GAMES", centered_x(TITLE, chars=5), TITLE.y, title_color, scale=1)
+        # Top title bar (subtle); the pulse phase is title_pulse * 2 radians
+        title_color = _TITLE_COLORS[int(self.title_pulse * (_TITLE_STEPS / math.pi)) % _TITLE_STEPS]
+        self.grid.render_text("GAMES", _TITLE_X, TITLE.y, title_color, scale=1)
         
         # Calculate which games to show
         if self.smooth_transition:
@@ -76,15 +294,29 @@ class CarouselMenu(Game):
         else:
             display_offset = self.selected_index
         
+        # Everything below the title only changes with the scroll position, so once
+        # it holds still for a frame it is captured and pasted over the title.
+        key = (self.smooth_transition, display_offset, self.selected_index)
+        if key != self._static_key:
+            self._static_key = key
+            self._static_layer = None
+            self._render_static(display_offset)
+        else:
+            if self._static_layer is None:
+                self._static_layer = self._capture(lambda: self._render_static(display_offset))
+            colors, drawn = self._static_layer
+            self.grid.pixels[drawn] = colors[drawn]
+
+    def _render_static(self, display_offset: float):
+        """Render cards, previews, arrows and hint (everything but the title)."""
         if self.smooth_transition:
             # Render nearby cards with horizontal sliding.
-            # (Cards draw off-grid safely; LEDGrid.set_pixel bounds-checks.)
+            # (_blit_card clips cards to the grid and skips those entirely off it.)
             for i in range(self.num_games):
-                if abs(i - display_offset) <= 1.25:
-                    self._render_game_card(i, display_offset)
+                self._blit_card(i, int((i - display_offset) * self.card_width))
         else:
             # Instant mode (snap) + simple adjacent previews.
-            self._render_game_card(self.selected_index, display_offset)
+            self._blit_card(self.selected_index, int((self.selected_index - display_offset) * self.card_width))
 
             # Render left preview
             if self.selected_index > 0:
@@ -111,34 +343,84 @@ class CarouselMenu(Game):
             scale=1,
         )
     
+    def _capture(self, draw) -> tuple[np.ndarray, np.ndarray]:
+        """Run draw() against scratch framebuffers and return (colors, drawn).
+
+        The scratch buffers are cleared to two different colors: a pixel was
+        drawn if it differs from the clear color in either of them.
+        """
+        screen = self.grid.pixels
+        layers = []
+        try:
+            for fill in (0, 255):
+                self.grid.pixels = np.full_like(screen, fill)
+                draw()
+                layers.append(self.grid.pixels)
+        finally:
+            self.grid.pixels = screen
+        drawn = (layers[0] != 0).any(axis=2) | (layers[1] != 255).any(axis=2)
+        return layers[0], drawn
+
+    def _card_pixels(self, game_index: int) -> tuple[np.ndarray, np.ndarray]:
+        """(colors, drawn) arrays for a card, one column wider than the grid.
+
+        Column c + 1 holds card column c: names wider than the card start one
+        pixel left of it, which only shows while sliding.
+        """
+        cached = self._card_cache[game_index]
+        if cached is not None:
+            return cached
+
+        n = self.grid.grid_size
+        colors = np.zeros((n, n + 1, 3), dtype=np.uint8)
+        drawn = np.zeros((n, n + 1), dtype=bool)
+        for x_shift, dst, src in ((0, slice(1, n + 1), slice(0, n)), (1, slice(0, 1), slice(0, 1))):
+            layer_colors, layer_drawn = self._capture(lambda: self._draw_card(game_index, x_shift))
+            colors[:, dst] = layer_colors[:, src]
+            drawn[:, dst] = layer_drawn[:, src]
+
+        cached = self._card_cache[game_index] = (colors, drawn)
+        return cached
+
+    def _blit_card(self, game_index: int, x_shift: int):
+        """Draw a cached card shifted horizontally by x_shift LEDs."""
+        if game_index < 0 or game_index >= len(self.games):
+            return
+        n = self.grid.grid_size
+        x0 = max(0, x_shift - 1)
+        x1 = min(n, x_shift + n)
+        if x0 >= x1:
+            return
+        colors, drawn = self._card_pixels(game_index)
+        src = slice(x0 - x_shift + 1, x1 - x_shift + 1)
+        mask = drawn[:, src]
+        self.grid.pixels[:, x0:x1][mask] = colors[:, src][mask]
+
     def _render_game_card(self, game_index: int, offset: float):
         """Render the main game card in center"""
         if game_index < 0 or game_index >= len(self.games):
             return
         
-        game = self.games[game_index]
-        
         # Horizontal slide (in LED pixels)
         # When offset == game_index => x_shift == 0 (card centered)
         x_shift = int((game_index - offset) * self.card_width)
-        
-        # Allow a per-game user override for the full card pixels.
-        # This is an overlay (not a full replacement): it draws on top of
-        # the programmatic render.
-        overlay = None
-        try:
-            overlay = self._sprite_store.get(f"menu_card_{game['name']}")
-        except Exception:
-            overlay = None
+
+        # A card spans columns x_shift - 1 .. x_shift + card_width - 1 (see _card_pixels)
+        if x_shift <= -self.card_width or x_shift > self.card_width:
+            return
+        self._draw_card(game_index, x_shift)
+
+    def _draw_card(self, game_index: int, x_shift: int):
+        """Draw a card with its left edge at x_shift."""
+        game = self.games[game_index]
 
         # Card border (helps readability during slide)
         border_color = (30, 30, 40)
-        for bx in range(0, self.grid.grid_size):
-            self.grid.set_pixel(x_shift + bx, 4, border_color)
-            self.grid.set_pixel(x_shift + bx, 18, border_color)
-        for by in range(4, 19):
-            self.grid.set_pixel(x_shift + 0, by, border_color)
-            self.grid.set_pixel(x_shift + 18, by, border_color)
+        n = self.grid.grid_size
+        self.grid.fill_rect(x_shift, 4, n, 1, border_color)
+        self.grid.fill_rect(x_shift, 18, n, 1, border_color)
+        self.grid.fill_rect(x_shift, 4, 1, 15, border_color)
+        self.grid.fill_rect(x_shift + 18, 4, 1, 15, border_color)
 
         # Render game number at top
         number_y = 2
@@ -155,7 +437,10 @@ class CarouselMenu(Game):
         text_x = x_shift + (self.grid.grid_size - text_width) // 2
         self.grid.render_text(name, text_x, 15, (0, 255, 255), scale=1)
 
-        # Overlay after base render so it can replace pixels.
+        # Allow a per-game user override for the full card pixels.
+        # This is an overlay (not a full replacement): it draws on top of
+        # the programmatic render, so it can replace pixels.
+        overlay = self._card_overlays[game_index]
         if overlay is not None:
             draw_sprite(self.grid, overlay, x_shift + 0, 2)
     
@@ -179,211 +464,16 @@ class CarouselMenu(Game):
     
     def _render_logo(self, game_index: int, x: int, y: int):
         """Render pixel art logo for each game"""
+        if not 0 <= game_index < len(self.games):
+            return
+
         # Allow user overrides via sprite store.
-        try:
-            name = self.games[game_index]["name"]
-            sprite = self._sprite_store.get(f"menu_logo_{name}")
-            if sprite is not None:
-                draw_sprite(self.grid, sprite, x, y)
-                return
-        except Exception:
-            pass
-
-        if game_index == 0:  # PONG
-            self._render_pong_logo(x, y)
-        elif game_index == 1:  # SNAKE
-            self._render_snake_logo(x, y)
-        elif game_index == 2:  # FLAPPY
-            self._render_flappy_logo(x, y)
-        elif game_index == 3:  # BBALL
-            self._render_basketball_logo(x, y)
-        elif game_index == 4:  # PETS
-            self._render_pet_logo(x, y)
-        elif game_index == 5:  # VACAY
-            self._render_vacay_logo(x, y)
-        elif game_index == 6:  # FIGHT
-            self._render_fight_logo(x, y)
-        elif game_index == 7:  # RACE
-            self._render_race_logo(x, y)
-    
-    def _render_pong_logo(self, x: int, y: int):
-        """Pixel art logo for Pong - paddles and ball"""
-        white = (255, 255, 255)
-        yellow = (255, 255, 0)
-        
-        # Left paddle
-        for i in range(5):
-            self.grid.set_pixel(x, y + i + 1, white)
-            self.grid.set_pixel(x + 1, y + i + 1, white)
-        
-        # Right paddle
-        for i in range(5):
-            self.grid.set_pixel(x + 9, y + i + 1, white)
-            self.grid.set_pixel(x + 10, y + i + 1, white)
-        
-        # Ball in center
-        self.grid.set_pixel(x + 5, y + 3, yellow)
-        self.grid.set_pixel(x + 5, y + 4, yellow)
-        self.grid.set_pixel(x + 6, y + 3, yellow)
-        self.grid.set_pixel(x + 6, y + 4, yellow)
-    
-    def _render_snake_logo(self, x: int, y: int):
-        """Pixel art logo for Snake - snake shape"""
-        green = (0, 255, 0)
-        lime = (150, 255, 0)
-        
-        # Snake body in S shape
-        snake_pixels = [
-            (5, 1), (6, 1), (7, 1),
-            (4, 2), (5, 2),
-            (4, 3), (5, 3), (6, 3),
-            (6, 4), (7, 4),
-            (5, 5), (6, 5), (7, 5)
-        ]
-        
-        for i, (dx, dy) in enumerate(snake_pixels):
-            color = green if i % 2 == 0 else lime
-            self.grid.set_pixel(x + dx, y + dy, color)
-    
-    def _render_flappy_logo(self, x: int, y: int):
-        """Pixel art logo for Flappy - bird + pipe."""
-        bird = (255, 230, 60)
-        pipe = (0, 200, 80)
-
-        # Pipe column
-        for dy in range(0, 8):
-            if dy in (3, 4):
-                continue
-            self.grid.set_pixel(x + 8, y + dy, pipe)
-            self.grid.set_pixel(x + 9, y + dy, (0, 150, 60))
-
-        # Bird
-        self.grid.set_pixel(x + 3, y + 3, bird)
-        self.grid.set_pixel(x + 3, y + 4, bird)
-        self.grid.set_pixel(x + 4, y + 3, (255, 180, 0))
-        self.grid.set_pixel(x + 4, y + 4, (255, 180, 0))
-    
-    def _render_basketball_logo(self, x: int, y: int):
-        """Pixel art logo for Basketball - Miami Heat style"""
-        # Colors for Miami Heat logo
-        red = (200, 30, 45)  # Heat red
-        maroon = (150, 20, 35)
-        black = (20, 20, 20)
-        orange = (255, 100, 0)
-        white = (255, 255, 255)
-        
-        # Basketball hoop/ring (top)
-        ring = [
-            [0, 0, 1, 1, 1, 1, 1, 1, 0, 0],
-            [0, 1, 0, 0, 0, 0, 0, 0, 1, 0],
-            [1, 0, 0, 0, 0, 0, 0, 0, 0, 1]
-        ]
-        for dy in range(len(ring)):
-            for dx in range(len(ring[dy])):
-                if ring[dy][dx]:
-                    self.grid.set_pixel(x + dx, y + dy, black)
-        
-        # Flame/heat shape (red basketball-like shape)
-        flame = [
-            [0, 0, 0, 0, 1, 1, 0, 0, 0, 0],
-            [0, 0, 0, 1, 2, 2, 1, 0, 0, 0],
-            [0, 0, 1, 2, 2, 2, 2, 1, 0, 0],
-            [0, 1, 2, 2, 2, 2, 2, 2, 1, 0],
-            [0, 1, 2, 2, 2, 2, 2, 2, 1, 0],
-            [0, 0, 1, 2, 2, 2, 2, 1, 0, 0],
-            [0, 0, 0, 1, 2, 2, 1, 0, 0, 0]
-        ]
-        for dy in range(len(flame)):
-            for dx in range(len(flame[dy])):
-                if flame[dy][dx] == 1:
-                    self.grid.set_pixel(x + dx, y + dy + 1, maroon)
-                elif flame[dy][dx] == 2:
-                    self.grid.set_pixel(x + dx, y + dy + 1, red)
-
-    def _render_pet_logo(self, x: int, y: int):
-        """Pixel art logo for Pets - simple pawprint"""
-        pink = (255, 120, 180)
-        dark = (180, 60, 120)
-
-        # Toe beans
-        toes = [(2, 1), (4, 0), (6, 0), (8, 1)]
-        for tx, ty in toes:
-            self.grid.set_pixel(x + tx, y + ty, pink)
-            self.grid.set_pixel(x + tx, y + ty + 1, dark)
-
-        # Paw pad
-        pad = [
-            (4, 3), (5, 3), (6, 3),
-            (3, 4), (4, 4), (5, 4), (6, 4), (7, 4),
-            (3, 5), (4, 5), (5, 5), (6, 5), (7, 5),
-            (4, 6), (5, 6), (6, 6),
-        ]
-        for i, (px, py) in enumerate(pad):
-            self.grid.set_pixel(x + px, y + py, pink if i % 2 == 0 else dark)
-
-    def _render_vacay_logo(self, x: int, y: int):
-        """Pixel art logo for Vacation - small sun + waves."""
-        sun = (255, 220, 80)
-        sky = (80, 160, 255)
-        wave = (120, 220, 255)
-        sand = (200, 160, 80)
-
-        # sky strip
-        for dx in range(10):
-            self.grid.set_pixel(x + dx, y + 0, sky)
-
-        # sun
-        self.grid.set_pixel(x + 7, y + 1, sun)
-        self.grid.set_pixel(x + 6, y + 1, sun)
-        self.grid.set_pixel(x + 7, y + 2, sun)
-
-        # waves
-        for dx in range(10):
-            if dx % 2 == 0:
-                self.grid.set_pixel(x + dx, y + 3, wave)
-        for dx in range(10):
-            self.grid.set_pixel(x + dx, y + 4, (0, 120, 200))
-
-        # sand
-        for dx in range(10):
-            self.grid.set_pixel(x + dx, y + 5, sand)
-
-    def _render_fight_logo(self, x: int, y: int):
-        """Pixel art logo for Fight - two stick heads facing each other."""
-        left = (255, 255, 255)
-        right = (30, 30, 30)
-        mid = (255, 255, 0)
-        # heads
-        self.grid.set_pixel(x + 2, y + 2, left)
-        self.grid.set_pixel(x + 7, y + 2, right)
-        # bodies
-        self.grid.set_pixel(x + 2, y + 4, left)
-        self.grid.set_pixel(x + 7, y + 4, right)
-        # VS
-        self.grid.set_pixel(x + 4, y + 3, mid)
-        self.grid.set_pixel(x + 5, y + 3, mid)
-
-    def _render_race_logo(self, x: int, y: int):
-        """Pixel art logo for Race - small road + car."""
-        road = (80, 80, 80)
-        edge = (220, 220, 220)
-        car1 = (60, 200, 255)
-
-        # road taper
-        for dy in range(0, 8):
-            hw = 1 + dy // 2
-            cy = y + dy
-            cx = x + 5
-            for dx in range(-hw, hw + 1):
-                self.grid.set_pixel(cx + dx, cy, road)
-            self.grid.set_pixel(cx - hw, cy, edge)
-            self.grid.set_pixel(cx + hw, cy, edge)
-
-        # car
-        self.grid.set_pixel(x + 4, y + 6, car1)
-        self.grid.set_pixel(x + 5, y + 6, (20, 120, 200))
-        self.grid.set_pixel(x + 4, y + 7, (20, 120, 200))
-        self.grid.set_pixel(x + 5, y + 7, car1)
+        sprite = self._logo_sprites[game_index]
+        if sprite is not None:
+            draw_sprite(self.grid, sprite, x, y)
+        else:
+            xs, ys, colors = _LOGOS[game_index]
+            self.grid.set_pixels(xs + x, ys + y, colors)
     
     def handle_input(self, keys, events):
         """Handle carousel navigation"""
@@ -26,15 +26,25 @@ Controls:
 
 from __future__ import annotations
 
+import numpy as np
 import pygame
 
 from games.base_game import Game
-from games.menu import CarouselMenu
+from games.menu import GAME_NAMES, CarouselMenu
+from games.overlay_editor import OverlayEditor
 from games.sound import play_beep
 from games.sprite_store import Sprite, get_sprite_store, draw_sprite
 
 
+def _bake(editor) -> None:
+    editor._bake_from_base()
+    play_beep(740, 60)
+
+
 class MenuCardEditor(Game):
+    # Same editing keys as the overlay editor, plus B to bake the base card
+    _KEY_ACTIONS = {**OverlayEditor._KEY_ACTIONS, pygame.K_b: _bake}
+
     def __init__(self, grid, game_index: int):
         super().__init__(grid)
 
@@ -43,12 +53,9 @@ class MenuCardEditor(Game):
         self.store = get_sprite_store()
 
         # Overlay sprite covers y=2..18 (17 rows)
-        self.sprite_name = ""
-        try:
-            # CarouselMenu is the source of truth for names.
-            tmp_menu = CarouselMenu(self.grid, game_manager=None)
-            self.sprite_name = f"menu_card_{tmp_menu.games[self.game_index]['name']}"
-        except Exception:
+        if 0 <= self.game_index < len(GAME_NAMES):
+            self.sprite_name = f"menu_card_{GAME_NAMES[self.game_index]}"
+        else:
             self.sprite_name = f"menu_card_{self.game_index}"
 
         self.w = 19
@@ -70,47 +77,45 @@ class MenuCardEditor(Game):
             (80, 80, 80),
         ]
         self.p_index = 0
+        self._palette_rgb = np.array(self.palette, dtype=np.uint8)
 
-        # Use menu renderer to show a live card preview underneath.
+        # Use menu renderer to show a card preview underneath. Only the overlay is
+        # edited here, so the card itself is rendered once (see _base_card_pixels).
         self._menu_preview = CarouselMenu(self.grid, game_manager=None)
+        self._base_card: np.ndarray | None = None
 
         # If user wants to start from the existing card, they can bake it.
         # (We avoid doing this automatically to keep the overlay non-destructive.)
 
+    def _base_card_pixels(self) -> np.ndarray:
+        """The card as the menu renders it without our overlay, on a black grid."""
+        if self._base_card is None:
+            saved_pixels = self.grid.pixels
+            saved_overlay = None
+            try:
+                # Temporarily remove our overlay from the store so menu render doesn't include it.
+                saved_overlay = getattr(self.store, "_sprites", {}).pop(self.sprite_name, None)
+                self._menu_preview.refresh_sprites()
+
+                self.grid.pixels = np.zeros_like(saved_pixels)
+                self._menu_preview.grid = self.grid
+                self._menu_preview._render_game_card(self.game_index, float(self.game_index))
+                self._base_card = self.grid.pixels
+            finally:
+                self.grid.pixels = saved_pixels
+                if saved_overlay is not None:
+                    getattr(self.store, "_sprites", {})[self.sprite_name] = saved_overlay
+        return self._base_card
+
     def _bake_from_base(self) -> None:
         """Bake the current base card render into the overlay sprite.
 
         This gives you a full starting point to tweak pixels from.
         """
-        saved_overlay = None
-        try:
-            # Temporarily remove our overlay from the store so menu render doesn't include it.
-            saved_overlay = getattr(self.store, "_sprites", {}).pop(self.sprite_name, None)
-
-            self.grid.clear((0, 0, 0))
-            self._menu_preview._render_game_card(self.game_index, float(self.game_index))
-
-            for y in range(self.h):
-                for x in range(self.w):
-                    c = self.grid.get_pixel(x, y + 2)
-                    if c != (0, 0, 0):
-                        self.sprite.set(x, y, c)
-                    else:
-                        self.sprite.set(x, y, None)
-        finally:
-            if saved_overlay is not None:
-                getattr(self.store, "_sprites", {})[self.sprite_name] = saved_overlay
-
-    def _screen_to_grid(self, sx: int, sy: int) -> tuple[int, int] | None:
-        try:
-            lx = int((sx - self.grid.offset_x) / (self.grid.led_size + self.grid.led_spacing))
-            ly = int((sy - self.grid.offset_y) / (self.grid.led_size + self.grid.led_spacing))
-        except Exception:
-            return None
-
-        if 0 <= lx < self.grid.grid_size and 0 <= ly < self.grid.grid_size:
-            return (lx, ly)
-        return None
+        # Lit pixels become painted overlay pixels; black ones become transparent.
+        rgb = self._base_card_pixels()[2:2 + self.h, :self.w]
+        self.sprite.data[..., :3] = rgb
+        self.sprite.data[..., 3] = np.where(rgb.any(axis=2), 255, 0)
 
     def _grid_to_overlay_xy(self, gx: int, gy: int) -> tuple[int, int] | None:
         # Overlay starts at y=2
@@ -126,22 +131,19 @@ class MenuCardEditor(Game):
         pass
 
     def render(self):
-        # Render base card
-        self._menu_preview.grid = self.grid
-        self._menu_preview.grid.clear((0, 0, 0))
-        # Draw ONLY the selected card centered (x_shift=0)
-        self._menu_preview._render_game_card(self.game_index, float(self.game_index))
+        # Render base card: ONLY the selected card centered (x_shift=0)
+        self.grid.pixels[:] = self._base_card_pixels()
 
         # Apply overlay sprite
         draw_sprite(self.grid, self.sprite, 0, 2)
 
         # Palette UI on top row (y=0)
-        for i, c in enumerate(self.palette):
-            if i >= self.grid.grid_size:
-                break
-            self.grid.set_pixel(i, 0, c)
-            # selection marker
-            self.grid.set_pixel(i, 1, (255, 255, 0) if i == self.p_index else (20, 20, 20))
+        n = min(len(self.palette), self.grid.grid_size)
+        self.grid.pixels[0, :n] = self._palette_rgb[:n]
+        # selection marker
+        self.grid.pixels[1, :n] = (20, 20, 20)
+        if self.p_index < n:
+            self.grid.pixels[1, self.p_index] = (255, 255, 0)
 
         # Cursor highlight (within overlay area)
         cur_gx = self.cx
@@ -155,7 +157,7 @@ class MenuCardEditor(Game):
                 if pos is None:
                     continue
 
-                grid_xy = self._screen_to_grid(pos[0], pos[1])
+                grid_xy = self.grid.screen_to_grid(pos[0], pos[1])
                 if grid_xy is None:
                     continue
 
@@ -187,26 +189,6 @@ class MenuCardEditor(Game):
                 self.running = False
                 return
 
-            if event.key == pygame.K_LEFT:
-                self.cx = max(0, self.cx - 1)
-            elif event.key == pygame.K_RIGHT:
-                self.cx = min(self.w - 1, self.cx + 1)
-            elif event.key == pygame.K_UP:
-                self.cy = max(0, self.cy - 1)
-            elif event.key == pygame.K_DOWN:
-                self.cy = min(self.h - 1, self.cy + 1)
-            elif event.key == pygame.K_c:
-                self.p_index = (self.p_index + 1) % len(self.palette)
-                play_beep(520, 20)
-            elif event.key == pygame.K_SPACE:
-                self.sprite.set(self.cx, self.cy, self.palette[self.p_index])
-                play_beep(660, 20)
-            elif event.key == pygame.K_BACKSPACE:
-                self.sprite.set(self.cx, self.cy, None)
-                play_beep(320, 20)
-            elif event.key == pygame.K_s:
-                self.store.save()
-                play_beep(880, 40)
-            elif event.key == pygame.K_b:
-                self._bake_from_base()
-                play_beep(740, 60)
\ No newline at end of file
+            action = self._KEY_ACTIONS.get(event.key)
+            if action is not None:
+                action(self)
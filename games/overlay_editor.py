@@ -18,6 +18,7 @@ Mouse:
 
 from __future__ import annotations
 
+import numpy as np
 import pygame
 
 from games.base_game import Game
@@ -25,7 +26,48 @@ from games.sound import play_beep
 from games.sprite_store import Sprite, get_sprite_store, draw_sprite
 
 
+def _move_cursor(dx: int, dy: int):
+    """Key action moving the cursor by (dx, dy), clamped to the sprite."""
+    def action(editor) -> None:
+        editor.cx = max(0, min(editor.w - 1, editor.cx + dx))
+        editor.cy = max(0, min(editor.h - 1, editor.cy + dy))
+    return action
+
+
+def _cycle_palette(editor) -> None:
+    editor.p_index = (editor.p_index + 1) % len(editor.palette)
+    play_beep(520, 20)
+
+
+def _paint(editor) -> None:
+    editor.sprite.set(editor.cx, editor.cy, editor.palette[editor.p_index])
+    play_beep(660, 20)
+
+
+def _erase(editor) -> None:
+    editor.sprite.set(editor.cx, editor.cy, None)
+    play_beep(320, 20)
+
+
+def _save(editor) -> None:
+    editor.store.save()
+    play_beep(880, 40)
+
+
 class OverlayEditor(Game):
+    # KEYDOWN handlers by key (ESC is handled in handle_input). MenuCardEditor
+    # shares these, so they only rely on the attributes both editors have.
+    _KEY_ACTIONS = {
+        pygame.K_LEFT: _move_cursor(-1, 0),
+        pygame.K_RIGHT: _move_cursor(1, 0),
+        pygame.K_UP: _move_cursor(0, -1),
+        pygame.K_DOWN: _move_cursor(0, 1),
+        pygame.K_c: _cycle_palette,
+        pygame.K_SPACE: _paint,
+        pygame.K_BACKSPACE: _erase,
+        pygame.K_s: _save,
+    }
+
     def __init__(self, grid, sprite_name: str, w: int, h: int):
         super().__init__(grid)
 
@@ -50,6 +92,7 @@ class OverlayEditor(Game):
             (80, 80, 80),
         ]
         self.p_index = 0
+        self._palette_rgb = np.array(self.palette, dtype=np.uint8)
 
         # Reserve top rows for UI so palette never conflicts with sprite area.
         self._ui_rows = 2
@@ -63,21 +106,6 @@ class OverlayEditor(Game):
             return (sx, sy)
         return None
 
-    def _screen_to_grid(self, sx: int, sy: int) -> tuple[int, int] | None:
-        """Convert pygame screen pixel coords into LED grid coords.
-
-        This uses the LEDGrid layout parameters, so clicks hit the actual LED cell.
-        """
-        try:
-            lx = int((sx - self.grid.offset_x) / (self.grid.led_size + self.grid.led_spacing))
-            ly = int((sy - self.grid.offset_y) / (self.grid.led_size + self.grid.led_spacing))
-        except Exception:
-            return None
-
-        if 0 <= lx < self.grid.grid_size and 0 <= ly < self.grid.grid_size:
-            return (lx, ly)
-        return None
-
     def update(self, dt: float):
         pass
 
@@ -85,11 +113,11 @@ class OverlayEditor(Game):
         self.grid.clear((0, 0, 0))
 
         # Palette row on top (clickable)
-        for i, c in enumerate(self.palette):
-            if i >= self.grid.grid_size:
-                break
-            self.grid.set_pixel(i, 0, c)
-            self.grid.set_pixel(i, 1, (255, 255, 0) if i == self.p_index else (20, 20, 20))
+        n = min(len(self.palette), self.grid.grid_size)
+        self.grid.pixels[0, :n] = self._palette_rgb[:n]
+        self.grid.pixels[1, :n] = (20, 20, 20)
+        if self.p_index < n:
+            self.grid.pixels[1, self.p_index] = (255, 255, 0)
 
         frame_top = self._ui_rows
 
@@ -124,7 +152,7 @@ class OverlayEditor(Game):
             if event.type == pygame.MOUSEBUTTONDOWN:
                 pos = getattr(event, "pos", None)
                 if pos is not None:
-                    grid_xy = self._screen_to_grid(pos[0], pos[1])
+                    grid_xy = self.grid.screen_to_grid(pos[0], pos[1])
                     if grid_xy is not None:
                         # Palette clicks
                         if grid_xy[1] == 0 and 0 <= grid_xy[0] < len(self.palette):
@@ -150,23 +178,6 @@ class OverlayEditor(Game):
                 self.running = False
                 return
 
-            if event.key == pygame.K_LEFT:
-                self.cx = max(0, self.cx - 1)
-            elif event.key == pygame.K_RIGHT:
-                self.cx = min(self.w - 1, self.cx + 1)
-            elif event.key == pygame.K_UP:
-                self.cy = max(0, self.cy - 1)
-            elif event.key == pygame.K_DOWN:
-                self.cy = min(self.h - 1, self.cy + 1)
-            elif event.key == pygame.K_c:
-                self.p_index = (self.p_index + 1) % len(self.palette)
-                play_beep(520, 20)
-            elif event.key == pygame.K_SPACE:
-                self.sprite.set(self.cx, self.cy, self.palette[self.p_index])
-                play_beep(660, 20)
-            elif event.key == pygame.K_BACKSPACE:
-                self.sprite.set(self.cx, self.cy, None)
-                play_beep(320, 20)
-            elif event.key == pygame.K_s:
-                self.store.save()
-                play_beep(880, 40)
\ No newline at end of file
+            action = self._KEY_ACTIONS.get(event.key)
+            if action is not None:
+                action(self)
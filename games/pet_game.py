@@ -14,25 +14,135 @@ Mechanics:
 
 from __future__ import annotations
 
+import numpy as np
 import pygame
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Tuple
 
-from games.base_game import Game
+from games.base_game import NAV_ARROWS, Game, bake_pixels
 from games.sound import play_beep
 
 
 Color = Tuple[int, int, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class PetState:
     name: str
     primary_color: Color
     accent_color: Color
-    hunger: float = 7.0
-    happiness: float = 7.0
-    energy: float = 7.0
+    # hunger, happiness, energy; PetGame passes rows of its shared stats array
+    stats: np.ndarray = field(default_factory=lambda: np.full(3, 7.0))
+
+    @property
+    def hunger(self) -> float:
+        return float(self.stats[0])
+
+    @hunger.setter
+    def hunger(self, value: float):
+        self.stats[0] = value
+
+    @property
+    def happiness(self) -> float:
+        return float(self.stats[1])
+
+    @happiness.setter
+    def happiness(self, value: float):
+        self.stats[1] = value
+
+    @property
+    def energy(self) -> float:
+        return float(self.stats[2])
+
+    @energy.setter
+    def energy(self, value: float):
+        self.stats[2] = value
+
+
+def _draw_dog(put, x: int, y: int, c: Color, a: Color):
+    # Simple dog face
+    # Ears
+    put(x + 0, y + 0, c)
+    put(x + 1, y + 1, c)
+    put(x + 8, y + 0, c)
+    put(x + 7, y + 1, c)
+    # Head
+    for dx in range(2, 7):
+        put(x + dx, y + 1, c)
+    for dx in range(1, 8):
+        put(x + dx, y + 2, c)
+        put(x + dx, y + 3, c)
+    # Eyes
+    put(x + 3, y + 2, (0, 0, 0))
+    put(x + 6, y + 2, (0, 0, 0))
+    # Snout
+    put(x + 4, y + 4, a)
+    put(x + 5, y + 4, a)
+    put(x + 4, y + 5, a)
+    put(x + 5, y + 5, a)
+    # Nose
+    put(x + 4, y + 4, (40, 40, 40))
+
+
+def _draw_cat(put, x: int, y: int, c: Color, a: Color):
+    # Cat head with pointy ears
+    put(x + 2, y + 0, c)
+    put(x + 6, y + 0, c)
+    put(x + 1, y + 1, c)
+    put(x + 7, y + 1, c)
+    # Head block
+    for dx in range(2, 7):
+        put(x + dx, y + 1, c)
+    for dx in range(1, 8):
+        put(x + dx, y + 2, c)
+        put(x + dx, y + 3, c)
+    # Eyes
+    put(x + 3, y + 2, (0, 0, 0))
+    put(x + 5, y + 2, (0, 0, 0))
+    # Nose
+    put(x + 4, y + 3, a)
+    # Whiskers
+    put(x + 0, y + 3, a)
+    put(x + 1, y + 3, a)
+    put(x + 7, y + 3, a)
+    put(x + 8, y + 3, a)
+
+
+def _draw_dino(put, x: int, y: int, c: Color, a: Color):
+    # Tiny dino profile: head + body + spikes
+    # Spikes
+    put(x + 2, y + 0, a)
+    put(x + 3, y + 1, a)
+    put(x + 4, y + 0, a)
+    # Head
+    for dx in range(2, 7):
+        put(x + dx, y + 2, c)
+    for dx in range(1, 7):
+        put(x + dx, y + 3, c)
+    # Eye
+    put(x + 5, y + 2, (0, 0, 0))
+    # Body
+    for dx in range(2, 9):
+        put(x + dx, y + 4, c)
+    for dx in range(3, 8):
+        put(x + dx, y + 5, c)
+    # Tail
+    put(x + 9, y + 4, c)
+    # Legs
+    put(x + 4, y + 6, c)
+    put(x + 6, y + 6, c)
+
+
+_SPRITE_DRAWERS = {"DOG": _draw_dog, "CAT": _draw_cat, "DINO": _draw_dino}
+
+# Stat bars for hunger, happiness and energy: colors, their dim backgrounds, and
+# the (xs, ys) of the three 5-wide bars on row 18 followed by their labels above
+_STAT_COLORS = np.array([(255, 180, 0), (255, 80, 180), (80, 160, 255)], dtype=np.uint8)
+_STAT_DIMS = np.maximum(10, _STAT_COLORS // 5).astype(np.uint8)
+_STAT_PIXELS = (
+    np.array([x + i for x in (1, 7, 13) for i in range(5)] + [1, 7, 13]),
+    np.array([18] * 15 + [17] * 3),
+)
 
 
 class PetGame(Game):
@@ -41,29 +151,31 @@ class PetGame(Game):
     def __init__(self, grid):
         super().__init__(grid)
 
+        # One row of (hunger, happiness, energy) per pet, decayed together
+        self._stats = np.full((3, 3), 7.0)
         self.pets = [
-            PetState("DOG", (210, 150, 90), (255, 255, 255)),
-            PetState("CAT", (180, 180, 180), (255, 120, 180)),
-            PetState("DINO", (60, 200, 90), (255, 240, 120)),
+            PetState("DOG", (210, 150, 90), (255, 255, 255), self._stats[0]),
+            PetState("CAT", (180, 180, 180), (255, 120, 180), self._stats[1]),
+            PetState("DINO", (60, 200, 90), (255, 240, 120), self._stats[2]),
         ]
         self.selected_index = 0
 
-        # Stat decay tuning (per second)
-        self.hunger_decay = 0.30
-        self.happiness_decay = 0.18
-        self.energy_decay = 0.22
+        # Each pet's sprite never changes, so draw it once up front (indexed like pets)
+        self._sprites = [
+            bake_pixels(_SPRITE_DRAWERS[pet.name], pet.primary_color, pet.accent_color)
+            for pet in self.pets
+        ]
+
+        # Stat decay tuning (per second): hunger, happiness, energy
+        self.stat_decay = np.array([0.30, 0.18, 0.22])
 
         # Small UI feedback
         self.action_message = ""
         self.action_timer = 0.0
 
     def update(self, dt: float):
-        pet = self.pets[self.selected_index]
-
-        # Natural decay over time
-        pet.hunger = self._clamp_stat(pet.hunger - self.hunger_decay * dt)
-        pet.happiness = self._clamp_stat(pet.happiness - self.happiness_decay * dt)
-        pet.energy = self._clamp_stat(pet.energy - self.energy_decay * dt)
+        # Natural decay over time, for every pet (not just the one on screen)
+        np.clip(self._stats - self.stat_decay * dt, 0.0, 10.0, out=self._stats)
 
         if self.action_timer > 0:
             self.action_timer = max(0.0, self.action_timer - dt)
@@ -71,33 +183,33 @@ class PetGame(Game):
                 self.action_message = ""
 
     def render(self):
+        pet = self.pets[self.selected_index]
+
+        # Only the pet, the rounded stats and the message change the picture
+        hunger = int(round(pet.hunger))
+        happiness = int(round(pet.happiness))
+        energy = int(round(pet.energy))
+        frame_key = (self.selected_index, hunger, happiness, energy, self.action_message)
+        if self._frame_unchanged(frame_key):
+            return
+
         # Dark blue background for contrast
         self.grid.clear((0, 0, 10))
 
-        pet = self.pets[self.selected_index]
-
         # Title / pet name
         self.grid.render_text("PETS", 2, 0, (120, 200, 255), scale=1)
         self.grid.render_text(pet.name, 2, 6, (0, 255, 255), scale=1)
 
         # Pet sprite
-        if pet.name == "DOG":
-            self._render_dog(4, 8, pet.primary_color, pet.accent_color)
-        elif pet.name == "CAT":
-            self._render_cat(4, 8, pet.primary_color, pet.accent_color)
-        else:
-            self._render_dino(4, 8, pet.primary_color, pet.accent_color)
-
-        # Stats bars (H/HAP/E)
-        stats_y = 18
-        self._render_stat_bar(1, stats_y, int(round(pet.hunger)), (255, 180, 0))
-        self._render_stat_bar(7, stats_y, int(round(pet.happiness)), (255, 80, 180))
-        self._render_stat_bar(13, stats_y, int(round(pet.energy)), (80, 160, 255))
-
-        # Labels (tiny)
-        self.grid.set_pixel(1, stats_y - 1, (255, 180, 0))
-        self.grid.set_pixel(7, stats_y - 1, (255, 80, 180))
-        self.grid.set_pixel(13, stats_y - 1, (80, 160, 255))
+        xs, ys, colors = self._sprites[self.selected_index]
+        self.grid.set_pixels(xs + 4, ys + 8, colors)
+
+        # Stats bars (H/HAP/E) with their labels, in one batch
+        # 5 pixels wide bar (0..10 => 0..5 with half steps) over a dim background
+        levels = np.clip((hunger, happiness, energy), 0, 10)
+        lit = np.arange(5) < np.rint(levels / 2)[:, None]
+        bars = np.where(lit[..., None], _STAT_COLORS[:, None], _STAT_DIMS[:, None])
+        self.grid.set_pixels(*_STAT_PIXELS, np.concatenate((bars.reshape(-1, 3), _STAT_COLORS)))
 
         # Action message
         if self.action_message:
@@ -105,9 +217,9 @@ class PetGame(Game):
             self.grid.render_text(self.action_message, 1, 1, (255, 255, 0), scale=1)
 
         # Simple navigation hint arrows
-        arrow_color = (120, 120, 120)
-        self._render_left_arrow(1, 10, arrow_color)
-        self._render_right_arrow(17, 10, arrow_color)
+        self.grid.set_pixels(*NAV_ARROWS, (120, 120, 120))
+
+        self._remember_frame(frame_key)
 
     def handle_input(self, keys, events):
         for event in events:
@@ -134,127 +246,25 @@ class PetGame(Game):
     # --- actions ---
 
     def _feed(self):
-        pet = self.pets[self.selected_index]
-        pet.hunger = self._clamp_stat(pet.hunger + 3.0)
-        pet.energy = self._clamp_stat(pet.energy + 0.5)
-        pet.happiness = self._clamp_stat(pet.happiness - 0.3)
+        self._adjust_stats(3.0, -0.3, 0.5)
         play_beep(660, 60)
         self._flash_message("FED")
 
     def _play(self):
-        pet = self.pets[self.selected_index]
-        pet.happiness = self._clamp_stat(pet.happiness + 3.0)
-        pet.energy = self._clamp_stat(pet.energy - 1.2)
-        pet.hunger = self._clamp_stat(pet.hunger - 0.8)
+        self._adjust_stats(-0.8, 3.0, -1.2)
         play_beep(740, 60)
         self._flash_message("PLAY")
 
     def _rest(self):
-        pet = self.pets[self.selected_index]
-        pet.energy = self._clamp_stat(pet.energy + 3.0)
-        pet.happiness = self._clamp_stat(pet.happiness + 0.4)
-        pet.hunger = self._clamp_stat(pet.hunger - 0.5)
+        self._adjust_stats(-0.5, 0.4, 3.0)
         play_beep(520, 60)
         self._flash_message("REST")
 
-    def _render_left_arrow(self, x: int, y: int, color: Color):
-        pts = [(0, 0), (1, -1), (1, 1), (2, -2), (2, 2)]
-        for dx, dy in pts:
-            self.grid.set_pixel(x + dx, y + dy, color)
-
-    def _render_right_arrow(self, x: int, y: int, color: Color):
-        pts = [(0, 0), (-1, -1), (-1, 1), (-2, -2), (-2, 2)]
-        for dx, dy in pts:
-            self.grid.set_pixel(x + dx, y + dy, color)
+    def _adjust_stats(self, hunger: float, happiness: float, energy: float):
+        """Add to the selected pet's stats, keeping them within 0..10"""
+        stats = self._stats[self.selected_index]
+        np.clip(stats + (hunger, happiness, energy), 0.0, 10.0, out=stats)
 
     def _flash_message(self, msg: str):
         self.action_message = msg
         self.action_timer = 0.8
-
-    # --- rendering helpers ---
-
-    def _render_stat_bar(self, x: int, y: int, value_0_to_10: int, color: Color):
-        # 5 pixels wide bar (0..10 => 0..5 with half steps)
-        # We'll show a 5-wide bar plus a dim background.
-        value = max(0, min(10, value_0_to_10))
-        filled = int(round(value / 2))
-        dim = (max(10, color[0] // 5), max(10, color[1] // 5), max(10, color[2] // 5))
-        for i in range(5):
-            self.grid.set_pixel(x + i, y, dim)
-        for i in range(filled):
-            self.grid.set_pixel(x + i, y, color)
-
-    def _render_dog(self, x: int, y: int, c: Color, a: Color):
-        # Simple dog face
-        # Ears
-        self.grid.set_pixel(x + 0, y + 0, c)
-        self.grid.set_pixel(x + 1, y + 1, c)
-        self.grid.set_pixel(x + 8, y + 0, c)
-        self.grid.set_pixel(x + 7, y + 1, c)
-        # Head
-        for dx in range(2, 7):
-            self.grid.set_pixel(x + dx, y + 1, c)
-        for dx in range(1, 8):
-            self.grid.set_pixel(x + dx, y + 2, c)
-            self.grid.set_pixel(x + dx, y + 3, c)
-        # Eyes
-        self.grid.set_pixel(x + 3, y + 2, (0, 0, 0))
-        self.grid.set_pixel(x + 6, y + 2, (0, 0, 0))
-        # Snout
-        self.grid.set_pixel(x + 4, y + 4, a)
-        self.grid.set_pixel(x + 5, y + 4, a)
-        self.grid.set_pixel(x + 4, y + 5, a)
-        self.grid.set_pixel(x + 5, y + 5, a)
-        # Nose
-        self.grid.set_pixel(x + 4, y + 4, (40, 40, 40))
-
-    def _render_cat(self, x: int, y: int, c: Color, a: Color):
-        # Cat head with pointy ears
-        self.grid.set_pixel(x + 2, y + 0, c)
-        self.grid.set_pixel(x + 6, y + 0, c)
-        self.grid.set_pixel(x + 1, y + 1, c)
-        self.grid.set_pixel(x + 7, y + 1, c)
-        # Head block
-        for dx in range(2, 7):
-            self.grid.set_pixel(x + dx, y + 1, c)
-        for dx in range(1, 8):
-            self.grid.set_pixel(x + dx, y + 2, c)
-            self.grid.set_pixel(x + dx, y + 3, c)
-        # Eyes
-        self.grid.set_pixel(x + 3, y + 2, (0, 0, 0))
-        self.grid.set_pixel(x + 5, y + 2, (0, 0, 0))
-        # Nose
-        self.grid.set_pixel(x + 4, y + 3, a)
-        # Whiskers
-        self.grid.set_pixel(x + 0, y + 3, a)
-        self.grid.set_pixel(x + 1, y + 3, a)
-        self.grid.set_pixel(x + 7, y + 3, a)
-        self.grid.set_pixel(x + 8, y + 3, a)
-
-    def _render_dino(self, x: int, y: int, c: Color, a: Color):
-        # Tiny dino profile: head + body + spikes
-        # Spikes
-        self.grid.set_pixel(x + 2, y + 0, a)
-        self.grid.set_pixel(x + 3, y + 1, a)
-        self.grid.set_pixel(x + 4, y + 0, a)
-        # Head
-        for dx in range(2, 7):
-            self.grid.set_pixel(x + dx, y + 2, c)
-        for dx in range(1, 7):
-            self.grid.set_pixel(x + dx, y + 3, c)
-        # Eye
-        self.grid.set_pixel(x + 5, y + 2, (0, 0, 0))
-        # Body
-        for dx in range(2, 9):
-            self.grid.set_pixel(x + dx, y + 4, c)
-        for dx in range(3, 8):
-            self.grid.set_pixel(x + dx, y + 5, c)
-        # Tail
-        self.grid.set_pixel(x + 9, y + 4, c)
-        # Legs
-        self.grid.set_pixel(x + 4, y + 6, c)
-        self.grid.set_pixel(x + 6, y + 6, c)
-
-    @staticmethod
-    def _clamp_stat(v: float) -> float:
-        return max(0.0, min(10.0, v))
@@ -3,13 +3,95 @@ Pong Game - Full implementation with animations, scoring, and sound
 """
 import pygame
 import random
+from collections import deque
 import math
-from games.base_game import Game, hsv_to_rgb
+import numpy as np
+from games.base_game import FULL_HUE_RGB, Game, hsv_to_rgb_array
+from games.sound import mixer_samples
+
+
+_SAMPLE_RATE = 22050
+
+# Pong's sound effects, generated by the first game that gets a working mixer
+_sound_cache = {}
+
+# Dimmed pastel color for each whole degree of hue, for the game-over rainbow
+# (the ball trail scales base_game's FULL_HUE_RGB by its fade instead)
+_GAME_OVER_HUES = hsv_to_rgb_array(np.arange(360), 0.5, 0.3)
+
+
+def _tone(frequency: float, duration: float) -> np.ndarray:
+    """Sine tone as signed 16-bit little-endian samples at 30% volume"""
+    n_samples = int(round(duration * _SAMPLE_RATE))
+    phase = 2.0 * np.pi * frequency * np.arange(n_samples) / _SAMPLE_RATE
+    return (32767.0 * 0.3 * np.sin(phase)).astype("<i2")
+
+
+def _mute(sound):
+    """Stands in for Sound.play when the mixer couldn't be initialized"""
+
+
+def _step_ball(x, y, vx, vy, dt, left_paddle_y, right_paddle_y, spin, max_vy, grid_size):
+    """Advance the ball by dt and bounce it off the walls and paddles.
+    
+    Plain float math on locals, kept apart from sound and scoring so the
+    per-frame physics does no attribute lookups. spin holds the vertical
+    speed added for a hit on each paddle row (its length is the paddle
+    height) and max_vy caps the result. Returns the new (x, y, vx, vy), the
+    cell the ball moved through before bouncing (for the trail), and whether
+    it hit a wall and a paddle.
+    """
+    x += vx * dt
+    y += vy * dt
+    trail_point = (int(x), int(y))
+    
+    # Ball collision with top/bottom walls
+    hit_wall = y <= 0 or y >= grid_size - 1
+    if hit_wall:
+        vy *= -1
+        y = max(0, min(grid_size - 1, y))
+    
+    # Ball collision with paddles; spin is looked up by the whole rows
+    # between the paddle's top and the ball
+    ball_x_int = int(x)
+    ball_y_int = int(y)
+    hit_paddle = False
+    paddle_height = len(spin)
+    
+    # Left paddle collision
+    if ball_x_int <= 1 and left_paddle_y <= ball_y_int < left_paddle_y + paddle_height:
+        vx = abs(vx)
+        x = 2
+        vy = max(-max_vy, min(max_vy, vy + spin[int(ball_y_int - left_paddle_y)]))
+        hit_paddle = True
+    
+    # Right paddle collision
+    if ball_x_int >= grid_size - 2 and right_paddle_y <= ball_y_int < right_paddle_y + paddle_height:
+        vx = -abs(vx)
+        x = grid_size - 3
+        vy = max(-max_vy, min(max_vy, vy + spin[int(ball_y_int - right_paddle_y)]))
+        hit_paddle = True
+    
+    return x, y, vx, vy, trail_point, hit_wall, hit_paddle
 
 
 class Pong(Game):
     """Classic Pong game with advanced features"""
     
+    # Every attribute is read each frame; slots keep the lookups cheap
+    __slots__ = (
+        "mode_selected", "mode_index", "two_player_mode",
+        "paddle_height", "paddle_speed", "left_paddle_y", "right_paddle_y",
+        "_paddle_rows", "_paddle_colors", "_center_line",
+        "ball_x", "ball_y", "ball_vx", "ball_vy", "ball_speed",
+        "ball_trail", "max_trail_length", "_spin", "_max_vy",
+        "left_score", "right_score", "max_score",
+        "score_animation_timer", "scoring_player", "_left_flash", "_right_flash",
+        "game_started", "game_over", "winner", "_rainbow_base",
+        "ai_reaction_delay", "ai_timer", "ai_speed",
+        "sound_paddle", "sound_wall", "sound_score", "sound_win", "_play_sound",
+    )
+    
     def __init__(self, grid):
         super().__init__(grid)
         
@@ -25,14 +107,32 @@ class Pong(Game):
         self.left_paddle_y = (self.grid.grid_size - self.paddle_height) // 2
         self.right_paddle_y = (self.grid.grid_size - self.paddle_height) // 2
         
+        # Fixed parts of the play-field batch: paddle rows and colors, center line
+        self._paddle_rows = np.arange(self.paddle_height)
+        self._paddle_colors = np.array(
+            [(0, 255, 255)] * self.paddle_height + [(255, 0, 255)] * self.paddle_height, dtype=float
+        )
+        center_ys = np.arange(0, self.grid.grid_size, 2)
+        self._center_line = (
+            np.full(center_ys.size, self.grid.grid_size // 2),
+            center_ys,
+            np.full((center_ys.size, 3), 50.0),
+        )
+        
         # Ball settings
         self.ball_x = self.grid.grid_size / 2
         self.ball_y = self.grid.grid_size / 2
         self.ball_vx = 0
         self.ball_vy = 0
         self.ball_speed = 8.0
-        self.ball_trail = []  # For multicolored trail effect
         self.max_trail_length = 5
+        self.ball_trail = deque(maxlen=self.max_trail_length)  # For multicolored trail effect
+        
+        # Spin added to the ball's vertical speed for a hit on each paddle row
+        # (-0.5 at the top edge to +0.5 below the middle, times half the speed)
+        hit_pos = np.arange(self.paddle_height) / self.paddle_height
+        self._spin = ((hit_pos - 0.5) * self.ball_speed * 0.5).tolist()
+        self._max_vy = self.ball_speed * 0.8
         
         # Scoring
         self.left_score = 0
@@ -41,6 +141,23 @@ class Pong(Game):
         self.score_animation_timer = 0
         self.scoring_player = None  # 'left' or 'right'
         
+        # Score flash columns fading away from the scorer's edge, [dim, bright]
+        half = self.grid.grid_size // 2
+        left_fade = 1.0 - np.arange(half) / half
+        right_fade = np.arange(self.grid.grid_size - half) / half
+        self._left_flash = [
+            (np.array(color) * left_fade[:, None]).astype(np.uint8)
+            for color in ((0, 150, 150), (0, 255, 255))
+        ]
+        self._right_flash = [
+            (np.array(color) * right_fade[:, None]).astype(np.uint8)
+            for color in ((150, 0, 150), (255, 0, 255))
+        ]
+        
+        # Game-over rainbow hue at time 0, (x + y) * 10; it scrolls by a scalar
+        steps = np.arange(self.grid.grid_size) * 10
+        self._rainbow_base = steps[None, :] + steps[:, None]
+        
         # Game state
         self.game_started = False
         self.game_over = False
@@ -55,62 +172,42 @@ class Pong(Game):
         self.setup_sounds()
     
     def setup_sounds(self):
-        """Initialize pygame mixer and create sound effects"""
-        try:
-            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
-            
-            # Generate simple beep sounds
-            self.sound_paddle = self._generate_beep(440, 0.05)  # A4 note
-            self.sound_wall = self._generate_beep(330, 0.05)    # E4 note
-            self.sound_score = self._generate_beep(220, 0.2)    # A3 note
-            self.sound_win = self._generate_melody()
-        except:
-            # Sound disabled if mixer fails
-            self.sound_paddle = None
-            self.sound_wall = None
-            self.sound_score = None
-            self.sound_win = None
+        """Initialize pygame mixer and create sound effects (once per process)"""
+        if not _sound_cache:
+            try:
+                pygame.mixer.init(frequency=_SAMPLE_RATE, size=-16, channels=2, buffer=512)
+                
+                # Generate simple beep sounds
+                _sound_cache.update(
+                    paddle=self._generate_beep(440, 0.05),  # A4 note
+                    wall=self._generate_beep(330, 0.05),    # E4 note
+                    score=self._generate_beep(220, 0.2),    # A3 note
+                    win=self._generate_melody(),
+                )
+            except:
+                # Sound disabled if mixer fails; the next game tries again
+                pass
+        
+        self.sound_paddle = _sound_cache.get("paddle")
+        self.sound_wall = _sound_cache.get("wall")
+        self.sound_score = _sound_cache.get("score")
+        self.sound_win = _sound_cache.get("win")
+        
+        # Play through the mixer, or not at all, decided once here rather
+        # than checked on every bounce
+        self._play_sound = pygame.mixer.Sound.play if _sound_cache else _mute
     
     def _generate_beep(self, frequency: float, duration: float) -> pygame.mixer.Sound:
         """Generate a simple beep sound"""
-        sample_rate = 22050
-        n_samples = int(round(duration * sample_rate))
-        buf = [int(32767.0 * 0.3 * math.sin(2.0 * math.pi * frequency * i / sample_rate)) 
-               for i in range(n_samples)]
-        
-        # Convert to bytes
-        sound_bytes = bytearray()
-        for sample in buf:
-            sound_bytes.extend(sample.to_bytes(2, byteorder='little', signed=True))
-        
-        return pygame.mixer.Sound(buffer=bytes(sound_bytes))
+        return pygame.mixer.Sound(buffer=mixer_samples(_tone(frequency, duration)))
     
     def _generate_melody(self) -> pygame.mixer.Sound:
         """Generate a victory melody"""
-        sample_rate = 22050
         notes = [440, 554, 659, 880]  # A, C#, E, A (major chord)
         duration = 0.15
         
-        all_samples = []
-        for freq in notes:
-            n_samples = int(round(duration * sample_rate))
-            samples = [int(32767.0 * 0.3 * math.sin(2.0 * math.pi * freq * i / sample_rate)) 
-                      for i in range(n_samples)]
-            all_samples.extend(samples)
-        
-        sound_bytes = bytearray()
-        for sample in all_samples:
-            sound_bytes.extend(sample.to_bytes(2, byteorder='little', signed=True))
-        
-        return pygame.mixer.Sound(buffer=bytes(sound_bytes))
-    
-    def _play_sound(self, sound):
-        """Play a sound if available"""
-        if sound:
-            try:
-                sound.play()
-            except:
-                pass
+        samples = np.concatenate([_tone(freq, duration) for freq in notes])
+        return pygame.mixer.Sound(buffer=mixer_samples(samples))
     
     def reset_ball(self):
         """Reset ball to center with random direction"""
@@ -149,37 +246,20 @@ class Pong(Game):
         if not self.game_started:
             return
         
-        # Update ball position
-        self.ball_x += self.ball_vx * dt
-        self.ball_y += self.ball_vy * dt
+        # Move the ball and bounce it off the walls and paddles
+        (self.ball_x, self.ball_y, self.ball_vx, self.ball_vy,
+         trail_point, hit_wall, hit_paddle) = _step_ball(
+            self.ball_x, self.ball_y, self.ball_vx, self.ball_vy, dt,
+            self.left_paddle_y, self.right_paddle_y,
+            self._spin, self._max_vy, self.grid.grid_size,
+        )
         
-        # Add to trail
-        self.ball_trail.append((int(self.ball_x), int(self.ball_y)))
-        if len(self.ball_trail) > self.max_trail_length:
-            self.ball_trail.pop(0)
+        # Add to trail (the deque drops the oldest point itself)
+        self.ball_trail.append(trail_point)
         
-        # Ball collision with top/bottom walls
-        if self.ball_y <= 0 or self.ball_y >= self.grid.grid_size - 1:
-            self.ball_vy *= -1
-            self.ball_y = max(0, min(self.grid.grid_size - 1, self.ball_y))
+        if hit_wall:
             self._play_sound(self.sound_wall)
-        
-        # Ball collision with paddles
-        ball_x_int = int(self.ball_x)
-        ball_y_int = int(self.ball_y)
-        
-        # Left paddle collision
-        if ball_x_int <= 1 and self.left_paddle_y <= ball_y_int < self.left_paddle_y + self.paddle_height:
-            self.ball_vx = abs(self.ball_vx)
-            self.ball_x = 2
-            self._add_spin(ball_y_int, self.left_paddle_y)
-            self._play_sound(self.sound_paddle)
-        
-        # Right paddle collision
-        if ball_x_int >= self.grid.grid_size - 2 and self.right_paddle_y <= ball_y_int < self.right_paddle_y + self.paddle_height:
-            self.ball_vx = -abs(self.ball_vx)
-            self.ball_x = self.grid.grid_size - 3
-            self._add_spin(ball_y_int, self.right_paddle_y)
+        if hit_paddle:
             self._play_sound(self.sound_paddle)
         
         # Scoring
@@ -216,18 +296,6 @@ class Pong(Game):
             and self.score_animation_timer <= 0):
             self._update_ai(dt)
     
-    def _add_spin(self, ball_y: int, paddle_y: int):
-        """Add spin to ball based on where it hit the paddle"""
-        hit_pos = (ball_y - paddle_y) / self.paddle_height  # 0 to 1
-        hit_offset = hit_pos - 0.5  # -0.5 to 0.5
-        
-        # Adjust vertical velocity based on hit position
-        self.ball_vy += hit_offset * self.ball_speed * 0.5
-        
-        # Limit vertical speed
-        max_vy = self.ball_speed * 0.8
-        self.ball_vy = max(-max_vy, min(max_vy, self.ball_vy))
-    
     def _update_ai(self, dt: float):
         """Simple AI for right paddle (dt-based so it works at any FPS)"""
         # Target the ball's Y position
@@ -254,13 +322,16 @@ class Pong(Game):
     
     def render(self):
         """Render the game"""
-        self.grid.clear()
-        
-        # Mode selection screen
+        # Mode selection screen (only redrawn when the choice changes)
         if not self.mode_selected:
-            self._render_mode_selection()
+            if not self._frame_unchanged(self.mode_index):
+                self.grid.clear()
+                self._render_mode_selection()
+                self._remember_frame(self.mode_index)
             return
         
+        self.grid.clear()
+        
         # Score animation
         if self.score_animation_timer > 0:
             self._render_score_animation()
@@ -271,38 +342,39 @@ class Pong(Game):
             self._render_game_over()
             return
         
-        # Render paddles
-        self._render_paddle(0, int(self.left_paddle_y), (0, 255, 255))
-        self._render_paddle(self.grid.grid_size - 1, int(self.right_paddle_y), (255, 0, 255))
-        
-        # Render ball trail (multicolored)
-        for i, (tx, ty) in enumerate(self.ball_trail):
-            intensity = (i + 1) / len(self.ball_trail)
-            hue = (pygame.time.get_ticks() / 10 + i * 30) % 360
-            color = hsv_to_rgb(hue, 1.0, intensity * 0.6)
-            if 0 <= tx < self.grid.grid_size and 0 <= ty < self.grid.grid_size:
-                self.grid.set_pixel(tx, ty, color)
-        
-        # Render ball
-        ball_x_int = int(self.ball_x)
-        ball_y_int = int(self.ball_y)
-        if 0 <= ball_x_int < self.grid.grid_size and 0 <= ball_y_int < self.grid.grid_size:
-            self.grid.set_pixel(ball_x_int, ball_y_int, (255, 255, 255))
-        
-        # Render scores
-        self.grid.render_number(self.left_score, 3, 1, (0, 255, 255), scale=1)
-        self.grid.render_number(self.right_score, 13, 1, (255, 0, 255), scale=1)
-        
-        # Center line
-        for y in range(0, self.grid.grid_size, 2):
-            self.grid.set_pixel(self.grid.grid_size // 2, y, (50, 50, 50))
-    
-    def _render_paddle(self, x: int, y: int, color: tuple):
-        """Render a paddle"""
-        for i in range(self.paddle_height):
-            py = y + i
-            if 0 <= py < self.grid.grid_size:
-                self.grid.set_pixel(x, py, color)
+        grid = self.grid
+        gs = grid.grid_size
+        
+        # Paddles, multicolored ball trail, ball and center line in one batch.
+        # Later entries win where they overlap, as in the old draw order.
+        paddle_rows = self._paddle_rows
+        trail = self.ball_trail
+        trail_len = len(trail)
+        steps = np.arange(trail_len)
+        hue = (pygame.time.get_ticks() / 10 + steps * 30) % 360
+        trail_colors = FULL_HUE_RGB[hue.astype(np.intp)] * ((steps + 1) / trail_len * 0.6)[:, None]
+        center_xs, center_ys, center_colors = self._center_line
+        
+        xs = np.concatenate((
+            np.zeros(paddle_rows.size),
+            np.full(paddle_rows.size, gs - 1),
+            [tx for tx, _ in trail],
+            [int(self.ball_x)],
+            center_xs,
+        ))
+        ys = np.concatenate((
+            paddle_rows + int(self.left_paddle_y),
+            paddle_rows + int(self.right_paddle_y),
+            [ty for _, ty in trail],
+            [int(self.ball_y)],
+            center_ys,
+        ))
+        colors = np.concatenate((self._paddle_colors, trail_colors, [(255, 255, 255)], center_colors))
+        grid.set_pixels(xs, ys, colors)
+        
+        # Render scores (the center line never reaches them)
+        grid.render_number(self.left_score, 3, 1, (0, 255, 255), scale=1)
+        grid.render_number(self.right_score, 13, 1, (255, 0, 255), scale=1)
     
     def _render_mode_selection(self):
         """Render mode selection screen"""
@@ -323,22 +395,13 @@ class Pong(Game):
         """Render scoring animation with color effects"""
         flash = int(self.score_animation_timer * 10) % 2
         
+        half = self.grid.grid_size // 2
         if self.scoring_player == 'left':
-            color = (0, 255, 255) if flash else (0, 150, 150)
             # Fill left side with color pulse
-            for x in range(self.grid.grid_size // 2):
-                for y in range(self.grid.grid_size):
-                    intensity = 1.0 - (x / (self.grid.grid_size // 2))
-                    c = tuple(int(col * intensity) for col in color)
-                    self.grid.set_pixel(x, y, c)
+            self.grid.pixels[:, :half] = self._left_flash[flash]
         else:
-            color = (255, 0, 255) if flash else (150, 0, 150)
             # Fill right side with color pulse
-            for x in range(self.grid.grid_size // 2, self.grid.grid_size):
-                for y in range(self.grid.grid_size):
-                    intensity = (x - self.grid.grid_size // 2) / (self.grid.grid_size // 2)
-                    c = tuple(int(col * intensity) for col in color)
-                    self.grid.set_pixel(x, y, c)
+            self.grid.pixels[:, half:] = self._right_flash[flash]
         
         # Show current score
         self.grid.render_number(self.left_score, 3, 8, (255, 255, 255), scale=2)
@@ -346,13 +409,9 @@ class Pong(Game):
     
     def _render_game_over(self):
         """Render game over screen"""
-        # Animated rainbow background
-        time = pygame.time.get_ticks() / 1000.0
-        for y in range(self.grid.grid_size):
-            for x in range(self.grid.grid_size):
-                hue = (x * 10 + y * 10 + time * 100) % 360
-                color = hsv_to_rgb(hue, 0.5, 0.3)
-                self.grid.set_pixel(x, y, color)
+        # Animated rainbow background, scrolling 100 degrees of hue per second
+        hue = (self._rainbow_base + pygame.time.get_ticks() // 10) % 360
+        self.grid.pixels[:] = _GAME_OVER_HUES[hue]
         
         # Winner text
         if self.winner == 'left':
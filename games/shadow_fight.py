@@ -18,12 +18,52 @@ from __future__ import annotations
 
 import math
 import random
+import numpy as np
 import pygame
 
 from games.base_game import Game
 from games.sound import play_beep
 
 
+def _stick_pose(facing: int, punching: bool, crouching: bool):
+    """(dxs, dys) of a stick figure's pixels relative to its feet."""
+    if crouching:
+        # Crouched posture: lower head/body, arms low.
+        pts = [(0, -3), (0, -2), (0, -1), (-1, 0), (1, 0), (facing, -1)]
+        if punching:
+            pts.append((2 * facing, -1))
+    else:
+        pts = [
+            (0, -5),  # head
+            (0, -4), (0, -3), (0, -2),  # body
+            (-1, -1), (1, -1), (-1, 0), (1, 0),  # legs
+            (-1, -3), (1, -3),  # arms
+        ]
+        if punching:
+            # Extend one arm forward
+            pts += [(2 * facing, -3), (3 * facing, -3)]
+    dxs, dys = zip(*pts)
+    return np.array(dxs), np.array(dys)
+
+
+# Every pose a fighter can be drawn in, keyed by (facing, punching, crouching)
+_STICK_POSES = {
+    (facing, punching, crouching): _stick_pose(facing, punching, crouching)
+    for facing in (1, -1)
+    for punching in (False, True)
+    for crouching in (False, True)
+}
+
+
+_P1_COLOR = (255, 60, 60)
+_AI_COLOR = (60, 160, 255)
+
+
+def _hp_dim(color: tuple[int, int, int]) -> tuple[int, int, int]:
+    """Color of the empty part of an HP bar."""
+    return (max(10, color[0] // 5), max(10, color[1] // 5), max(10, color[2] // 5))
+
+
 class ShadowFight(Game):
     def __init__(self, grid):
         super().__init__(grid)
@@ -32,6 +72,15 @@ class ShadowFight(Game):
         self.gravity = 24.0
         self.jump_v = -10.0
 
+        # Arena, ground line and empty HP bars never change, so they are
+        # painted once and blitted as the background of every frame
+        n = grid.grid_size
+        self._backdrop = np.empty((n, n, 3), dtype=np.uint8)
+        self._backdrop[:] = (5, 0, 10)
+        self._backdrop[self.ground_y + 1] = (40, 40, 40)
+        self._backdrop[2, 1:10] = _hp_dim(_P1_COLOR)
+        self._backdrop[2, 10:19] = _hp_dim(_AI_COLOR)
+
         self._reset()
 
     def _reset(self):
@@ -61,12 +110,19 @@ class ShadowFight(Game):
             return
 
         self._t += dt
-        self.p1_attack_cd = max(0.0, self.p1_attack_cd - dt)
-        self.ai_attack_cd = max(0.0, self.ai_attack_cd - dt)
-        self.p1_attack_timer = max(0.0, self.p1_attack_timer - dt)
-        self.ai_attack_timer = max(0.0, self.ai_attack_timer - dt)
-        self.p1_crouch_timer = max(0.0, self.p1_crouch_timer - dt)
-        self.ai_crouch_timer = max(0.0, self.ai_crouch_timer - dt)
+        # Count the timers down, stopping at zero
+        t = self.p1_attack_cd - dt
+        self.p1_attack_cd = t if t > 0.0 else 0.0
+        t = self.ai_attack_cd - dt
+        self.ai_attack_cd = t if t > 0.0 else 0.0
+        t = self.p1_attack_timer - dt
+        self.p1_attack_timer = t if t > 0.0 else 0.0
+        t = self.ai_attack_timer - dt
+        self.ai_attack_timer = t if t > 0.0 else 0.0
+        t = self.p1_crouch_timer - dt
+        self.p1_crouch_timer = t if t > 0.0 else 0.0
+        t = self.ai_crouch_timer - dt
+        self.ai_crouch_timer = t if t > 0.0 else 0.0
 
         # Physics
         self._apply_physics(dt)
@@ -88,25 +144,34 @@ class ShadowFight(Game):
             play_beep(880, 120)
 
     def _apply_physics(self, dt: float):
+        dv = self.gravity * dt
+        ground = float(self.ground_y)
+
         # P1
-        self.p1_vy += self.gravity * dt
-        self.p1_y += self.p1_vy * dt
-        if self.p1_y >= self.ground_y:
-            self.p1_y = float(self.ground_y)
-            self.p1_vy = 0.0
+        vy = self.p1_vy + dv
+        y = self.p1_y + vy * dt
+        if y >= ground:
+            y = ground
+            vy = 0.0
+        self.p1_y = y
+        self.p1_vy = vy
 
         # AI
-        self.ai_vy += self.gravity * dt
-        self.ai_y += self.ai_vy * dt
-        if self.ai_y >= self.ground_y:
-            self.ai_y = float(self.ground_y)
-            self.ai_vy = 0.0
+        vy = self.ai_vy + dv
+        y = self.ai_y + vy * dt
+        if y >= ground:
+            y = ground
+            vy = 0.0
+        self.ai_y = y
+        self.ai_vy = vy
 
     def _update_ai(self, dt: float):
         # Simple chase + occasional jump + punch when close.
-        dist = self.ai_x - self.p1_x
-        if abs(dist) > 2.5:
-            self.ai_x += (-1 if dist > 0 else 1) * 2.2 * dt
+        ai_x = self.ai_x
+        dist = ai_x - self.p1_x
+        if dist > 2.5 or dist < -2.5:
+            ai_x += (-1 if dist > 0 else 1) * 2.2 * dt
+            dist = ai_x - self.p1_x
         else:
             # Attack
             if self.ai_attack_cd <= 0:
@@ -119,7 +184,7 @@ class ShadowFight(Game):
             dt > 0
             and self.ai_crouch_timer <= 0
             and self.p1_attack_timer > 0
-            and abs(self.ai_x - self.p1_x) <= 2.2
+            and -2.2 <= dist <= 2.2
             and random.random() < 0.25
         ):
             self.ai_crouch_timer = 0.28
@@ -129,12 +194,21 @@ class ShadowFight(Game):
         if self.ai_y >= self.ground_y and random.random() < 0.01:
             self.ai_vy = self.jump_v
 
-        self.ai_x = max(1.0, min(self.grid.grid_size - 2.0, self.ai_x))
+        hi = self.grid.grid_size - 2.0
+        if ai_x < 1.0:
+            ai_x = 1.0
+        elif ai_x > hi:
+            ai_x = hi
+        self.ai_x = ai_x
 
     def _resolve_hits(self):
+        dx = self.ai_x - self.p1_x
+        dy = self.ai_y - self.p1_y
+        in_range = -2.0 <= dx <= 2.0 and -2.5 <= dy <= 2.5
+
         # P1 punch range
         if self.p1_attack_timer > 0:
-            if abs(self.ai_x - self.p1_x) <= 2.0 and abs(self.ai_y - self.p1_y) <= 2.5:
+            if in_range:
                 if self.ai_crouch_timer <= 0:
                     self.ai_hp -= 1
                     play_beep(880, 20)
@@ -144,7 +218,7 @@ class ShadowFight(Game):
 
         # AI punch range
         if self.ai_attack_timer > 0:
-            if abs(self.ai_x - self.p1_x) <= 2.0 and abs(self.ai_y - self.p1_y) <= 2.5:
+            if in_range:
                 if self.p1_crouch_timer <= 0:
                     self.p1_hp -= 1
                     play_beep(320, 20)
@@ -153,16 +227,12 @@ class ShadowFight(Game):
                 self.ai_attack_timer = 0.0
 
     def render(self):
-        # Arena background
-        self.grid.clear((5, 0, 10))
-
-        # Ground line
-        for x in range(self.grid.grid_size):
-            self.grid.set_pixel(x, self.ground_y + 1, (40, 40, 40))
+        # Arena background and ground line
+        self.grid.blit(self._backdrop)
 
         # Fighters
-        p1_color = (255, 60, 60)
-        ai_color = (60, 160, 255)
+        p1_color = _P1_COLOR
+        ai_color = _AI_COLOR
         self._draw_stick(
             int(round(self.p1_x)),
             int(round(self.p1_y)),
@@ -191,12 +261,9 @@ class ShadowFight(Game):
             self.grid.render_text("WINS", 2, 12, (255, 255, 255), scale=1)
 
     def _draw_hp(self, x: int, y: int, hp: int, color: tuple[int, int, int]):
+        # The empty bar is part of the backdrop; only the filled part is drawn
         hp = max(0, min(10, hp))
-        dim = (max(10, color[0] // 5), max(10, color[1] // 5), max(10, color[2] // 5))
-        for i in range(9):
-            self.grid.set_pixel(x + i, y + 2, dim)
-        for i in range(hp):
-            self.grid.set_pixel(x + i, y + 2, color)
+        self.grid.pixels[y + 2, x:x + hp] = color
 
     def _draw_stick(
         self,
@@ -208,39 +275,8 @@ class ShadowFight(Game):
         crouching: bool,
     ):
         """Draw a tiny stick figure anchored at feet (x,y)."""
-        if crouching:
-            # Crouched posture: lower head/body, arms low.
-            self.grid.set_pixel(x, y - 3, color)  # head
-            self.grid.set_pixel(x, y - 2, color)
-            self.grid.set_pixel(x, y - 1, color)
-            self.grid.set_pixel(x - 1, y, color)
-            self.grid.set_pixel(x + 1, y, color)
-            self.grid.set_pixel(x + 1 * facing, y - 1, color)
-            if punching:
-                self.grid.set_pixel(x + 2 * facing, y - 1, color)
-            return
-
-        # Head
-        self.grid.set_pixel(x, y - 5, color)
-        # Body
-        for dy in range(1, 4):
-            self.grid.set_pixel(x, y - (5 - dy), color)
-
-        # Legs
-        self.grid.set_pixel(x - 1, y - 1, color)
-        self.grid.set_pixel(x + 1, y - 1, color)
-        self.grid.set_pixel(x - 1, y, color)
-        self.grid.set_pixel(x + 1, y, color)
-
-        # Arms
-        arm_y = y - 3
-        self.grid.set_pixel(x - 1, arm_y, color)
-        self.grid.set_pixel(x + 1, arm_y, color)
-
-        if punching:
-            # Extend one arm forward
-            self.grid.set_pixel(x + 2 * facing, arm_y, color)
-            self.grid.set_pixel(x + 3 * facing, arm_y, color)
+        dxs, dys = _STICK_POSES[facing, punching, crouching]
+        self.grid.set_pixels(dxs + x, dys + y, color)
 
     def handle_input(self, keys, events):
         for event in events:
@@ -274,8 +310,14 @@ class ShadowFight(Game):
         # Continuous movement
         if not self.game_over:
             speed = 4.0
+            x = self.p1_x
             if keys[pygame.K_a]:
-                self.p1_x -= speed * (1 / 60)
+                x -= speed * (1 / 60)
             if keys[pygame.K_d]:
-                self.p1_x += speed * (1 / 60)
-            self.p1_x = max(1.0, min(self.grid.grid_size - 2.0, self.p1_x))
\ No newline at end of file
+                x += speed * (1 / 60)
+            hi = self.grid.grid_size - 2.0
+            if x < 1.0:
+                x = 1.0
+            elif x > hi:
+                x = hi
+            self.p1_x = x
\ No newline at end of file
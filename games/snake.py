@@ -15,8 +15,9 @@ Gameplay:
 from __future__ import annotations
 
 import random
+import numpy as np
 import pygame
-from typing import Deque, List, Tuple
+from typing import Deque, Dict, List, Tuple
 from collections import deque
 
 from games.base_game import Game
@@ -41,6 +42,15 @@ class Snake(Game):
 
         self.snake: Deque[Pos] = deque()
         self.food: Pos = (0, 0)
+        # Cells not covered by the snake (in no particular order) and each
+        # one's index in that list, kept in step with every move so food can
+        # be placed with a single random index
+        self._free_list: List[Pos] = []
+        self._free_pos: Dict[Pos, int] = {}
+        # One byte per cell (row-major), 1 where the snake is, and a boolean
+        # [y, x] view of the same memory for drawing
+        self._occ = bytearray()
+        self._occ_mask = np.zeros((0, 0), dtype=bool)
         self._reset()
 
     def _reset(self):
@@ -50,6 +60,14 @@ class Snake(Game):
         cx = self.grid.grid_size // 2
         cy = self.grid.grid_size // 2
         self.snake = deque([(cx - 1, cy), (cx, cy), (cx + 1, cy)])
+        size = self.grid.grid_size
+        body = set(self.snake)
+        self._free_list = [(x, y) for y in range(size) for x in range(size) if (x, y) not in body]
+        self._free_pos = {cell: i for i, cell in enumerate(self._free_list)}
+        self._occ = bytearray(size * size)
+        for x, y in self.snake:
+            self._occ[y * size + x] = 1
+        self._occ_mask = np.frombuffer(self._occ, dtype=bool).reshape(size, size)
         self.direction = (1, 0)
         self.next_direction = (1, 0)
         self._accum = 0.0
@@ -57,13 +75,24 @@ class Snake(Game):
         self._spawn_food()
 
     def _spawn_food(self):
-        free: List[Pos] = [
-            (x, y)
-            for y in range(self.grid.grid_size)
-            for x in range(self.grid.grid_size)
-            if (x, y) not in self.snake
-        ]
-        self.food = random.choice(free) if free else (0, 0)
+        free = self._free_list
+        self.food = free[random.randrange(len(free))] if free else (0, 0)
+
+    def _claim(self, cell: Pos):
+        """Take a cell out of the free list (swap with the last entry and pop)."""
+        i = self._free_pos.pop(cell, None)
+        if i is None:
+            return
+        last = self._free_list.pop()
+        if last != cell:
+            self._free_list[i] = last
+            self._free_pos[last] = i
+
+    def _release(self, cell: Pos):
+        """Put a cell back on the free list."""
+        if cell not in self._free_pos:
+            self._free_pos[cell] = len(self._free_list)
+            self._free_list.append(cell)
 
     def update(self, dt: float):
         if self.game_over:
@@ -78,30 +107,37 @@ class Snake(Game):
         # Apply buffered direction
         self.direction = self.next_direction
 
+        size = self.grid.grid_size
         hx, hy = self.snake[-1]
         dx, dy = self.direction
-        nx = (hx + dx) % self.grid.grid_size
-        ny = (hy + dy) % self.grid.grid_size
+        nx = (hx + dx) % size
+        ny = (hy + dy) % size
 
         new_head = (nx, ny)
+        idx = ny * size + nx
 
         # Self collision (allow moving into tail only if it will move away)
         tail = self.snake[0]
-        body = set(self.snake)
         will_grow = new_head == self.food
-        if new_head in body and (not (new_head == tail and not will_grow)):
+        if self._occ[idx] and (not (new_head == tail and not will_grow)):
             self._die()
             return
 
+        # Vacate the old tail before claiming the head: they can be the same cell
+        if not will_grow:
+            tx, ty = self.snake.popleft()
+            self._occ[ty * size + tx] = 0
+            self._release((tx, ty))
+
         self.snake.append(new_head)
+        self._occ[idx] = 1
+        self._claim(new_head)
 
         # Eat
         if will_grow:
             self.score += 1
             play_beep(880, 60)
             self._spawn_food()
-        else:
-            self.snake.popleft()
 
     def _die(self):
         self.game_over = True
@@ -110,17 +146,16 @@ class Snake(Game):
     def render(self):
         self.grid.clear((0, 0, 0))
 
+        pixels = self.grid.pixels
+
         # Food
         fx, fy = self.food
-        self.grid.set_pixel(fx, fy, (255, 60, 60))
-
-        # Snake
-        for i, (x, y) in enumerate(self.snake):
-            # Head brighter
-            if i == len(self.snake) - 1:
-                self.grid.set_pixel(x, y, (0, 255, 0))
-            else:
-                self.grid.set_pixel(x, y, (0, 150, 0))
+        pixels[fy, fx] = (255, 60, 60)
+
+        # Snake: every occupied cell in one store, then the brighter head
+        pixels[self._occ_mask] = (0, 150, 0)
+        hx, hy = self.snake[-1]
+        pixels[hy, hx] = (0, 255, 0)
 
         # Score
         self.grid.render_text("S", 0, 0, (120, 255, 120), scale=1)
@@ -8,9 +8,9 @@ This project aims to be competition-demo friendly, so sound must be:
 
 from __future__ import annotations
 
-import math
 from typing import Dict, Tuple
 
+import numpy as np
 import pygame
 
 
@@ -18,8 +18,23 @@ _enabled: bool = True
 _initialized: bool = False
 _available: bool = False
 
+_SAMPLE_RATE = 22050
+
 _cache: Dict[Tuple[int, int, float], pygame.mixer.Sound] = {}
 
+# Every (frequency, duration_ms) the games play, built as soon as the mixer is
+# up so no beep is synthesized mid-game; anything else is still made on demand
+_PRESETS = (
+    (220, 150), (220, 180), (220, 200), (260, 40),
+    (320, 12), (320, 15), (320, 20), (320, 25), (320, 40),
+    (420, 15), (420, 25), (420, 35),
+    (520, 12), (520, 15), (520, 20), (520, 25), (520, 35), (520, 60),
+    (620, 25),
+    (660, 15), (660, 20), (660, 30), (660, 40), (660, 50), (660, 60),
+    (740, 20), (740, 30), (740, 60),
+    (880, 20), (880, 40), (880, 45), (880, 60), (880, 80), (880, 120),
+)
+
 
 def is_enabled() -> bool:
     return _enabled
@@ -48,10 +63,30 @@ def _ensure_init() -> None:
         return
     _initialized = True
     try:
-        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+        pygame.mixer.init(frequency=_SAMPLE_RATE, size=-16, channels=2, buffer=512)
         _available = True
     except Exception:
         _available = False
+        return
+
+    try:
+        for frequency, duration_ms in _PRESETS:
+            _get_beep(frequency, duration_ms)
+    except Exception:
+        # Whatever didn't get built is synthesized on first play instead.
+        pass
+
+
+def mixer_samples(samples: np.ndarray) -> np.ndarray:
+    """Spread mono samples over the mixer's channels (interleaved frames).
+
+    The mixer reads a raw buffer as frames of one sample per channel, so a
+    mono buffer on a stereo mixer would play at twice the pitch for half
+    the time.
+    """
+    init = pygame.mixer.get_init()
+    channels = init[2] if init else 1
+    return np.repeat(samples, channels) if channels > 1 else samples
 
 
 def _get_beep(frequency: int, duration_ms: int, volume: float = 0.3) -> pygame.mixer.Sound | None:
@@ -60,20 +95,25 @@ def _get_beep(frequency: int, duration_ms: int, volume: float = 0.3) -> pygame.m
     if key in _cache:
         return _cache[key]
 
-    sample_rate = 22050
     duration = duration_ms / 1000.0
-    n_samples = int(round(duration * sample_rate))
+    n_samples = int(round(duration * _SAMPLE_RATE))
     if n_samples <= 0:
         return None
 
-    # Signed 16-bit mono buffer
-    sound_bytes = bytearray()
+    # Signed 16-bit little-endian samples, synthesized in one go and handed to
+    # the mixer through the buffer protocol without a bytes copy. The phase
+    # array is reused for sin/scale and the cast writes straight into the
+    # int16 buffer, so only one float temporary is ever allocated.
     amp = int(32767.0 * max(0.0, min(1.0, volume)))
-    for i in range(n_samples):
-        sample = int(amp * math.sin(2.0 * math.pi * float(frequency) * i / sample_rate))
-        sound_bytes.extend(sample.to_bytes(2, byteorder="little", signed=True))
-
-    snd = pygame.mixer.Sound(buffer=bytes(sound_bytes))
+    wave = np.arange(n_samples, dtype=np.float64)
+    wave *= 2.0 * np.pi * float(frequency)
+    wave /= _SAMPLE_RATE
+    np.sin(wave, out=wave)
+    wave *= amp
+    samples = np.empty(n_samples, dtype="<i2")
+    np.copyto(samples, wave, casting="unsafe")
+
+    snd = pygame.mixer.Sound(buffer=mixer_samples(samples))
     _cache[key] = snd
     return snd
 
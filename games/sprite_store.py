@@ -15,9 +15,13 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Tuple
 
+import numpy as np
+
+from games.json_file import write_json_atomic
+
 
 Color = Tuple[int, int, int]
 
@@ -26,26 +30,42 @@ Color = Tuple[int, int, int]
 class Sprite:
     w: int
     h: int
-    pixels: Dict[Tuple[int, int], Color]
+    # RGBA pixels indexed [y, x]; alpha 255 marks a painted pixel, 0 a transparent one.
+    data: np.ndarray | None = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.data is None:
+            self.data = np.zeros((self.h, self.w, 4), dtype=np.uint8)
 
     def get(self, x: int, y: int) -> Color | None:
-        return self.pixels.get((x, y))
+        if not (0 <= x < self.w and 0 <= y < self.h):
+            return None
+        r, g, b, a = self.data[y, x].tolist()
+        return (r, g, b) if a else None
 
     def set(self, x: int, y: int, color: Color | None) -> None:
         if not (0 <= x < self.w and 0 <= y < self.h):
             return
         if color is None:
-            self.pixels.pop((x, y), None)
+            self.data[y, x] = 0
         else:
-            self.pixels[(x, y)] = color
+            # Clamp like LEDGrid.set_pixel so out-of-range (e.g. hand-edited) colors still load
+            self.data[y, x, :3] = np.clip(np.rint(color), 0, 255)
+            self.data[y, x, 3] = 255
 
 
 class SpriteStore:
     def __init__(self, path: str = "data/sprites.json"):
         self.path = path
         self._sprites: Dict[str, Sprite] = {}
+        # Per sprite: (w, h, pixel bytes) last serialized and its JSON entry.
+        self._serialized: Dict[str, Tuple[Tuple[int, int, bytes], dict]] = {}
+        # Hash of the sprites as last written to disk, None if not written yet.
+        self._last_saved_hash: int | None = None
 
     def load(self) -> None:
+        self._serialized = {}
+        self._last_saved_hash = None
         if not os.path.exists(self.path):
             self._sprites = {}
             return
@@ -61,30 +81,44 @@ class SpriteStore:
             try:
                 w = int(s.get("w"))
                 h = int(s.get("h"))
-                pix = {}
+                sprite = Sprite(w=w, h=h)
                 for k, v in (s.get("pixels") or {}).items():
                     xs, ys = k.split(",")
                     x, y = int(xs), int(ys)
                     r, g, b = v
-                    pix[(x, y)] = (int(r), int(g), int(b))
-                sprites[str(name)] = Sprite(w=w, h=h, pixels=pix)
+                    sprite.set(x, y, (int(r), int(g), int(b)))
+                sprites[str(name)] = sprite
             except Exception:
                 continue
         self._sprites = sprites
 
     def save(self) -> None:
-        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        # Editors write sprite.data directly, so compare contents rather than
+        # relying on Sprite.set to flag changes.
+        state = {name: (s.w, s.h, s.data.tobytes()) for name, s in self._sprites.items()}
+        h = hash(tuple(sorted(state.items())))
+        if h == self._last_saved_hash and os.path.exists(self.path):
+            return
+
         raw = {}
+        serialized = {}
         for name, sprite in self._sprites.items():
-            pixels = {f"{x},{y}": [c[0], c[1], c[2]] for (x, y), c in sprite.pixels.items()}
-            raw[name] = {"w": sprite.w, "h": sprite.h, "pixels": pixels}
-        with open(self.path, "w", encoding="utf-8") as f:
-            json.dump(raw, f, indent=2, sort_keys=True)
+            cached = self._serialized.get(name)
+            if cached is None or cached[0] != state[name]:
+                ys, xs = np.nonzero(sprite.data[..., 3])
+                rgb = sprite.data[ys, xs, :3].tolist()
+                pixels = {f"{x},{y}": c for x, y, c in zip(xs.tolist(), ys.tolist(), rgb)}
+                cached = (state[name], {"w": sprite.w, "h": sprite.h, "pixels": pixels})
+            serialized[name] = cached
+            raw[name] = cached[1]
+        write_json_atomic(self.path, raw, indent=2, sort_keys=True)
+        self._serialized = serialized
+        self._last_saved_hash = h
 
     def get_or_create(self, name: str, w: int, h: int) -> Sprite:
         sprite = self._sprites.get(name)
         if sprite is None or sprite.w != w or sprite.h != h:
-            sprite = Sprite(w=w, h=h, pixels={})
+            sprite = Sprite(w=w, h=h)
             self._sprites[name] = sprite
         return sprite
 
@@ -105,5 +139,12 @@ def get_sprite_store() -> SpriteStore:
 
 
 def draw_sprite(grid, sprite: Sprite, ox: int, oy: int) -> None:
-    for (x, y), c in sprite.pixels.items():
-        grid.set_pixel(ox + x, oy + y, c)
+    """Draw the painted pixels of a sprite with its top-left at (ox, oy), clipped to the grid."""
+    n = grid.grid_size
+    x0, y0 = max(0, ox), max(0, oy)
+    x1, y1 = min(n, ox + sprite.w), min(n, oy + sprite.h)
+    if x0 >= x1 or y0 >= y1:
+        return
+    src = sprite.data[y0 - oy:y1 - oy, x0 - ox:x1 - ox]
+    painted = src[..., 3] != 0
+    grid.pixels[y0:y1, x0:x1][painted] = src[..., :3][painted]
@@ -13,6 +13,7 @@ This is deliberately minimal so existing games don't need major refactors.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 @dataclass(frozen=True)
@@ -35,6 +36,9 @@ def text_width(chars: int, scale: int = 1, spacing: int = 1) -> int:
     return chars * ((3 + spacing) * scale)
 
 
+# Zones are frozen (hashable) and callers only use a handful of lengths,
+# so every distinct layout is computed once.
+@lru_cache(maxsize=None)
 def centered_x(zone: TextZone, chars: int, scale: int = 1, spacing: int = 1) -> int:
     w = text_width(chars=chars, scale=scale, spacing=spacing)
     return zone.x + max(0, (zone.w - w) // 2)
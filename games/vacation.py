@@ -10,13 +10,88 @@ Controls:
 
 from __future__ import annotations
 
-import math
+from typing import Dict
+
+import numpy as np
 import pygame
 
-from games.base_game import Game, hsv_to_rgb
+from games.base_game import NAV_ARROWS, Game, hsv_to_rgb_array
 from games.sound import play_beep
 
 
+_COLUMNS = np.arange(19)
+
+# Beach: sky and ocean gradients (one color per row), sun and palm fronds
+_BEACH_SKY = np.array([(20, 60 + y * 10, 120 + y * 10) for y in range(0, 6)], dtype=np.uint8)
+_OCEAN = np.array([(0, 80 + (y - 6) * 8, 180) for y in range(6, 13)], dtype=np.uint8)
+_SUN_XS = np.array([14, 13, 15, 14, 14])
+_SUN_YS = np.array([2, 2, 2, 1, 3])
+_FROND_XS = np.array([1, 2, 3, 4, 5, 2, 4])
+_FROND_YS = np.array([8, 8, 8, 8, 8, 9, 9])
+
+# Waterfall: sky gradient, mountain cells, falling-water rows, ripple cells, rocks
+_FALLS_SKY = np.array([(10, 20 + y * 8, 60 + y * 12) for y in range(0, 6)], dtype=np.uint8)
+_MOUNTAINS = np.zeros((19, 19), dtype=bool)
+for _x in range(0, 19):
+    _MOUNTAINS[max(0, 5 - int(abs(_x - 6) * 0.6)):7, _x] = True
+_FALL_ROWS = np.arange(4, 15)
+_RIPPLE_XS = np.arange(0, 19, 2)
+_RIPPLE_YS = 16 + (_RIPPLE_XS % 3 == 0)
+_ROCK_XS = np.array([2, 3, 15, 16])
+_ROCK_YS = np.array([17, 18, 17, 18])
+_STILL_SHADE = 200 + (_FALL_ROWS % 2) * 30
+# Pastel ripple color for each whole degree of hue
+_RIPPLE_HUES = hsv_to_rgb_array(np.arange(360), 0.4, 0.8)
+
+
+def _paint_palm(pixels: np.ndarray) -> None:
+    pixels[9:16, 3] = (40, 30, 20)
+    pixels[_FROND_YS, _FROND_XS] = (20, 100, 40)
+
+
+def _paint_beach(pixels: np.ndarray) -> None:
+    """Sky + sun + ocean + sand + palm, without the wave shimmer."""
+    # Sky
+    pixels[0:6] = _BEACH_SKY[:, None]
+
+    # Sun
+    pixels[_SUN_YS, _SUN_XS] = (255, 220, 80)
+
+    # Ocean
+    pixels[6:13] = _OCEAN[:, None]
+
+    # Sand
+    pixels[13:19] = (180, 140, 70)
+
+    # Palm silhouette
+    _paint_palm(pixels)
+
+
+def _paint_falling_water(pixels: np.ndarray, shade: np.ndarray) -> None:
+    fall_x = 10
+    # Crests can reach 260; clamp like set_pixel does.
+    pixels[4:15, fall_x] = np.stack((np.full_like(shade, 80), np.minimum(shade, 255), np.full_like(shade, 255)), axis=1)
+    pixels[4:15, fall_x + 1] = np.stack((np.full_like(shade, 60), shade - 20, np.full_like(shade, 230)), axis=1)
+
+
+def _paint_waterfall(pixels: np.ndarray) -> None:
+    """Mountains + still waterfall + pool, without ripples."""
+    # Sky
+    pixels[0:6] = _FALLS_SKY[:, None]
+
+    # Mountains
+    pixels[_MOUNTAINS] = (50, 60, 70)
+
+    # Waterfall column
+    _paint_falling_water(pixels, _STILL_SHADE)
+
+    # Pool
+    pixels[15:19] = (0, 80, 140)
+
+    # Rocks
+    pixels[_ROCK_YS, _ROCK_XS] = (70, 70, 70)
+
+
 class VacationGallery(Game):
     def __init__(self, grid):
         super().__init__(grid)
@@ -25,28 +100,35 @@ class VacationGallery(Game):
         self.t = 0.0
 
         self.scenes = [
-            {"name": "BEACH", "fn": self._render_beach},
-            {"name": "FALLS", "fn": self._render_waterfall},
+            {"name": "BEACH", "paint": _paint_beach, "animate": self._animate_beach},
+            {"name": "FALLS", "paint": _paint_waterfall, "animate": self._animate_waterfall},
         ]
+        # Still picture of each scene, painted the first time it's shown
+        self._backdrops: Dict[int, np.ndarray] = {}
 
     def update(self, dt: float):
         if self.animate:
             self.t += dt
 
     def render(self):
-        self.grid.clear((0, 0, 0))
-
         scene = self.scenes[self.scene_index]
-        scene["fn"]()
+        backdrop = self._backdrops.get(self.scene_index)
+        if backdrop is None:
+            n = self.grid.grid_size
+            backdrop = np.zeros((n, n, 3), dtype=np.uint8)
+            scene["paint"](backdrop)
+            self._backdrops[self.scene_index] = backdrop
+
+        self.grid.blit(backdrop)
+        if self.animate:
+            scene["animate"](self.grid.pixels)
 
         # Title
         self.grid.render_text("VACAY", 1, 0, (120, 200, 255), scale=1)
         self.grid.render_text(scene["name"], 1, 6, (255, 255, 0), scale=1)
 
         # Scene arrows
-        arrow_color = (130, 130, 130)
-        self._render_left_arrow(1, 10, arrow_color)
-        self._render_right_arrow(17, 10, arrow_color)
+        self.grid.set_pixels(*NAV_ARROWS, (130, 130, 130))
 
     def handle_input(self, keys, events):
         for event in events:
@@ -67,88 +149,19 @@ class VacationGallery(Game):
                 self.animate = not self.animate
                 play_beep(660, 50)
 
-    # --- Scenes ---
+    # --- Scene animation (drawn over the still backdrops) ---
 
-    def _render_beach(self):
-        """Sky + sun + ocean + sand, with optional wave shimmer."""
-        # Sky
-        for y in range(0, 6):
-            for x in range(0, 19):
-                c = (20, 60 + y * 10, 120 + y * 10)
-                self.grid.set_pixel(x, y, c)
+    def _animate_beach(self, pixels: np.ndarray):
+        """Wave shimmer, kept behind the palm."""
+        phase = self.t * 3.0
+        ys = 8 + np.rint((np.sin(phase + _COLUMNS * 0.6) + 1) * 0.8).astype(np.intp)
+        pixels[ys, _COLUMNS] = (120, 220, 255)
+        _paint_palm(pixels)
 
-        # Sun
-        sun_x, sun_y = 14, 2
-        for dx, dy in [(0, 0), (-1, 0), (1, 0), (0, -1), (0, 1)]:
-            self.grid.set_pixel(sun_x + dx, sun_y + dy, (255, 220, 80))
+    def _animate_waterfall(self, pixels: np.ndarray):
+        """Flowing water shades and pool ripples."""
+        shade = 180 + ((np.sin(self.t * 6 + _FALL_ROWS) + 1) * 40).astype(np.intp)
+        _paint_falling_water(pixels, shade)
 
-        # Ocean
-        for y in range(6, 13):
-            for x in range(0, 19):
-                base = (0, 80 + (y - 6) * 8, 180)
-                self.grid.set_pixel(x, y, base)
-
-        # Waves shimmer
-        if self.animate:
-            phase = self.t * 3.0
-            for x in range(0, 19):
-                y = 8 + int(round((math.sin(phase + x * 0.6) + 1) * 0.8))
-                self.grid.set_pixel(x, y, (120, 220, 255))
-
-        # Sand
-        for y in range(13, 19):
-            for x in range(0, 19):
-                self.grid.set_pixel(x, y, (180, 140, 70))
-
-        # Palm silhouette
-        for y in range(9, 16):
-            self.grid.set_pixel(3, y, (40, 30, 20))
-        for dx, dy in [(-2, 8), (-1, 8), (0, 8), (1, 8), (2, 8), (-1, 9), (1, 9)]:
-            self.grid.set_pixel(3 + dx, dy, (20, 100, 40))
-
-    def _render_waterfall(self):
-        """Mountains + waterfall + pool with optional animated water."""
-        # Sky
-        for y in range(0, 6):
-            for x in range(0, 19):
-                self.grid.set_pixel(x, y, (10, 20 + y * 8, 60 + y * 12))
-
-        # Mountains
-        for x in range(0, 19):
-            peak = 5 - int(abs(x - 6) * 0.6)
-            for y in range(max(0, peak), 7):
-                self.grid.set_pixel(x, y, (50, 60, 70))
-
-        # Waterfall column
-        fall_x = 10
-        for y in range(4, 15):
-            shade = 200 + (y % 2) * 30
-            if self.animate:
-                shade = 180 + int((math.sin(self.t * 6 + y) + 1) * 40)
-            self.grid.set_pixel(fall_x, y, (80, shade, 255))
-            self.grid.set_pixel(fall_x + 1, y, (60, shade - 20, 230))
-
-        # Pool
-        for y in range(15, 19):
-            for x in range(0, 19):
-                self.grid.set_pixel(x, y, (0, 80, 140))
-
-        # Ripples
-        if self.animate:
-            for x in range(0, 19, 2):
-                hue = (self.t * 80 + x * 15) % 360
-                self.grid.set_pixel(x, 16 + (x % 3 == 0), hsv_to_rgb(hue, 0.4, 0.8))
-
-        # Rocks
-        for (x, y) in [(2, 17), (3, 18), (15, 17), (16, 18)]:
-            self.grid.set_pixel(x, y, (70, 70, 70))
-
-    def _render_left_arrow(self, x: int, y: int, color: tuple[int, int, int]):
-        pts = [(0, 0), (1, -1), (1, 1), (2, -2), (2, 2)]
-        for dx, dy in pts:
-            self.grid.set_pixel(x + dx, y + dy, color)
-
-    def _render_right_arrow(self, x: int, y: int, color: tuple[int, int, int]):
-        pts = [(0, 0), (-1, -1), (-1, 1), (-2, -2), (-2, 2)]
-        for dx, dy in pts:
-            self.grid.set_pixel(x + dx, y + dy, color)
+        hue = (self.t * 80 + _RIPPLE_XS * 15) % 360
+        pixels[_RIPPLE_YS, _RIPPLE_XS] = _RIPPLE_HUES[hue.astype(np.intp)]
@@ -4,9 +4,53 @@ Supports runtime adjustment of LED size, spacing, and visual style
 """
 import pygame
 import math
+import numpy as np
 from typing import Dict, Tuple, List
 
 
+# Built-in 3x5 font used by render_text(); rows top to bottom, 1 = lit.
+_FONT_3X5: Dict[str, List[List[int]]] = {
+    '0': [[1,1,1],[1,0,1],[1,0,1],[1,0,1],[1,1,1]],
+    '1': [[0,1,0],[1,1,0],[0,1,0],[0,1,0],[1,1,1]],
+    '2': [[1,1,1],[0,0,1],[1,1,1],[1,0,0],[1,1,1]],
+    '3': [[1,1,1],[0,0,1],[1,1,1],[0,0,1],[1,1,1]],
+    '4': [[1,0,1],[1,0,1],[1,1,1],[0,0,1],[0,0,1]],
+    '5': [[1,1,1],[1,0,0],[1,1,1],[0,0,1],[1,1,1]],
+    '6': [[1,1,1],[1,0,0],[1,1,1],[1,0,1],[1,1,1]],
+    '7': [[1,1,1],[0,0,1],[0,0,1],[0,0,1],[0,0,1]],
+    '8': [[1,1,1],[1,0,1],[1,1,1],[1,0,1],[1,1,1]],
+    '9': [[1,1,1],[1,0,1],[1,1,1],[0,0,1],[1,1,1]],
+    'A': [[0,1,0],[1,0,1],[1,1,1],[1,0,1],[1,0,1]],
+    'B': [[1,1,0],[1,0,1],[1,1,0],[1,0,1],[1,1,0]],
+    'C': [[1,1,1],[1,0,0],[1,0,0],[1,0,0],[1,1,1]],
+    'D': [[1,1,0],[1,0,1],[1,0,1],[1,0,1],[1,1,0]],
+    'E': [[1,1,1],[1,0,0],[1,1,1],[1,0,0],[1,1,1]],
+    'F': [[1,1,1],[1,0,0],[1,1,1],[1,0,0],[1,0,0]],
+    'G': [[1,1,1],[1,0,0],[1,0,1],[1,0,1],[1,1,1]],
+    'H': [[1,0,1],[1,0,1],[1,1,1],[1,0,1],[1,0,1]],
+    'I': [[1,1,1],[0,1,0],[0,1,0],[0,1,0],[1,1,1]],
+    'J': [[0,0,1],[0,0,1],[0,0,1],[1,0,1],[0,1,0]],
+    'K': [[1,0,1],[1,1,0],[1,0,0],[1,1,0],[1,0,1]],
+    'L': [[1,0,0],[1,0,0],[1,0,0],[1,0,0],[1,1,1]],
+    'M': [[1,0,1],[1,1,1],[1,1,1],[1,0,1],[1,0,1]],
+    'N': [[1,0,1],[1,1,1],[1,1,1],[1,0,1],[1,0,1]],
+    'O': [[1,1,1],[1,0,1],[1,0,1],[1,0,1],[1,1,1]],
+    'P': [[1,1,1],[1,0,1],[1,1,1],[1,0,0],[1,0,0]],
+    'Q': [[1,1,1],[1,0,1],[1,0,1],[1,1,1],[0,0,1]],
+    'R': [[1,1,1],[1,0,1],[1,1,1],[1,1,0],[1,0,1]],
+    'S': [[1,1,1],[1,0,0],[1,1,1],[0,0,1],[1,1,1]],
+    'T': [[1,1,1],[0,1,0],[0,1,0],[0,1,0],[0,1,0]],
+    'U': [[1,0,1],[1,0,1],[1,0,1],[1,0,1],[1,1,1]],
+    'V': [[1,0,1],[1,0,1],[1,0,1],[1,0,1],[0,1,0]],
+    'W': [[1,0,1],[1,0,1],[1,1,1],[1,1,1],[1,0,1]],
+    'X': [[1,0,1],[1,0,1],[0,1,0],[1,0,1],[1,0,1]],
+    'Y': [[1,0,1],[1,0,1],[0,1,0],[0,1,0],[0,1,0]],
+    'Z': [[1,1,1],[0,0,1],[0,1,0],[1,0,0],[1,1,1]],
+    ' ': [[0,0,0],[0,0,0],[0,0,0],[0,0,0],[0,0,0]],
+    '-': [[0,0,0],[0,0,0],[1,1,1],[0,0,0],[0,0,0]],
+}
+
+
 class LEDGrid:
     """Renders a 19x19 RGB LED grid with configurable display parameters"""
     
@@ -23,8 +67,17 @@ class LEDGrid:
         # Visual style
         self.circular_mode = True  # Toggle between circular and square LEDs
         
-        # Grid data: 19x19 array of RGB colors
-        self.grid = [[(0, 0, 0) for _ in range(self.grid_size)] for _ in range(self.grid_size)]
+        # Grid data: 19x19 RGB framebuffer, indexed as pixels[y, x]
+        self.pixels = np.zeros((self.grid_size, self.grid_size, 3), dtype=np.uint8)
+
+        # Text rendering: user font overrides and per-(char, scale) glyph offsets
+        self._font_overrides = {}
+        self._glyph_cache = {}
+
+        # Rendered LED panel, the layout it was drawn for and the colors on it
+        self._panel = None
+        self._panel_layout = None
+        self._panel_pixels = None
         
         # Calculate grid offset to center it
         self.update_grid_offset()
@@ -41,6 +94,15 @@ class LEDGrid:
         self.offset_x = (self.window_width - total_size) // 2
         self.offset_y = (self.window_height - total_size) // 2
     
+    def screen_to_grid(self, sx: int, sy: int) -> Tuple[int, int] | None:
+        """Map a window pixel to the (x, y) LED cell under it, or None if off the grid."""
+        pitch = self.led_size + self.led_spacing
+        lx = (int(sx) - self.offset_x) // pitch
+        ly = (int(sy) - self.offset_y) // pitch
+        if 0 <= lx < self.grid_size and 0 <= ly < self.grid_size:
+            return (lx, ly)
+        return None
+
     def adjust_led_size(self, delta: int):
         """Adjust LED size (+ and - keys)"""
         self.led_size = max(5, min(60, self.led_size + delta))
@@ -62,7 +124,32 @@ class LEDGrid:
     def set_pixel(self, x: int, y: int, color: Tuple[int, int, int]):
         """Set a single LED color (x, y coordinates, RGB color)"""
         if 0 <= x < self.grid_size and 0 <= y < self.grid_size:
-            self.grid[y][x] = self._coerce_color(color)
+            self.pixels[y, x] = self._coerce_color(color)
+
+    def set_pixels(self, xs, ys, colors):
+        """Set many LEDs in one vectorized store.
+
+        Args:
+            xs, ys: Equal-length sequences (or arrays) of coordinates.
+            colors: One RGB color for every pixel, or one RGB color per pixel.
+
+        Out-of-range coordinates are skipped, and when a coordinate repeats the
+        later entry wins, exactly as with the equivalent set_pixel() calls.
+        """
+        xs = np.asarray(xs, dtype=np.intp).ravel()
+        ys = np.asarray(ys, dtype=np.intp).ravel()
+        colors = np.asarray(colors)
+        if colors.dtype != np.uint8:
+            colors = np.clip(np.rint(colors), 0, 255).astype(np.uint8)
+
+        keep = np.flatnonzero((xs >= 0) & (xs < self.grid_size) & (ys >= 0) & (ys < self.grid_size))
+        if keep.size == 0:
+            return
+        flat = ys[keep] * self.grid_size + xs[keep]
+        _, last = np.unique(flat[::-1], return_index=True)
+        keep = keep[keep.size - 1 - last]
+
+        self.pixels[ys[keep], xs[keep]] = colors[keep] if colors.ndim > 1 else colors
 
     def _coerce_color(self, color) -> Tuple[int, int, int]:
         """Coerce arbitrary color-like input into an (r,g,b) tuple of ints 0..255.
@@ -87,20 +174,32 @@ class LEDGrid:
     def get_pixel(self, x: int, y: int) -> Tuple[int, int, int]:
         """Get a single LED color"""
         if 0 <= x < self.grid_size and 0 <= y < self.grid_size:
-            return self.grid[y][x]
+            return tuple(self.pixels[y, x].tolist())
         return (0, 0, 0)
     
     def clear(self, color: Tuple[int, int, int] = (0, 0, 0)):
         """Clear the entire grid to a specific color (default black)"""
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                self.grid[y][x] = color
+        self.pixels[:, :] = self._coerce_color(color)
+
+    def blit(self, fb: np.ndarray, x: int = 0, y: int = 0):
+        """Copy an (h, w, 3) RGB array onto the grid with its top-left at (x, y).
+
+        Parts of the array that fall outside the grid are clipped.
+        """
+        h, w = fb.shape[:2]
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.grid_size, x + w), min(self.grid_size, y + h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        self.pixels[y0:y1, x0:x1] = fb[y0 - y:y1 - y, x0 - x:x1 - x]
     
     def fill_rect(self, x: int, y: int, width: int, height: int, color: Tuple[int, int, int]):
-        """Fill a rectangular area with a color"""
-        for dy in range(height):
-            for dx in range(width):
-                self.set_pixel(x + dx, y + dy, color)
+        """Fill a rectangular area with a color (clipped to the grid)"""
+        x0, y0 = max(0, x), max(0, y)
+        x1 = min(self.grid_size, x + width)
+        y1 = min(self.grid_size, y + height)
+        if x0 < x1 and y0 < y1:
+            self.pixels[y0:y1, x0:x1] = self._coerce_color(color)
     
     def draw_line(self, x1: int, y1: int, x2: int, y2: int, color: Tuple[int, int, int]):
         """Draw a line between two points using Bresenham's algorithm"""
@@ -123,20 +222,73 @@ class LEDGrid:
                 err += dx
                 y += sy
     
-    def render(self, surface: pygame.Surface):
-        """Render the LED grid to a pygame surface"""
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                color = self._coerce_color(self.grid[y][x])
-                
-                # Calculate LED position
-                led_x = self.offset_x + x * (self.led_size + self.led_spacing)
-                led_y = self.offset_y + y * (self.led_size + self.led_spacing)
-                
-                if self.circular_mode:
-                    self._render_circular_led(surface, led_x, led_y, color)
-                else:
-                    self._render_square_led(surface, led_x, led_y, color)
+    def render(self, surface: pygame.Surface) -> List[pygame.Rect] | None:
+        """Render the LED grid to a pygame surface.
+
+        LEDs are drawn onto a cached panel that is then blitted to the
+        surface; between frames only the LEDs whose color changed are
+        redrawn. The whole panel is redrawn when the layout or style changes.
+        When LEDs are packed so tightly that their glows could overlap, they
+        are all drawn straight onto the surface instead.
+
+        Returns:
+            The window areas of the LEDs that were redrawn, for
+            pygame.display.update(), or None if the whole grid was redrawn.
+        """
+        pitch = self.led_size + self.led_spacing
+        render_led = self._render_circular_led if self.circular_mode else self._render_square_led
+
+        if not self._leds_isolated():
+            # Redrawing one LED would clip its neighbours' glows, so there is
+            # nothing to cache; the panel is rebuilt once LEDs are apart again.
+            self._panel_layout = None
+            for y, row in enumerate(self.pixels.tolist()):
+                for x, color in enumerate(row):
+                    render_led(surface, self.offset_x + x * pitch, self.offset_y + y * pitch, tuple(color))
+            return None
+
+        layout = (
+            surface.get_size(), self.offset_x, self.offset_y,
+            self.led_size, self.led_spacing, self.led_gap, self.circular_mode,
+        )
+        if self._panel is None or self._panel.get_size() != surface.get_size():
+            self._panel = pygame.Surface(surface.get_size(), 0, surface)
+            self._panel_layout = None
+        if layout != self._panel_layout:
+            self._panel.fill((0, 0, 0))
+            self._panel_layout = layout
+            changed = np.ones((self.grid_size, self.grid_size), dtype=bool)
+            dirty = None
+        else:
+            changed = (self.pixels != self._panel_pixels).any(axis=2)
+            dirty = []
+
+        panel = self._panel
+        for y, x in zip(*np.nonzero(changed)):
+            led_x = self.offset_x + x * pitch
+            led_y = self.offset_y + y * pitch
+            footprint = self._led_footprint(led_x, led_y)
+            panel.fill((0, 0, 0), footprint)
+            render_led(panel, led_x, led_y, tuple(self.pixels[y, x].tolist()))
+            if dirty is not None:
+                dirty.append(footprint)
+        self._panel_pixels = self.pixels.copy()
+
+        surface.blit(panel, (0, 0))
+        return dirty
+
+    def _led_footprint(self, x: int, y: int) -> pygame.Rect:
+        """Window area an LED at (x, y) can draw into, glow included"""
+        if not self.circular_mode:
+            return pygame.Rect(x, y, self.led_size, self.led_size)
+        reach = max(0, (self.led_size - self.led_gap * 2) // 2 + 2) + 1
+        return pygame.Rect(
+            x + self.led_size // 2 - reach, y + self.led_size // 2 - reach, 2 * reach + 1, 2 * reach + 1
+        )
+
+    def _leds_isolated(self) -> bool:
+        """True if no two LEDs' footprints overlap, so each can be redrawn alone"""
+        return self._led_footprint(0, 0).width <= self.led_size + self.led_spacing
     
     def _render_circular_led(self, surface: pygame.Surface, x: int, y: int, color: Tuple[int, int, int]):
         """Render a single circular LED with glow effect"""
@@ -201,71 +353,64 @@ class LEDGrid:
             scale: Pixel scale factor.
             spacing: Extra spacing between characters (in *unscaled* pixels).
         """
-        font_3x5: Dict[str, List[List[int]]] = {
-            '0': [[1,1,1],[1,0,1],[1,0,1],[1,0,1],[1,1,1]],
-            '1': [[0,1,0],[1,1,0],[0,1,0],[0,1,0],[1,1,1]],
-            '2': [[1,1,1],[0,0,1],[1,1,1],[1,0,0],[1,1,1]],
-            '3': [[1,1,1],[0,0,1],[1,1,1],[0,0,1],[1,1,1]],
-            '4': [[1,0,1],[1,0,1],[1,1,1],[0,0,1],[0,0,1]],
-            '5': [[1,1,1],[1,0,0],[1,1,1],[0,0,1],[1,1,1]],
-            '6': [[1,1,1],[1,0,0],[1,1,1],[1,0,1],[1,1,1]],
-            '7': [[1,1,1],[0,0,1],[0,0,1],[0,0,1],[0,0,1]],
-            '8': [[1,1,1],[1,0,1],[1,1,1],[1,0,1],[1,1,1]],
-            '9': [[1,1,1],[1,0,1],[1,1,1],[0,0,1],[1,1,1]],
-            'A': [[0,1,0],[1,0,1],[1,1,1],[1,0,1],[1,0,1]],
-            'B': [[1,1,0],[1,0,1],[1,1,0],[1,0,1],[1,1,0]],
-            'C': [[1,1,1],[1,0,0],[1,0,0],[1,0,0],[1,1,1]],
-            'D': [[1,1,0],[1,0,1],[1,0,1],[1,0,1],[1,1,0]],
-            'E': [[1,1,1],[1,0,0],[1,1,1],[1,0,0],[1,1,1]],
-            'F': [[1,1,1],[1,0,0],[1,1,1],[1,0,0],[1,0,0]],
-            'G': [[1,1,1],[1,0,0],[1,0,1],[1,0,1],[1,1,1]],
-            'H': [[1,0,1],[1,0,1],[1,1,1],[1,0,1],[1,0,1]],
-            'I': [[1,1,1],[0,1,0],[0,1,0],[0,1,0],[1,1,1]],
-            'J': [[0,0,1],[0,0,1],[0,0,1],[1,0,1],[0,1,0]],
-            'K': [[1,0,1],[1,1,0],[1,0,0],[1,1,0],[1,0,1]],
-            'L': [[1,0,0],[1,0,0],[1,0,0],[1,0,0],[1,1,1]],
-            'M': [[1,0,1],[1,1,1],[1,1,1],[1,0,1],[1,0,1]],
-            'N': [[1,0,1],[1,1,1],[1,1,1],[1,0,1],[1,0,1]],
-            'O': [[1,1,1],[1,0,1],[1,0,1],[1,0,1],[1,1,1]],
-            'P': [[1,1,1],[1,0,1],[1,1,1],[1,0,0],[1,0,0]],
-            'Q': [[1,1,1],[1,0,1],[1,0,1],[1,1,1],[0,0,1]],
-            'R': [[1,1,1],[1,0,1],[1,1,1],[1,1,0],[1,0,1]],
-            'S': [[1,1,1],[1,0,0],[1,1,1],[0,0,1],[1,1,1]],
-            'T': [[1,1,1],[0,1,0],[0,1,0],[0,1,0],[0,1,0]],
-            'U': [[1,0,1],[1,0,1],[1,0,1],[1,0,1],[1,1,1]],
-            'V': [[1,0,1],[1,0,1],[1,0,1],[1,0,1],[0,1,0]],
-            'W': [[1,0,1],[1,0,1],[1,1,1],[1,1,1],[1,0,1]],
-            'X': [[1,0,1],[1,0,1],[0,1,0],[1,0,1],[1,0,1]],
-            'Y': [[1,0,1],[1,0,1],[0,1,0],[0,1,0],[0,1,0]],
-            'Z': [[1,1,1],[0,0,1],[0,1,0],[1,0,0],[1,1,1]],
-            ' ': [[0,0,0],[0,0,0],[0,0,0],[0,0,0],[0,0,0]],
-            '-': [[0,0,0],[0,0,0],[1,1,1],[0,0,0],[0,0,0]],
-        }
+        ys, xs = self.text_offsets(text, scale, spacing)
+        if xs.size:
+            self.set_pixels(xs + x, ys + y, self._coerce_color(color))
+
+    def text_offsets(self, text: str, scale: int = 1, spacing: int = 1):
+        """Lit-pixel (dy, dx) offsets of text as render_text() would draw it at (0, 0).
+
+        Callers drawing the same string every frame can keep the result and
+        pass it to set_pixels(); it only changes with the font overrides.
+        """
+        cursor_x = 0
+        xs, ys = [], []
+        for char in text.upper():
+            glyph = self._glyph_offsets(char, scale)
+            if glyph is not None:
+                gy, gx = glyph
+                xs.append(gx + cursor_x)
+                ys.append(gy)
+                cursor_x += (3 * scale) + (max(0, int(spacing)) * scale)  # Character width + spacing
+        if not xs:
+            return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+        return np.concatenate(ys), np.concatenate(xs)
+
+    def _glyph_offsets(self, char: str, scale: int):
+        """Lit-pixel (dy, dx) offsets of a glyph at the given scale, or None if unknown.
+
+        Offsets are cached per (char, scale) and dropped when the overrides change.
+        """
+        key = (char, scale)
+        if key in self._glyph_cache:
+            return self._glyph_cache[key]
 
         # Apply optional user overrides loaded at runtime.
-        # Overrides should follow the same 3x5 matrix format.
+        # Overrides use the same 3x5 matrix format, or a 15-bit mask (bit y*3 + x).
+        pattern = _FONT_3X5.get(char)
         try:
-            font_3x5.update(self._font_overrides)
+            if char in self._font_overrides:
+                pattern = self._font_overrides[char]
         except Exception:
             pass
-        
-        cursor_x = x
-        for char in text.upper():
-            if char in font_3x5:
-                pattern = font_3x5[char]
-                for dy in range(5):
-                    for dx in range(3):
-                        if pattern[dy][dx]:
-                            for sy in range(scale):
-                                for sx in range(scale):
-                                    self.set_pixel(cursor_x + dx * scale + sx, y + dy * scale + sy, color)
-                cursor_x += (3 * scale) + (max(0, int(spacing)) * scale)  # Character width + spacing
 
-    def set_font_overrides(self, overrides: Dict[str, List[List[int]]] | None) -> None:
-        """Set per-character 3x5 font overrides used by render_text()."""
+        glyph = None
+        if pattern is not None:
+            if isinstance(pattern, int):
+                mask = np.array([[bool(pattern >> (dy * 3 + dx) & 1) for dx in range(3)] for dy in range(5)])
+            else:
+                mask = np.array([[bool(pattern[dy][dx]) for dx in range(3)] for dy in range(5)])
+            mask = mask.repeat(max(0, scale), axis=0).repeat(max(0, scale), axis=1)
+            glyph = np.nonzero(mask)
+        self._glyph_cache[key] = glyph
+        return glyph
+
+    def set_font_overrides(self, overrides: Dict[str, List[List[int]] | int] | None) -> None:
+        """Set per-character 3x5 font overrides (matrices or bitmasks) used by render_text()."""
         self._font_overrides = overrides or {}
+        self._glyph_cache = {}
 
-    def get_font_overrides(self) -> Dict[str, List[List[int]]]:
+    def get_font_overrides(self) -> Dict[str, List[List[int]] | int]:
         return getattr(self, "_font_overrides", {})
     
     def render_number(self, number: int, x: int, y: int, color: Tuple[int, int, int], scale: int = 1):
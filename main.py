@@ -74,6 +74,8 @@ class LEDGameConsole:
 
         # Bottom help overlay (pygame text). Hide by default during gameplay.
         self.show_help_overlay = True
+        # What the help overlay showed on the last presented frame
+        self._shown_help = None
 
         # Editor resume support
         self._resume_state = None
@@ -309,14 +311,20 @@ class LEDGameConsole:
                 self.current_screen.render()
             
             # Render LED grid
-            self.grid.render(self.screen)
+            dirty = self.grid.render(self.screen)
             
             # Display help text
             if self.show_help_overlay:
                 self._render_help_text()
             
-            # Update display
-            pygame.display.flip()
+            # Update display: push only the LEDs that changed, unless the whole
+            # panel was redrawn or the help overlay may read differently
+            help_key = (self.show_help_overlay, self.manager.state, type(self.current_screen))
+            if dirty is None or help_key != self._shown_help:
+                self._shown_help = help_key
+                pygame.display.flip()
+            elif dirty:
+                pygame.display.update(dirty)
         
         pygame.quit()
         sys.exit()
@@ -33,6 +33,16 @@ class TestAsphaltRace(unittest.TestCase):
         self.assertLessEqual(w_horizon, w_bottom)
         self.assertGreaterEqual(w_horizon, 2)
 
+    def test_road_luts_match_row_helpers(self):
+        g = _StubGrid()
+        game = AsphaltRace(g)
+        game.curve = 3.7
+
+        center, hw = game._road_luts()
+        for y in range(g.grid_size):
+            self.assertEqual(int(center[y]), game._road_center_at(y))
+            self.assertEqual(int(hw[y]), game._road_half_width(y))
+
     def test_collision_detects_overlap_near_player(self):
         g = _StubGrid()
         game = AsphaltRace(g)
@@ -41,7 +51,7 @@ class TestAsphaltRace(unittest.TestCase):
         # Place a traffic car overlapping the player's position.
         # Compute traffic offset relative to road center at that y.
         car_x_offset = float(px - game._road_center_at(py))
-        game.traffic = [{"x": car_x_offset, "y": float(py), "passed": False}]
+        game._add_traffic(car_x_offset, float(py))
 
         self.assertTrue(game._check_collision())
 
@@ -0,0 +1,33 @@
+import colorsys
+import unittest
+
+from games.base_game import blend_colors, draw_circle_pixels, hsv_to_rgb, hsv_to_rgb_array
+from led_grid import LEDGrid
+
+
+class TestBaseGameColors(unittest.TestCase):
+    def test_hsv_to_rgb_matches_colorsys(self):
+        for h, s, v in ((0, 1.0, 1.0), (120, 1.0, 1.0), (359, 1.0, 1.0), (37.5, 1.0, 1.0), (200, 0.4, 0.8)):
+            r, g, b = colorsys.hsv_to_rgb(h / 360.0, s, v)
+            self.assertEqual(hsv_to_rgb(h, s, v), (int(r * 255), int(g * 255), int(b * 255)))
+
+    def test_hsv_to_rgb_array_matches_scalar(self):
+        hues = [0, 37.5, 59.99, 120, 181.25, 240, 300.5, 359.9]
+        for s, v in ((1.0, 1.0), (0.5, 0.3), (0.0, 0.7)):
+            expected = [hsv_to_rgb(h, s, v) for h in hues]
+            self.assertEqual([tuple(c) for c in hsv_to_rgb_array(hues, s, v).tolist()], expected)
+
+    def test_blend_colors_accepts_any_sequence(self):
+        self.assertEqual(blend_colors([0, 100, 200], (200, 100, 0), 0.25), (50, 100, 150))
+
+    def test_draw_circle_pixels_fills_disc(self):
+        grid = LEDGrid(100, 100)
+        draw_circle_pixels(grid, 5, 5, 2, (255, 0, 0))
+
+        self.assertEqual(grid.get_pixel(5, 3), (255, 0, 0))
+        self.assertEqual(grid.get_pixel(6, 6), (255, 0, 0))
+        self.assertEqual(grid.get_pixel(7, 7), (0, 0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
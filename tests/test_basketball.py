@@ -2,6 +2,7 @@ import unittest
 
 from games import sound
 from games.basketball import Basketball
+from led_grid import LEDGrid
 
 
 class _StubGrid:
@@ -30,17 +31,39 @@ class TestBasketball(unittest.TestCase):
         game.game_started = True
 
         # shooter near right hoop
-        game.team1[0]["x"] = 14.0
-        game.team1[0]["y"] = float(game.right_hoop_y)
+        game.px[0] = 14.0
+        game.py[0] = float(game.right_hoop_y)
         p_close = game._shot_probability(0, game.right_hoop_x, game.right_hoop_y)
 
         # shooter far from hoop
-        game.team1[0]["x"] = 3.0
-        game.team1[0]["y"] = 3.0
+        game.px[0] = 3.0
+        game.py[0] = 3.0
         p_far = game._shot_probability(0, game.right_hoop_x, game.right_hoop_y)
 
         self.assertGreater(p_close, p_far)
 
+    def test_nearby_only_returns_players_in_neighbouring_cells(self):
+        g = _StubGrid()
+        game = Basketball(g)
+
+        game.px[:] = (5.0, 6.0, 9.0, 17.0)
+        game.py[:] = (5.0, 5.0, 7.0, 17.0)
+        game._rebuild_cells()
+
+        self.assertEqual(sorted(game._nearby(0)), [1, 2])
+        self.assertEqual(list(game._nearby(3)), [])
+
+    def test_game_over_frame_is_restored_over_a_changed_grid(self):
+        grid = LEDGrid(100, 100)
+        game = Basketball(grid)
+        game.winner = 1
+        game._render_game_over()
+        drawn = grid.pixels.copy()
+
+        grid.clear((9, 9, 9))
+        game._render_game_over()
+        self.assertTrue((grid.pixels == drawn).all())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from games import sound
 from games.flappy import Flappy
 
@@ -37,18 +39,37 @@ class TestFlappy(unittest.TestCase):
         game = Flappy(g)
 
         # Force a single pipe just behind the bird so update() counts it as passed.
-        pipe = {"x": float(game.bird_x) - 0.1, "gap": 9}
-        game.pipes = [pipe]
-        game._passed = set()
+        game.pipe_x = np.array([float(game.bird_x) - 0.1])
+        game.pipe_gap = np.array([9])
+        game.pipe_passed = np.array([False])
 
         s0 = game.score
         game.update(0.0)
         self.assertEqual(game.score, s0 + 1)
 
-        # Calling update again should NOT increment again (pipe already in _passed).
+        # Calling update again should NOT increment again (pipe already marked passed).
         game.update(0.0)
         self.assertEqual(game.score, s0 + 1)
 
+    def test_respawned_pipe_scores_again(self):
+        g = _StubGrid()
+        game = Flappy(g)
+
+        game.pipe_x = np.array([float(game.bird_x) - 0.1])
+        game.pipe_gap = np.array([9])
+        game.pipe_passed = np.array([False])
+        game.update(0.0)
+        self.assertEqual(game.score, 1)
+
+        # Scroll it off-screen so it is recycled, then bring the new pipe past the bird.
+        game.pipe_x[0] = -3.0
+        game.update(0.0)
+        self.assertEqual(len(game.pipe_passed), len(game.pipe_x))
+        game.pipe_x[0] = float(game.bird_x) - 0.1
+        game.pipe_gap[0] = 9
+        game.update(0.0)
+        self.assertEqual(game.score, 2)
+
     def test_pipe_collision_sets_game_over(self):
         g = _StubGrid()
         game = Flappy(g)
@@ -58,7 +79,9 @@ class TestFlappy(unittest.TestCase):
         game.bird_vy = 0.0
 
         # Create a pipe aligned with bird_x and with a gap far away.
-        game.pipes = [{"x": float(game.bird_x), "gap": 15}]
+        game.pipe_x = np.array([float(game.bird_x)])
+        game.pipe_gap = np.array([15])
+        game.pipe_passed = np.array([False])
         game.update(0.0)
 
         self.assertTrue(game.game_over)
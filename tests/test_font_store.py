@@ -1,8 +1,11 @@
+import json
+import os
 import tempfile
 import unittest
+from unittest import mock
 
 
-from games.font_store import FontStore
+from games.font_store import FontStore, glyph_bit
 
 
 class TestFontStore(unittest.TestCase):
@@ -17,9 +20,36 @@ class TestFontStore(unittest.TestCase):
             store2.load()
             g = store2.get_glyph("a")
             self.assertIsNotNone(g)
-            self.assertEqual(len(g), 5)
-            self.assertEqual(len(g[0]), 3)
-            self.assertEqual(g[0], [1, 0, 1])
+            # Top row [1, 0, 1] -> bits 0 and 2; middle of row 1 -> bit 4.
+            self.assertEqual(g & 0b111, 0b101)
+            self.assertTrue(g & glyph_bit(1, 1))
+            self.assertFalse(g & glyph_bit(0, 1))
+
+    def test_save_skips_unchanged_overrides(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = f"{td}/font_overrides.json"
+            store = FontStore(path=path)
+            store.set_glyph("A", glyph_bit(1, 2))
+            store.save()
+            self.assertFalse(os.path.exists(path + ".tmp"))
+
+            with mock.patch("games.font_store.os.replace") as replace:
+                store.save()
+                replace.assert_not_called()
+
+                store.set_glyph("A", glyph_bit(0, 0))
+                store.save()
+                replace.assert_called_once()
+
+    def test_load_accepts_legacy_matrix_glyphs(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = f"{td}/font_overrides.json"
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"b": [[0, 1, 0], [0, 0, 0], [0, 0, 0], [0, 0, 0], [0, 0, 1]]}, f)
+
+            store = FontStore(path=path)
+            store.load()
+            self.assertEqual(store.get_glyph("B"), glyph_bit(1, 0) | glyph_bit(2, 4))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,27 @@
+import unittest
+
+import numpy as np
+
+from led_grid import LEDGrid
+
+
+class TestLEDGridBlit(unittest.TestCase):
+    def test_blit_copies_and_clips_to_grid(self):
+        grid = LEDGrid(100, 100)
+        fb = np.zeros((2, 3, 3), dtype=np.uint8)
+        fb[:, :] = (1, 2, 3)
+
+        # Partially off the left/top edge: only the bottom-right 1x2 block lands.
+        grid.blit(fb, -1, -1)
+        self.assertEqual(grid.get_pixel(0, 0), (1, 2, 3))
+        self.assertEqual(grid.get_pixel(1, 0), (1, 2, 3))
+        self.assertEqual(grid.get_pixel(2, 0), (0, 0, 0))
+        self.assertEqual(grid.get_pixel(0, 1), (0, 0, 0))
+
+        # Fully off-grid is a no-op.
+        grid.blit(fb, grid.grid_size, 0)
+        self.assertEqual(grid.get_pixel(grid.grid_size - 1, 0), (0, 0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,24 @@
+import unittest
+
+from led_grid import LEDGrid
+
+
+class TestLEDGridFillRect(unittest.TestCase):
+    def test_fill_rect_clips_to_grid(self):
+        grid = LEDGrid(100, 100)
+
+        # Hangs off the bottom-right corner: only the in-grid 2x2 block is filled.
+        n = grid.grid_size
+        grid.fill_rect(n - 2, n - 2, 5, 5, (4, 5, 6))
+        self.assertEqual(grid.get_pixel(n - 1, n - 1), (4, 5, 6))
+        self.assertEqual(grid.get_pixel(n - 2, n - 2), (4, 5, 6))
+        self.assertEqual(grid.get_pixel(n - 3, n - 1), (0, 0, 0))
+
+        # Non-positive sizes draw nothing.
+        grid.fill_rect(0, 0, 0, 3, (4, 5, 6))
+        grid.fill_rect(0, 0, 3, -1, (4, 5, 6))
+        self.assertEqual(grid.get_pixel(0, 0), (0, 0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -28,6 +28,13 @@ class TestLEDGridFontOverrides(unittest.TestCase):
         self.assertEqual(grid.get_pixel(0, 0), (0, 0, 0))
         self.assertEqual(grid.get_pixel(2, 0), (0, 0, 0))
 
+    def test_text_offsets_follow_overrides(self):
+        grid = LEDGrid(100, 100)
+        grid.set_font_overrides({"A": 0b010})  # top-middle pixel only
+
+        ys, xs = grid.text_offsets("AA")
+        self.assertEqual(list(zip(xs.tolist(), ys.tolist())), [(1, 0), (5, 0)])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+import numpy as np
+import pygame
+
+from led_grid import LEDGrid
+
+
+def _rendered(grid):
+    surface = pygame.Surface((grid.window_width, grid.window_height))
+    grid.render(surface)
+    return pygame.surfarray.array3d(surface)
+
+
+class TestLEDGridRender(unittest.TestCase):
+    def test_redrawing_changed_leds_matches_full_render(self):
+        for circular in (True, False):
+            grid = LEDGrid(400, 400)
+            grid.circular_mode = circular
+            grid.led_size, grid.led_spacing = 16, 4
+            grid.update_grid_offset()
+            grid.fill_rect(2, 2, 5, 5, (255, 120, 0))
+            _rendered(grid)
+
+            grid.set_pixel(3, 3, (0, 0, 0))
+            grid.set_pixel(10, 10, (40, 200, 255))
+
+            fresh = LEDGrid(400, 400)
+            fresh.circular_mode = circular
+            fresh.led_size, fresh.led_spacing = 16, 4
+            fresh.update_grid_offset()
+            fresh.pixels[:] = grid.pixels
+
+            self.assertTrue(np.array_equal(_rendered(grid), _rendered(fresh)))
+
+    def test_render_reports_redrawn_leds(self):
+        grid = LEDGrid(400, 400)
+        surface = pygame.Surface((400, 400))
+        self.assertIsNone(grid.render(surface))
+        self.assertEqual(grid.render(surface), [])
+
+        grid.set_pixel(4, 7, (255, 0, 0))
+        pitch = grid.led_size + grid.led_spacing
+        dirty = grid.render(surface)
+        self.assertEqual(dirty, [grid._led_footprint(grid.offset_x + 4 * pitch, grid.offset_y + 7 * pitch)])
+
+        grid.toggle_style()
+        self.assertIsNone(grid.render(surface))
+
+    def test_tightly_packed_leds_draw_straight_to_surface(self):
+        grid = LEDGrid(400, 400)
+        grid.led_size, grid.led_spacing = 16, 0
+        grid.update_grid_offset()
+        grid.fill_rect(2, 2, 5, 5, (255, 120, 0))
+
+        surface = pygame.Surface((400, 400))
+        self.assertIsNone(grid.render(surface))
+        self.assertIsNone(grid.render(surface))
+        self.assertIsNone(grid._panel)
+
+        expected = pygame.Surface((400, 400))
+        pitch = grid.led_size + grid.led_spacing
+        for y in range(grid.grid_size):
+            for x in range(grid.grid_size):
+                grid._render_circular_led(
+                    expected, grid.offset_x + x * pitch, grid.offset_y + y * pitch, grid.get_pixel(x, y)
+                )
+        self.assertTrue(np.array_equal(pygame.surfarray.array3d(surface), pygame.surfarray.array3d(expected)))
+
+
+if __name__ == "__main__":
+    unittest.main()
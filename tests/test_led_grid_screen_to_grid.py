@@ -0,0 +1,28 @@
+import unittest
+
+from led_grid import LEDGrid
+
+
+class TestLEDGridScreenToGrid(unittest.TestCase):
+    def test_maps_window_pixels_to_cells(self):
+        grid = LEDGrid(1000, 1000)
+        pitch = grid.led_size + grid.led_spacing
+        ox, oy = grid.offset_x, grid.offset_y
+
+        self.assertEqual(grid.screen_to_grid(ox, oy), (0, 0))
+        self.assertEqual(grid.screen_to_grid(ox + 2 * pitch, oy + pitch - 1), (2, 0))
+        self.assertEqual(grid.screen_to_grid(ox + 18 * pitch + 5, oy + 18 * pitch), (18, 18))
+
+        # Margins around the grid are not cells.
+        self.assertIsNone(grid.screen_to_grid(ox - 1, oy))
+        self.assertIsNone(grid.screen_to_grid(ox, oy + 19 * pitch))
+
+    def test_follows_runtime_layout_changes(self):
+        grid = LEDGrid(1000, 1000)
+        grid.adjust_led_size(-10)
+        pitch = grid.led_size + grid.led_spacing
+        self.assertEqual(grid.screen_to_grid(grid.offset_x + 3 * pitch, grid.offset_y), (3, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
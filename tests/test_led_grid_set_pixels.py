@@ -0,0 +1,28 @@
+import unittest
+
+from led_grid import LEDGrid
+
+
+class TestLEDGridSetPixels(unittest.TestCase):
+    def test_set_pixels_skips_out_of_range_and_last_write_wins(self):
+        grid = LEDGrid(100, 100)
+        grid.set_pixels(
+            [0, -1, 1, 0, 19],
+            [0, 0, 2, 0, 5],
+            [(1, 1, 1), (2, 2, 2), (3, 3, 3), (4, 4, 4), (5, 5, 5)],
+        )
+
+        self.assertEqual(grid.get_pixel(0, 0), (4, 4, 4))
+        self.assertEqual(grid.get_pixel(1, 2), (3, 3, 3))
+
+    def test_set_pixels_accepts_single_color(self):
+        grid = LEDGrid(100, 100)
+        grid.set_pixels([2, 3], [4, 4], (9, 8, 7))
+
+        self.assertEqual(grid.get_pixel(2, 4), (9, 8, 7))
+        self.assertEqual(grid.get_pixel(3, 4), (9, 8, 7))
+        self.assertEqual(grid.get_pixel(4, 4), (0, 0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 
 from games.pet_game import PetGame
+from led_grid import LEDGrid
 
 
 class _StubGrid:
@@ -32,6 +33,15 @@ class TestPetGame(unittest.TestCase):
         self.assertLess(pet.happiness, hap0)
         self.assertLess(pet.energy, e0)
 
+    def test_unselected_pets_decay_too(self):
+        game = PetGame(_StubGrid())
+        other = game.pets[(game.selected_index + 1) % len(game.pets)]
+        h0 = other.hunger
+
+        game.update(1.0)
+
+        self.assertLess(other.hunger, h0)
+
     def test_stats_clamp_after_actions(self):
         g = _StubGrid()
         game = PetGame(g)
@@ -46,6 +56,19 @@ class TestPetGame(unittest.TestCase):
             self.assertGreaterEqual(v, 0.0)
             self.assertLessEqual(v, 10.0)
 
+    def test_render_redraws_when_grid_was_overwritten(self):
+        grid = LEDGrid(100, 100)
+        game = PetGame(grid)
+        game.render()
+        frame = grid.pixels.copy()
+
+        game.render()
+        self.assertTrue((grid.pixels == frame).all())
+
+        grid.clear((255, 255, 255))
+        game.render()
+        self.assertTrue((grid.pixels == frame).all())
+
 
 if __name__ == "__main__":
     unittest.main()
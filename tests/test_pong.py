@@ -0,0 +1,43 @@
+import unittest
+
+from games.pong import _step_ball
+
+
+class TestPongBall(unittest.TestCase):
+    def test_ball_bounces_off_bottom_wall(self):
+        x, y, vx, vy, trail_point, hit_wall, hit_paddle = _step_ball(
+            9.0, 17.9, 0.0, 6.0, 0.1, 8, 8, [-2.0, -1.0, 0.0, 1.0], 6.4, 19
+        )
+
+        self.assertTrue(hit_wall)
+        self.assertFalse(hit_paddle)
+        self.assertEqual(y, 18)
+        self.assertLess(vy, 0)
+        self.assertEqual(trail_point, (9, 18))
+
+    def test_ball_bounces_off_left_paddle_with_spin(self):
+        x, y, vx, vy, trail_point, hit_wall, hit_paddle = _step_ball(
+            2.5, 11.5, -8.0, 0.0, 0.1, 8, 8, [-2.0, -1.0, 0.0, 1.0], 6.4, 19
+        )
+
+        self.assertTrue(hit_paddle)
+        self.assertFalse(hit_wall)
+        self.assertEqual(x, 2)
+        self.assertGreater(vx, 0)
+        # Hit below the paddle's middle, so it picks up downward spin
+        self.assertAlmostEqual(vy, 1.0)
+
+    def test_paddle_hitbox_follows_its_fractional_position(self):
+        # A paddle at y=7.5 with height 4 covers 7.5 <= y < 11.5
+        spin = [-2.0, -1.0, 0.0, 1.0]
+        hit_above = _step_ball(2.5, 7.5, -8.0, 0.0, 0.1, 7.5, 8, spin, 6.4, 19)
+        hit_bottom = _step_ball(2.5, 11.5, -8.0, 0.0, 0.1, 7.5, 8, spin, 6.4, 19)
+
+        self.assertFalse(hit_above[6])
+        self.assertTrue(hit_bottom[6])
+        # Row 11 is 3.5 rows below the paddle's top: the last row's spin
+        self.assertAlmostEqual(hit_bottom[3], 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -59,6 +59,42 @@ class TestSnake(unittest.TestCase):
             game._spawn_food()
             self.assertNotIn(game.food, game.snake)
 
+    def test_free_cells_track_snake_while_moving_and_growing(self):
+        g = _StubGrid()
+        game = Snake(g)
+        everything = {(x, y) for y in range(19) for x in range(19)}
+
+        for i in range(40):
+            if i % 5 == 0:
+                # Feed the snake the cell right in front of it.
+                hx, hy = game.snake[-1]
+                game.food = ((hx + 1) % 19, hy)
+            game._step()
+            self.assertFalse(game.game_over)
+            self.assertEqual(set(game._free_list), everything - set(game.snake))
+            self.assertEqual(len(game._free_list), len(everything) - len(game.snake))
+            for cell, i in game._free_pos.items():
+                self.assertEqual(game._free_list[i], cell)
+            occupied = {(n % 19, n // 19) for n, v in enumerate(game._occ) if v}
+            self.assertEqual(occupied, set(game.snake))
+            self.assertNotIn(game.food, game.snake)
+
+    def test_running_into_body_ends_game(self):
+        g = _StubGrid()
+        game = Snake(g)
+
+        # Grow to five cells, then turn down, left and up into the body.
+        for _ in range(2):
+            hx, hy = game.snake[-1]
+            game.food = (hx + 1, hy)
+            game._step()
+        game.food = (0, 0)
+        for d in ((0, 1), (-1, 0), (0, -1)):
+            game.next_direction = d
+            game._step()
+
+        self.assertTrue(game.game_over)
+
     def test_wraps_at_edges_instead_of_game_over(self):
         g = _StubGrid()
         game = Snake(g)
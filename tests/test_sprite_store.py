@@ -1,7 +1,9 @@
 import tempfile
 import unittest
+from unittest import mock
 
-from games.sprite_store import SpriteStore
+from games.sprite_store import Sprite, SpriteStore, draw_sprite
+from led_grid import LEDGrid
 
 
 class TestSpriteStore(unittest.TestCase):
@@ -21,6 +23,75 @@ class TestSpriteStore(unittest.TestCase):
             self.assertEqual(s2.h, 3)
             self.assertEqual(s2.get(1, 1), (10, 20, 30))
 
+    def test_failed_save_keeps_previous_file(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = f"{td}/sprites.json"
+            store = SpriteStore(path=path)
+            s = store.get_or_create("test", w=3, h=3)
+            s.set(1, 1, (10, 20, 30))
+            store.save()
+            with open(path, encoding="utf-8") as f:
+                before = f.read()
+
+            s.set(0, 0, (1, 2, 3))
+            with mock.patch("games.sprite_store.json.dump", side_effect=OSError("disk full")):
+                with self.assertRaises(OSError):
+                    store.save()
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), before)
+
+    def test_out_of_range_colors_are_clamped(self):
+        sprite = Sprite(w=2, h=2)
+        sprite.set(0, 0, (300, -5, 128))
+        self.assertEqual(sprite.get(0, 0), (255, 0, 128))
+
+        with tempfile.TemporaryDirectory() as td:
+            path = f"{td}/sprites.json"
+            with open(path, "w", encoding="utf-8") as f:
+                f.write('{"legacy": {"w": 2, "h": 1, "pixels": {"1,0": [999, 10, 20]}}}')
+            store = SpriteStore(path=path)
+            store.load()
+            self.assertEqual(store.get("legacy").get(1, 0), (255, 10, 20))
+
+    def test_save_skips_unchanged_sprites(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = f"{td}/sprites.json"
+            store = SpriteStore(path=path)
+            s = store.get_or_create("test", w=3, h=3)
+            s.set(1, 1, (10, 20, 30))
+            store.save()
+
+            with mock.patch("games.sprite_store.json.dump") as dump:
+                store.save()
+                dump.assert_not_called()
+
+                # Direct array writes (as the editors do) count as changes too.
+                s.data[0, 0] = (1, 2, 3, 255)
+                store.save()
+                dump.assert_called_once()
+                raw = dump.call_args[0][0]
+                self.assertEqual(raw["test"]["pixels"], {"0,0": [1, 2, 3], "1,1": [10, 20, 30]})
+
+    def test_draw_sprite_skips_transparent_and_clips(self):
+        grid = LEDGrid(100, 100)
+        grid.clear((1, 1, 1))
+        sprite = Sprite(w=3, h=2)
+        sprite.set(0, 0, (0, 0, 0))
+        sprite.set(2, 1, (7, 8, 9))
+        sprite.set(1, 1, (5, 5, 5))
+        sprite.set(1, 1, None)
+        self.assertIsNone(sprite.get(1, 1))
+
+        n = grid.grid_size
+        draw_sprite(grid, sprite, n - 3, n - 2)
+        self.assertEqual(grid.get_pixel(n - 3, n - 2), (0, 0, 0))
+        self.assertEqual(grid.get_pixel(n - 1, n - 1), (7, 8, 9))
+        self.assertEqual(grid.get_pixel(n - 2, n - 1), (1, 1, 1))
+
+        # Hanging off the top-left corner only draws the in-grid part.
+        draw_sprite(grid, sprite, -2, -1)
+        self.assertEqual(grid.get_pixel(0, 0), (7, 8, 9))
+
 
 if __name__ == "__main__":
     unittest.main()